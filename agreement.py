@@ -0,0 +1,123 @@
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, Dict, List, Mapping, Sequence
+
+from constants import AGREEMENT_TEST_POINTS, AGREEMENT_TEST_SEED
+from features import LazyFeatures
+from utils import RandomStream, dot, generate_data
+
+
+@lru_cache(maxsize=None)
+def shared_test_sample(
+    transform: Callable[[List[List[float]]], LazyFeatures],
+    n_points: int = AGREEMENT_TEST_POINTS,
+    seed: int = AGREEMENT_TEST_SEED,
+) -> List[List[float]]:
+    """Sorteia e transforma uma única vez a amostra de teste compartilhada.
+
+    A amostra depende só dos argumentos (não do gerador de cada execução), então é a
+    mesma em todas as execuções e em todos os processos, e fica em cache na memória.
+
+    Args:
+        transform (Callable): A transformação de características, por exemplo
+            `transform_features`.
+        n_points (int): O número de pontos de teste.
+        seed (int): A semente da amostra.
+
+    Returns:
+        List[List[float]]: Os pontos de teste transformados, um por linha.
+    """
+    X_test, _ = generate_data(n_points, rng=RandomStream(seed))
+    return transform(X_test).materialize()
+
+
+def sign_matrix(
+    features: Sequence[Sequence[float]], weights: Sequence[Sequence[float]]
+) -> List[List[int]]:
+    """Calcula sign(X w) para vários vetores de pesos, isto é, o sinal de X W^T.
+
+    Args:
+        features (Sequence[Sequence[float]]): A matriz X, um ponto por linha.
+        weights (Sequence[Sequence[float]]): Os vetores de pesos, um por linha de W.
+
+    Returns:
+        List[List[int]]: Uma linha por vetor de pesos, com o rótulo (1 ou -1) de cada
+            ponto, com o mesmo empate de `sign`.
+    """
+    return [
+        [1 if z >= 0 else -1 for z in map(dot, features, repeat(w))] for w in weights
+    ]
+
+
+class AgreementEvaluator:
+    """Mede a concordância de hipóteses ajustadas com hipóteses candidatas.
+
+    A concordância P[g(x) = h(x)] é estimada em uma amostra de teste compartilhada
+    (`shared_test_sample`). Os rótulos das candidatas são calculados uma única vez; os
+    de um lote de r vetores de pesos saem de um produto X W^T, e, como os rótulos são ±1,
+    a concordância de todos os pares sai de outro produto, S_W S_H^T:
+        P[g = h] = (m + ∑ s_g s_h) / (2m)
+    onde m é o número de pontos de teste.
+
+    Args:
+        hypotheses (Mapping[str, Sequence[float]]): Os pesos de cada candidata, por nome.
+        transform (Callable): A transformação de características dos pontos de teste.
+        n_points (int): O número de pontos de teste.
+        seed (int): A semente da amostra de teste.
+    """
+
+    def __init__(
+        self,
+        hypotheses: Mapping[str, Sequence[float]],
+        transform: Callable[[List[List[float]]], LazyFeatures],
+        n_points: int = AGREEMENT_TEST_POINTS,
+        seed: int = AGREEMENT_TEST_SEED,
+    ) -> None:
+        """Sorteia a amostra de teste e calcula os rótulos das candidatas.
+
+        Args:
+            hypotheses (Mapping[str, Sequence[float]]): Os pesos de cada candidata, por
+                nome.
+            transform (Callable): A transformação de características dos pontos de teste.
+            n_points (int): O número de pontos de teste.
+            seed (int): A semente da amostra de teste.
+        """
+        self.names = list(hypotheses)
+        self.features = shared_test_sample(transform, n_points, seed)
+        self._hypothesis_signs = sign_matrix(self.features, list(hypotheses.values()))
+
+    def agreement(
+        self, weights_batch: Sequence[Sequence[float]]
+    ) -> List[Dict[str, float]]:
+        """Calcula a concordância de cada vetor de pesos com cada candidata.
+
+        Args:
+            weights_batch (Sequence[Sequence[float]]): Os vetores de pesos ajustados.
+
+        Returns:
+            List[Dict[str, float]]: Para cada vetor, a concordância com cada candidata.
+        """
+        m = len(self.features)
+        return [
+            {
+                name: (m + dot(signs, hypothesis_signs)) / (2 * m)
+                for name, hypothesis_signs in zip(self.names, self._hypothesis_signs)
+            }
+            for signs in sign_matrix(self.features, weights_batch)
+        ]
+
+    def closest(self, weights_batch: Sequence[Sequence[float]]) -> List[str]:
+        """Encontra a candidata que mais concorda com cada vetor de pesos.
+
+        Em caso de empate, fica a primeira candidata.
+
+        Args:
+            weights_batch (Sequence[Sequence[float]]): Os vetores de pesos ajustados.
+
+        Returns:
+            List[str]: O nome da candidata mais próxima de cada vetor.
+        """
+        return [
+            max(scores, key=scores.__getitem__)
+            for scores in self.agreement(weights_batch)
+        ]
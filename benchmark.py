@@ -0,0 +1,462 @@
+import contextlib
+import gc
+import glob
+import importlib
+import io
+import json
+import os
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from constants import BENCH_REPEAT, BENCH_THRESHOLD, BENCH_WARMUP
+from experiment import is_experiment, report_experiment, run_experiment
+from linear_regression import LinearRegression
+from perceptron import Perceptron
+from utils import (
+    Color,
+    ProgressReporter,
+    RandomStream,
+    generate_data,
+    generate_data_with_noise,
+    matrix_inverse,
+    matrix_multiply,
+    print_divider,
+    transform_features,
+)
+
+Case = Tuple[str, int, Callable[[], Callable[[], Any]]]
+"""Um caso de benchmark: nome, tamanho da entrada e uma preparação (não cronometrada)
+que devolve a função a ser cronometrada."""
+
+KERNEL_SIZES: Dict[str, Tuple[int, ...]] = {
+    "matrix_multiply": (16, 64),
+    "matrix_inverse": (8, 32),
+    "Perceptron.fit": (10, 100),
+    "LinearRegression.fit": (100, 1000),
+    "generate_data": (100, 10000),
+    "transform_features": (1000, 10000),
+}
+"""Os tamanhos de entrada de cada kernel: ordem da matriz ou número de pontos."""
+
+BENCH_SEED = 0
+"""Semente dos dados de todos os casos, para que cada execução meça o mesmo trabalho."""
+
+BENCH_EXERCISE_REPEAT = 3
+"""Número de medições de cada exercício (bem mais lentos que os kernels)."""
+
+BENCH_EXERCISE_RUNS = 100
+"""Número máximo de execuções dos experimentos medidos (em vez de todas as `N_RUNS`)."""
+
+PRECISION_SIZES = (1000, 10000)
+"""Os números de pontos do relatório de precisão (float32 contra float64)."""
+
+
+def square_matrix(n: int, rng: RandomStream) -> List[List[float]]:
+    """Gera uma matriz n x n com entradas uniformes em [-1, 1].
+
+    Args:
+        n (int): A ordem da matriz.
+        rng (RandomStream): O gerador aleatório.
+
+    Returns:
+        List[List[float]]: A matriz.
+    """
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+
+
+def kernel_cases() -> Iterator[Case]:
+    """Gera os casos dos kernels, um por kernel e tamanho de `KERNEL_SIZES`.
+
+    Returns:
+        Iterator[Case]: Os casos.
+    """
+
+    def matrix_multiply_case(n: int) -> Callable[[], Any]:
+        rng = RandomStream(BENCH_SEED)
+        A, B = square_matrix(n, rng), square_matrix(n, rng)
+        return lambda: matrix_multiply(A, B)
+
+    def matrix_inverse_case(n: int) -> Callable[[], Any]:
+        A = square_matrix(n, RandomStream(BENCH_SEED))
+        return lambda: matrix_inverse(A)
+
+    def perceptron_case(n: int) -> Callable[[], Any]:
+        X, y = generate_data(n, rng=RandomStream(BENCH_SEED))
+        return lambda: Perceptron(rng=RandomStream(BENCH_SEED)).fit(X, y)
+
+    def linear_regression_case(n: int) -> Callable[[], Any]:
+        X, y = generate_data_with_noise(
+            n_points=n, noise_percentage=0.1, rng=RandomStream(BENCH_SEED)
+        )
+        X_transformed = transform_features(X)
+        return lambda: LinearRegression().fit(X_transformed, y)
+
+    def generate_data_case(n: int) -> Callable[[], Any]:
+        return lambda: generate_data(n, rng=RandomStream(BENCH_SEED))
+
+    def transform_features_case(n: int) -> Callable[[], Any]:
+        X, _ = generate_data(n, rng=RandomStream(BENCH_SEED))
+        return lambda: transform_features(X).materialize()
+
+    setups = {
+        "matrix_multiply": matrix_multiply_case,
+        "matrix_inverse": matrix_inverse_case,
+        "Perceptron.fit": perceptron_case,
+        "LinearRegression.fit": linear_regression_case,
+        "generate_data": generate_data_case,
+        "transform_features": transform_features_case,
+    }
+    for name, sizes in KERNEL_SIZES.items():
+        for size in sizes:
+            yield name, size, lambda setup=setups[name], size=size: setup(size)
+
+
+def exercise_cases() -> Iterator[Case]:
+    """Gera um caso por exercício encontrado em `listaN/exercicioM.py`.
+
+    Os experimentos rodam `BENCH_EXERCISE_RUNS` execuções (ou `N_RUNS`, se for menor)
+    com a semente `BENCH_SEED`, sem parada antecipada e sem cache, para que cada medição
+    faça o mesmo trabalho sem levar minutos. Os demais exercícios rodam `run()`. A saída
+    é descartada.
+
+    Returns:
+        Iterator[Case]: Os casos, com tamanho 0.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(root, "lista*", "exercicio*.py"))):
+        package = os.path.basename(os.path.dirname(path))
+        name = f"{package}.{os.path.splitext(os.path.basename(path))[0]}"
+
+        def setup(name: str = name) -> Callable[[], Any]:
+            module = importlib.import_module(name)
+
+            def run() -> None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if is_experiment(module):
+                        result = run_experiment(
+                            module,
+                            BENCH_SEED,
+                            n_runs=min(module.N_RUNS, BENCH_EXERCISE_RUNS),
+                            early_stop=False,
+                        )
+                        report_experiment(module, result)
+                    else:
+                        module.run()
+
+            return run
+
+        yield name, 0, setup
+
+
+def time_function(
+    function: Callable[[], Any],
+    warmup: int = BENCH_WARMUP,
+    repeat: int = BENCH_REPEAT,
+    progress: Optional[ProgressReporter] = None,
+) -> List[float]:
+    """Mede o tempo de várias chamadas de uma função.
+
+    As primeiras `warmup` chamadas não são medidas. Como no `timeit`, o coletor de lixo
+    fica desligado durante as medições, para que uma coleta não caia em uma só delas.
+
+    Args:
+        function (Callable[[], Any]): A função a ser medida.
+        warmup (int): O número de chamadas de aquecimento.
+        repeat (int): O número de chamadas medidas.
+        progress (Optional[ProgressReporter]): Recebe uma atualização por chamada
+            (fora do tempo medido).
+
+    Returns:
+        List[float]: O tempo de cada chamada medida, em segundos.
+    """
+    for _ in range(warmup):
+        function()
+        if progress is not None:
+            progress.update()
+
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+            if progress is not None:
+                progress.update()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def summarize_times(times: List[float]) -> Dict[str, float]:
+    """Resume as medições pela mediana e pelo intervalo interquartil (IQR).
+
+    Args:
+        times (List[float]): Os tempos medidos, em segundos.
+
+    Returns:
+        Dict[str, float]: A mediana, o IQR, o mínimo, o máximo e o número de medições.
+    """
+    if len(times) > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4)
+    else:
+        q1 = q3 = times[0]
+    return {
+        "median": statistics.median(times),
+        "iqr": q3 - q1,
+        "min": min(times),
+        "max": max(times),
+        "repeat": len(times),
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """Formata um tempo com a unidade mais legível.
+
+    Args:
+        seconds (float): O tempo, em segundos.
+
+    Returns:
+        str: O tempo formatado, por exemplo "12.3 ms".
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def precision_report(
+    sizes: Tuple[int, ...] = PRECISION_SIZES,
+    warmup: int = BENCH_WARMUP,
+    repeat: int = BENCH_REPEAT,
+) -> Dict[str, Dict[str, float]]:
+    """Compara o armazenamento em float32 com o em float64 na Regressão Linear.
+
+    Para cada tamanho, os mesmos dados (semente `BENCH_SEED`) são gerados e
+    transformados em (1, x1, x2, x1x2, x1^2, x2^2) com cada precisão, e o ajuste
+    (acumulação de X^T X e resolução) é medido. O relatório mostra a memória e o tempo
+    do float32 em relação ao float64, a maior diferença entre os pesos e o E_in de cada
+    precisão.
+
+    Args:
+        sizes (Tuple[int, ...]): Os números de pontos.
+        warmup (int): O número de ajustes de aquecimento.
+        repeat (int): O número de ajustes medidos.
+
+    Returns:
+        Dict[str, Dict[str, float]]: As comparações, indexadas por "nome[tamanho]".
+    """
+    report: Dict[str, Dict[str, float]] = {}
+    print_divider()
+    print(Color.text("Precisão: float32 em relação a float64", Color.CYAN))
+
+    for n in sizes:
+        # Os dois conjuntos são montados antes de medir, para que a alocação de um não
+        # caia na medição do outro.
+        data = {}
+        for dtype in ("float64", "float32"):
+            X, y = generate_data_with_noise(
+                n_points=n,
+                noise_percentage=0.1,
+                rng=RandomStream(BENCH_SEED),
+                dtype=dtype,
+            )
+            data[dtype] = X, transform_features(X).to_matrix(), y
+
+        runs: Dict[str, Dict[str, Any]] = {}
+        for dtype, (X, features, y) in data.items():
+            model = LinearRegression()
+            times = time_function(lambda: model.fit(features, y), warmup, repeat)
+            predictions = model.predict_batch(features)
+            runs[dtype] = {
+                "bytes": X.nbytes + features.nbytes,
+                "median": summarize_times(times)["median"],
+                "weights": model.weights,
+                "e_in": sum(p != t for p, t in zip(predictions, y)) / n,
+            }
+
+        reference, compact = runs["float64"], runs["float32"]
+        key = f"LinearRegression.fit[{n}]"
+        report[key] = {
+            "memory_ratio": compact["bytes"] / reference["bytes"],
+            "time_ratio": compact["median"] / reference["median"],
+            "max_weight_error": max(
+                abs(a - b) for a, b in zip(compact["weights"], reference["weights"])
+            ),
+            "e_in_float64": reference["e_in"],
+            "e_in_float32": compact["e_in"],
+        }
+        result = report[key]
+        print(
+            f"{Color.text(f'{key:<32}', Color.CYAN)} "
+            f"memória {result['memory_ratio']:.2f}x, "
+            f"tempo {result['time_ratio']:.2f}x, "
+            f"|Δw| máx. {result['max_weight_error']:.1e}, "
+            f"E_in {result['e_in_float64']:.4f} -> {result['e_in_float32']:.4f}"
+        )
+
+    return report
+
+
+def run_benchmarks(
+    name_filter: Optional[str] = None,
+    warmup: int = BENCH_WARMUP,
+    repeat: int = BENCH_REPEAT,
+) -> Dict[str, Any]:
+    """Executa os benchmarks dos kernels e dos exercícios.
+
+    Args:
+        name_filter (Optional[str]): Só executa os casos cujo nome contém esse texto.
+        warmup (int): O número de chamadas de aquecimento de cada caso.
+        repeat (int): O número de chamadas medidas de cada kernel.
+
+    Returns:
+        Dict[str, Any]: Os metadados do ambiente e, em "results", o resumo de cada caso,
+            indexado por "nome[tamanho]" (ou apenas "nome", nos exercícios).
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    cases = [(case, repeat) for case in kernel_cases()]
+    cases += [(case, BENCH_EXERCISE_REPEAT) for case in exercise_cases()]
+
+    for (name, size, setup), case_repeat in cases:
+        key = f"{name}[{size}]" if size else name
+        if name_filter and name_filter not in key:
+            continue
+        with ProgressReporter(
+            warmup + case_repeat, f"Medindo {key}", transient=True
+        ) as progress:
+            times = time_function(setup(), warmup, case_repeat, progress)
+        summary = summarize_times(times)
+        results[key] = summary
+        print(
+            f"{Color.text(f'{key:<32}', Color.CYAN)} "
+            f"{Color.text(format_seconds(summary['median']), Color.GREEN):>24} "
+            f"{Color.text('± ' + format_seconds(summary['iqr']) + ' (IQR)', Color.GRAY)}"
+        )
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def save_benchmarks(report: Dict[str, Any], path: str) -> None:
+    """Grava o resultado dos benchmarks em JSON.
+
+    Args:
+        report (Dict[str, Any]): O resultado de `run_benchmarks`.
+        path (str): O caminho do arquivo.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_benchmarks(path: str) -> Dict[str, Any]:
+    """Lê um resultado de benchmarks gravado por `save_benchmarks`.
+
+    Args:
+        path (str): O caminho do arquivo.
+
+    Returns:
+        Dict[str, Any]: O resultado dos benchmarks.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_benchmarks(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = BENCH_THRESHOLD,
+) -> List[str]:
+    """Compara as medianas com as de uma referência e aponta as regressões.
+
+    Um caso regrediu se a mediana atual passar da mediana de referência por mais de
+    `threshold` (relativo) e essa diferença for maior que o IQR da referência, para que
+    o ruído de casos muito instáveis não seja apontado como regressão.
+
+    Args:
+        baseline (Dict[str, Any]): O resultado de referência.
+        current (Dict[str, Any]): O resultado atual.
+        threshold (float): O aumento relativo tolerado, por exemplo 0.1 para 10%.
+
+    Returns:
+        List[str]: Os nomes dos casos que regrediram.
+    """
+    regressions = []
+    print_divider()
+    print(
+        Color.text(f"Comparação com a referência (limite: {threshold:.0%})", Color.CYAN)
+    )
+
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        ratio = result["median"] / reference["median"]
+        regressed = (
+            ratio > 1 + threshold
+            and result["median"] - reference["median"] > reference["iqr"]
+        )
+        if regressed:
+            regressions.append(key)
+            color, mark = Color.RED, "REGRESSÃO"
+        elif ratio < 1 - threshold:
+            color, mark = Color.GREEN, "melhoria"
+        else:
+            color, mark = Color.GRAY, ""
+        print(
+            f"{Color.text(f'{key:<32}', Color.CYAN)} "
+            f"{format_seconds(reference['median']):>10} -> "
+            f"{format_seconds(result['median']):>10} "
+            f"{Color.text(f'{ratio:6.2f}x {mark}', color)}"
+        )
+
+    return regressions
+
+
+def bench(
+    output: str,
+    baseline: Optional[str] = None,
+    threshold: float = BENCH_THRESHOLD,
+    name_filter: Optional[str] = None,
+) -> int:
+    """Executa os benchmarks, grava o resultado e compara com a referência, se dada.
+
+    O relatório de precisão (`precision_report`) entra no resultado, em "precision",
+    quando não há filtro ou o filtro é exatamente "precision".
+
+    Args:
+        output (str): O arquivo JSON de saída.
+        baseline (Optional[str]): O arquivo JSON de referência.
+        threshold (float): O aumento relativo tolerado na comparação.
+        name_filter (Optional[str]): Só executa os casos cujo nome contém esse texto.
+
+    Returns:
+        int: 1 se houve regressão em relação à referência, 0 caso contrário.
+    """
+    report = run_benchmarks(name_filter)
+    if name_filter is None or name_filter == "precision":
+        report["precision"] = precision_report()
+    save_benchmarks(report, output)
+    print(Color.text(f"Resultado gravado em {output}", Color.GRAY))
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_benchmarks(load_benchmarks(baseline), report, threshold)
+    if regressions:
+        print(
+            Color.text(f"{len(regressions)} caso(s) regrediram: ", Color.RED)
+            + ", ".join(regressions)
+        )
+        return 1
+    print(Color.text("Nenhuma regressão encontrada.", Color.GREEN))
+    return 0
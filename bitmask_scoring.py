@@ -0,0 +1,138 @@
+from itertools import product
+from math import comb
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Point = Tuple[int, ...]
+"""Uma entrada booleana de n bits, como uma tupla de 0s e 1s."""
+
+
+def input_space(n_bits: int) -> List[Point]:
+    """Lista todas as 2^n entradas de n bits, em ordem lexicográfica.
+
+    Args:
+        n_bits (int): O número de bits de cada entrada.
+
+    Returns:
+        List[Point]: As entradas, de (0, ..., 0) a (1, ..., 1).
+    """
+    return list(product((0, 1), repeat=n_bits))
+
+
+def unobserved_inputs(n_bits: int, observed: Iterable[Point]) -> List[Point]:
+    """Lista as entradas de n bits que não estão no conjunto observado.
+
+    Args:
+        n_bits (int): O número de bits de cada entrada.
+        observed (Iterable[Point]): As entradas observadas (o conjunto de treinamento).
+
+    Returns:
+        List[Point]: As entradas não observadas, em ordem lexicográfica.
+
+    Raises:
+        ValueError: Se alguma entrada observada não tiver n bits.
+    """
+    observed = set(map(tuple, observed))
+    if any(len(x) != n_bits for x in observed):
+        raise ValueError(f"Todas as entradas observadas devem ter {n_bits} bits")
+    return [x for x in input_space(n_bits) if x not in observed]
+
+
+def truth_table_mask(function: Callable[[Point], int], points: Sequence[Point]) -> int:
+    """Representa uma função booleana, restrita a um conjunto de pontos, como um inteiro.
+
+    O bit i da máscara é o valor da função no ponto i. Assim, duas funções concordam
+    nos pontos onde os bits de `a ^ b` são 0.
+
+    Args:
+        function (Callable[[Point], int]): A função (hipótese ou alvo), com valores 0 ou 1.
+        points (Sequence[Point]): Os pontos, na ordem dos bits.
+
+    Returns:
+        int: A máscara de k = len(points) bits.
+    """
+    mask = 0
+    for i, x in enumerate(points):
+        if function(x):
+            mask |= 1 << i
+    return mask
+
+
+def agreement_histogram(
+    hypothesis: int, k: int, targets: Optional[Iterable[int]] = None
+) -> List[int]:
+    """Conta em quantos alvos a hipótese concorda em exatamente a pontos, para a = 0..k.
+
+    Uma hipótese e um alvo concordam em k - popcount(h ^ t) pontos.
+
+    - Sem `targets`, os alvos são todas as 2^k funções nos k pontos. Quando t percorre
+      todas as máscaras, h ^ t também percorre todas, então o histograma não depende da
+      hipótese: há C(k, a) alvos que concordam em a pontos. O resultado sai em forma
+      fechada, em O(k), mesmo para k = 30 (mais de um bilhão de alvos).
+    - Com `targets`, cada alvo dado é comparado com XOR e popcount, um inteiro por alvo.
+
+    Args:
+        hypothesis (int): A máscara da hipótese (veja `truth_table_mask`).
+        k (int): O número de pontos (bits das máscaras).
+        targets (Optional[Iterable[int]]): As máscaras dos alvos. Por padrão, todos.
+
+    Returns:
+        List[int]: O histograma, indexado pelo número de pontos de concordância.
+
+    Raises:
+        ValueError: Se alguma máscara tiver mais de k bits.
+    """
+    if hypothesis >> k:
+        raise ValueError(f"A hipótese tem mais de {k} bits")
+    if targets is None:
+        return [comb(k, a) for a in range(k + 1)]
+
+    histogram = [0] * (k + 1)
+    for target in targets:
+        if target >> k:
+            raise ValueError(f"O alvo {target} tem mais de {k} bits")
+        histogram[k - (hypothesis ^ target).bit_count()] += 1
+    return histogram
+
+
+def histogram_score(
+    histogram: Sequence[int], weights: Optional[Sequence[float]] = None
+) -> float:
+    """Calcula a pontuação de um histograma de concordância.
+
+    Args:
+        histogram (Sequence[int]): O número de alvos por número de pontos de concordância.
+        weights (Optional[Sequence[float]]): O peso de cada número de pontos. Por padrão,
+            o próprio número de pontos (concordar em a pontos vale a).
+
+    Returns:
+        float: A soma dos pesos sobre os alvos.
+    """
+    if weights is None:
+        weights = range(len(histogram))
+    return sum(count * weight for count, weight in zip(histogram, weights))
+
+
+def score_hypotheses(
+    hypotheses: Dict[str, int],
+    k: int,
+    targets: Optional[Sequence[int]] = None,
+    weights: Optional[Sequence[float]] = None,
+) -> Dict[str, Tuple[List[int], float]]:
+    """Calcula o histograma e a pontuação de várias hipóteses sobre os mesmos alvos.
+
+    Args:
+        hypotheses (Dict[str, int]): As máscaras das hipóteses, por nome.
+        k (int): O número de pontos (bits das máscaras).
+        targets (Optional[Sequence[int]]): As máscaras dos alvos. Por padrão, todas as
+            2^k funções (forma fechada).
+        weights (Optional[Sequence[float]]): O peso de cada número de pontos de
+            concordância (veja `histogram_score`).
+
+    Returns:
+        Dict[str, Tuple[List[int], float]]: O histograma e a pontuação de cada hipótese.
+    """
+    results = {}
+    for name, mask in hypotheses.items():
+        histogram = agreement_histogram(mask, k, targets)
+        results[name] = histogram, histogram_score(histogram, weights)
+    return results
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+from constants import CACHE_DEPENDENCIES, CACHE_DIR, CACHE_MAX_BYTES
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+"""Diretório raiz do projeto, onde ficam as dependências listadas em CACHE_DEPENDENCIES."""
+
+
+class ResultCache:
+    """Cache em disco de resultados de experimentos, endereçado pelo conteúdo.
+
+    A chave de um resultado é o SHA-256 do código-fonte do exercício, do código-fonte de
+    suas dependências (`CACHE_DEPENDENCIES`), da versão do Python e dos parâmetros da
+    execução (semente, número de execuções, critérios de parada...). Qualquer alteração
+    no código ou nos parâmetros gera outra chave, então um resultado guardado nunca fica
+    desatualizado: ele apenas deixa de ser usado e acaba removido.
+
+    Cada resultado é um arquivo JSON em `directory`. A data de modificação do arquivo é
+    atualizada a cada leitura, e, quando o diretório passa de `max_bytes`, os arquivos
+    usados há mais tempo são removidos primeiro (LRU).
+
+    Args:
+        directory (str): O diretório dos arquivos do cache.
+        max_bytes (int): O tamanho máximo do cache em disco.
+    """
+
+    def __init__(
+        self, directory: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES
+    ) -> None:
+        """Cria o cache, sem acessar o disco.
+
+        Args:
+            directory (str): O diretório dos arquivos do cache.
+            max_bytes (int): O tamanho máximo do cache em disco.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, module: ModuleType, **params: Any) -> str:
+        """Calcula a chave de um resultado.
+
+        Args:
+            module (ModuleType): O módulo do exercício.
+            **params (Any): Os parâmetros da execução (serializáveis em JSON).
+
+        Returns:
+            str: O SHA-256, em hexadecimal, do código e dos parâmetros.
+        """
+        digest = hashlib.sha256()
+        paths = [module.__file__] + [
+            os.path.join(PROJECT_ROOT, name) for name in CACHE_DEPENDENCIES
+        ]
+        for path in paths:
+            digest.update(os.path.basename(path).encode())
+            with open(path, "rb") as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+
+        header = {
+            "module": module.__name__,
+            "python": list(sys.version_info[:2]),
+            "params": params,
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Retorna o caminho do arquivo de uma chave."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Lê um resultado do cache, marcando-o como usado recentemente.
+
+        Args:
+            key (str): A chave do resultado.
+
+        Returns:
+            Optional[Dict[str, Any]]: O resultado, ou None se ele não estiver no cache
+                (ou o arquivo estiver corrompido).
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                value = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Grava um resultado no cache e remove os menos usados, se necessário.
+
+        O arquivo é escrito em um temporário e renomeado, então uma leitura concorrente
+        nunca vê um resultado pela metade.
+
+        Args:
+            key (str): A chave do resultado.
+            value (Dict[str, Any]): O resultado (serializável em JSON).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(value, file)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove os resultados usados há mais tempo até o cache caber em `max_bytes`."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                status = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
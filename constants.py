@@ -2,3 +2,70 @@ import os
 
 CMD_CLEAR = "cls" if os.name == "nt" else "clear"
 """Comando para limpar a tela do terminal."""
+
+GRAM_CACHE_LIMIT = 1_000_000
+"""Número máximo de produtos internos guardados pelo modo incremental do Perceptron."""
+
+GRAM_CHUNK_SIZE = 512
+"""Número de linhas processadas por bloco ao acumular X^T X e X^T y."""
+
+SHARD_SIZE = 50
+"""Número de execuções de um experimento agrupadas em cada tarefa do executor."""
+
+CONFIDENCE_LEVEL = 0.99
+"""Nível de confiança dos intervalos reportados pelos experimentos."""
+
+MIN_RUNS = 100
+"""Número mínimo de execuções antes que um experimento possa parar antecipadamente."""
+
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".cache", "results"
+)
+"""Diretório do cache de resultados dos experimentos."""
+
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+"""Tamanho máximo do cache de resultados; os resultados usados há mais tempo saem primeiro."""
+
+CACHE_DEPENDENCIES = (
+    "agreement.py",
+    "constants.py",
+    "disagreement.py",
+    "experiment.py",
+    "features.py",
+    "linear_regression.py",
+    "matrix.py",
+    "perceptron.py",
+    "solvers.py",
+    "utils.py",
+)
+"""Módulos compartilhados cujo código-fonte entra na chave do cache de resultados."""
+
+DISAGREEMENT_SAMPLES = 1000
+"""Número de pontos de teste ao estimar P[f(x) ≠ g(x)] de hipóteses não lineares."""
+
+AGREEMENT_TEST_POINTS = 2000
+"""Número de pontos da amostra de teste compartilhada usada para medir a concordância
+entre hipóteses."""
+
+AGREEMENT_TEST_SEED = 0
+"""Semente da amostra de teste compartilhada (a mesma em todas as execuções)."""
+
+BENCH_WARMUP = 1
+"""Número de chamadas de aquecimento (não medidas) de cada caso de benchmark."""
+
+BENCH_REPEAT = 7
+"""Número de chamadas medidas de cada kernel no benchmark."""
+
+BENCH_THRESHOLD = 0.10
+"""Aumento relativo da mediana, em relação à referência, a partir do qual há regressão."""
+
+PROGRESS_INTERVAL = 0.1
+"""Intervalo mínimo, em segundos, entre atualizações da linha de progresso no terminal."""
+
+PROGRESS_LINE_INTERVAL = 5.0
+"""Intervalo mínimo, em segundos, entre linhas de progresso quando a saída não é um terminal."""
+
+REGISTRY_CACHE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".cache", "registry.json"
+)
+"""Arquivo de cache do registro de exercícios (metadados e data de modificação de cada um)."""
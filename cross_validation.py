@@ -0,0 +1,174 @@
+import random
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from linear_regression import LinearRegression, NormalEquations
+from profiling import timed
+from solvers import Solver, solve_many
+from utils import dot
+
+CVErrors = Dict[str, float]
+"""Os erros de validação: "squared_error" (erro quadrático médio) e
+"classification_error" (fração de sinais errados)."""
+
+
+def _check_solver(solver: Solver) -> None:
+    """Só os métodos das equações normais trabalham sobre as estatísticas acumuladas."""
+    if solver == "qr":
+        raise ValueError(
+            "A validação cruzada usa as equações normais; use outro método"
+        )
+
+
+@timed("leave_one_out")
+def leave_one_out(
+    X: Iterable[Sequence[float]],
+    y: Iterable[float],
+    weight_decay: float = 0.0,
+    solver: Solver = "cholesky",
+) -> CVErrors:
+    """Calcula o erro de validação cruzada deixando um de fora (LOO) com um único ajuste.
+
+    Com A = X^T X + λI, a matriz chapéu H = X A^{-1} X^T e o resíduo e_i = y_i - w · x_i
+    do ajuste com todos os pontos, o resíduo do ajuste sem o ponto i é exatamente
+        e_i / (1 - h_ii),   com h_ii = x_i^T A^{-1} x_i,
+    então não é preciso refazer N ajustes. A é fatorada uma única vez, para os pesos e
+    para todos os h_ii, e cada h_ii custa O(d^2). A predição sem o ponto i,
+    y_i - e_i / (1 - h_ii), dá o erro de classificação.
+
+    Args:
+        X (Iterable[Sequence[float]]): A matriz de características (já transformada,
+            incluindo a coluna do bias), uma amostra por linha.
+        y (Iterable[float]): Os rótulos (1 ou -1).
+        weight_decay (float): O λ do decaimento de pesos.
+        solver (Solver): O método de resolução das equações normais.
+
+    Returns:
+        CVErrors: Os erros quadrático e de classificação médios sobre os N pontos.
+
+    Raises:
+        ValueError: Se não houver amostras, o método for "qr" ou algum ponto tiver
+            alavancagem h_ii = 1 (o ajuste sem ele não é determinado).
+    """
+    _check_solver(solver)
+    rows = list(X)
+    y = list(y)
+    if not rows:
+        raise ValueError("X não possui nenhuma amostra")
+
+    model = LinearRegression(solver, weight_decay)
+    model.partial_fit(rows, y)
+    statistics = model.statistics
+    # Uma única fatoração de A dá os pesos (A w = X^T y) e todos os A^{-1} x_i
+    weights, *A_inv_X = solve_many(
+        model._regularized(statistics.X_T_X), [statistics.X_T_y, *rows], solver
+    )
+
+    squared_error = 0.0
+    mistakes = 0
+    for x_i, y_i, A_inv_x_i in zip(rows, y, A_inv_X):
+        leverage = dot(x_i, A_inv_x_i)
+        if leverage >= 1 - 1e-12:
+            raise ValueError("Um ponto tem alavancagem 1; o LOO não é definido")
+        residual = (y_i - dot(weights, x_i)) / (1 - leverage)
+        squared_error += residual * residual
+        mistakes += (1 if y_i - residual >= 0 else -1) != y_i
+
+    return {
+        "squared_error": squared_error / len(rows),
+        "classification_error": mistakes / len(rows),
+    }
+
+
+def fold_indices(
+    n_samples: int, k: int, rng: Optional[random.Random] = None
+) -> List[List[int]]:
+    """Divide os índices das amostras em k folds de tamanhos quase iguais.
+
+    Args:
+        n_samples (int): O número de amostras.
+        k (int): O número de folds.
+        rng (Optional[random.Random]): Embaralha os índices antes da divisão. Por padrão,
+            os folds são blocos consecutivos.
+
+    Returns:
+        List[List[int]]: Os índices de cada fold.
+
+    Raises:
+        ValueError: Se k não estiver entre 2 e o número de amostras.
+    """
+    if not 2 <= k <= n_samples:
+        raise ValueError(f"O número de folds deve estar entre 2 e {n_samples}: {k}")
+
+    indices = list(range(n_samples))
+    if rng is not None:
+        rng.shuffle(indices)
+    size, extra = divmod(n_samples, k)
+    folds = []
+    start = 0
+    for j in range(k):
+        end = start + size + (j < extra)
+        folds.append(indices[start:end])
+        start = end
+    return folds
+
+
+@timed("k_fold")
+def k_fold(
+    X: Iterable[Sequence[float]],
+    y: Sequence[float],
+    k: int = 10,
+    weight_decay: float = 0.0,
+    solver: Solver = "cholesky",
+    rng: Optional[random.Random] = None,
+) -> CVErrors:
+    """Calcula o erro de validação cruzada com k folds.
+
+    As estatísticas X^T X, X^T y e y^T y de cada fold são acumuladas uma única vez, e as
+    de todos os dados são a soma delas. O treino de cada fold usa o total menos o fold
+    (`NormalEquations.__sub__`), sem rever as amostras de treino, e o erro quadrático no
+    fold sai das estatísticas do próprio fold, em O(d^2). Só o erro de classificação
+    precisa prever os pontos do fold. Com k >= 2, cada fold tem no máximo metade das
+    amostras, então o cancelamento da subtração (veja `NormalEquations.__sub__`) custa
+    no máximo um fator 2 no erro relativo das somas de quadrados (a diagonal de X^T X e
+    y^T y).
+
+    Args:
+        X (Iterable[Sequence[float]]): A matriz de características (já transformada,
+            incluindo a coluna do bias), uma amostra por linha.
+        y (Sequence[float]): Os rótulos (1 ou -1).
+        k (int): O número de folds.
+        weight_decay (float): O λ do decaimento de pesos.
+        solver (Solver): O método de resolução das equações normais.
+        rng (Optional[random.Random]): Embaralha as amostras antes de dividir os folds.
+
+    Returns:
+        CVErrors: Os erros quadrático e de classificação médios sobre os N pontos.
+
+    Raises:
+        ValueError: Se o método for "qr" ou k não estiver entre 2 e N.
+    """
+    _check_solver(solver)
+    rows = list(X)
+    folds = fold_indices(len(rows), k, rng)
+
+    fold_statistics = []
+    for fold in folds:
+        statistics = NormalEquations()
+        statistics.update([rows[i] for i in fold], [y[i] for i in fold])
+        fold_statistics.append(statistics)
+    total = sum(fold_statistics[1:], fold_statistics[0])
+
+    squared_error = 0.0
+    mistakes = 0
+    for fold, statistics in zip(folds, fold_statistics):
+        model = LinearRegression.from_statistics(
+            total - statistics, solver, weight_decay
+        )
+        squared_error += statistics.residual_sum_of_squares(model.weights)
+        predictions = model.predict_batch([rows[i] for i in fold])
+        mistakes += sum(prediction != y[i] for prediction, i in zip(predictions, fold))
+
+    return {
+        "squared_error": squared_error / len(rows),
+        "classification_error": mistakes / len(rows),
+    }
@@ -0,0 +1,188 @@
+import random
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from constants import DISAGREEMENT_SAMPLES
+from utils import evaluate_target_function, generate_data
+
+Line = Tuple[float, float, float]
+"""Os coeficientes (w0, w1, w2) da reta w0 + w1 * x1 + w2 * x2 = 0. O lado positivo é
+onde a expressão é maior que 0, como nos pesos do Perceptron (w0 é o bias)."""
+
+Polygon = List[Tuple[float, float]]
+"""Um polígono convexo, como a lista de seus vértices em ordem."""
+
+
+def target_line(point1: Sequence[float], point2: Sequence[float]) -> Line:
+    """Escreve a função alvo de `generate_target_function` como uma reta.
+
+    O lado positivo da reta é exatamente onde `evaluate_target_function` devolve +1.
+
+    Args:
+        point1 (Sequence[float]): Primeiro ponto que define a função alvo.
+        point2 (Sequence[float]): Segundo ponto que define a função alvo.
+
+    Returns:
+        Line: Os coeficientes da reta.
+    """
+    dx = point2[0] - point1[0]
+    dy = point2[1] - point1[1]
+    return dy * point1[0] - dx * point1[1], -dy, dx
+
+
+def square(interval: Tuple[float, float] = (-1, 1)) -> Polygon:
+    """Monta o quadrado interval × interval, de onde os pontos são sorteados.
+
+    Args:
+        interval (Tuple[float, float]): O intervalo de cada coordenada.
+
+    Returns:
+        Polygon: Os quatro vértices, no sentido anti-horário.
+    """
+    low, high = interval
+    return [(low, low), (high, low), (high, high), (low, high)]
+
+
+def clip_polygon(polygon: Polygon, line: Line) -> Polygon:
+    """Recorta um polígono convexo pelo lado positivo de uma reta (Sutherland–Hodgman).
+
+    Args:
+        polygon (Polygon): O polígono convexo.
+        line (Line): A reta; fica a parte do polígono onde w0 + w1 * x1 + w2 * x2 >= 0.
+
+    Returns:
+        Polygon: O polígono recortado (vazio se o polígono estiver todo do lado negativo).
+    """
+    w0, w1, w2 = line
+    clipped: Polygon = []
+    if not polygon:
+        return clipped
+
+    previous = polygon[-1]
+    previous_value = w0 + w1 * previous[0] + w2 * previous[1]
+    for current in polygon:
+        value = w0 + w1 * current[0] + w2 * current[1]
+        if (value >= 0) != (previous_value >= 0):
+            # A aresta cruza a reta: entra o ponto de interseção
+            t = previous_value / (previous_value - value)
+            clipped.append(
+                (
+                    previous[0] + t * (current[0] - previous[0]),
+                    previous[1] + t * (current[1] - previous[1]),
+                )
+            )
+        if value >= 0:
+            clipped.append(current)
+        previous, previous_value = current, value
+    return clipped
+
+
+def polygon_area(polygon: Polygon) -> float:
+    """Calcula a área de um polígono pela fórmula do laço (shoelace).
+
+    Args:
+        polygon (Polygon): O polígono.
+
+    Returns:
+        float: A área (0 para um polígono vazio ou degenerado).
+    """
+    twice_area = 0.0
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+        twice_area += x1 * y2 - x2 * y1
+    return abs(twice_area) / 2
+
+
+def exact_disagreement(
+    target: Line, hypothesis: Line, interval: Tuple[float, float] = (-1, 1)
+) -> float:
+    """Calcula P[f(x) ≠ g(x)] exatamente para duas funções lineares.
+
+    Com x uniforme no quadrado, a probabilidade é a área da região onde f e g discordam
+    dividida pela área do quadrado. Essa região é a união de dois polígonos convexos: a
+    parte do quadrado do lado positivo de f e negativo de g, e vice-versa. Os pontos
+    sobre as retas têm área nula, então o empate de `sign` não importa.
+
+    Args:
+        target (Line): A reta da função alvo (veja `target_line`).
+        hypothesis (Line): A reta da hipótese, por exemplo `Perceptron.weights`.
+        interval (Tuple[float, float]): O intervalo de cada coordenada.
+
+    Returns:
+        float: A probabilidade de discordância.
+    """
+    region = square(interval)
+    negative_target: Line = (-target[0], -target[1], -target[2])
+    negative_hypothesis: Line = (-hypothesis[0], -hypothesis[1], -hypothesis[2])
+
+    area = polygon_area(clip_polygon(clip_polygon(region, target), negative_hypothesis))
+    area += polygon_area(
+        clip_polygon(clip_polygon(region, negative_target), hypothesis)
+    )
+    return area / polygon_area(region)
+
+
+def sampled_disagreement(
+    point1: Sequence[float],
+    point2: Sequence[float],
+    predict_batch: Callable[[List[List[float]]], Sequence[Union[float, int]]],
+    n_points: int = DISAGREEMENT_SAMPLES,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """Estima P[f(x) ≠ g(x)] em pontos de teste sorteados.
+
+    Serve para hipóteses não lineares (por exemplo, com transformação de características),
+    em que a região de discordância não é um polígono.
+
+    Args:
+        point1 (Sequence[float]): Primeiro ponto que define a função alvo.
+        point2 (Sequence[float]): Segundo ponto que define a função alvo.
+        predict_batch (Callable): Prediz os rótulos (1 ou -1) de uma matriz de pontos.
+        n_points (int): O número de pontos de teste.
+        rng (Optional[random.Random]): O gerador aleatório dos pontos de teste.
+
+    Returns:
+        float: A fração dos pontos de teste em que f e g discordam.
+    """
+    X_test, _ = generate_data(n_points, rng=rng)
+    y_test_g = predict_batch(X_test)
+    mismatches = sum(
+        evaluate_target_function(point1, point2, x) != g
+        for x, g in zip(X_test, y_test_g)
+    )
+    return mismatches / n_points
+
+
+def disagreement(
+    point1: Sequence[float],
+    point2: Sequence[float],
+    hypothesis: Union[Sequence[float], Callable[[List[List[float]]], Sequence[float]]],
+    rng: Optional[random.Random] = None,
+    n_points: int = DISAGREEMENT_SAMPLES,
+) -> float:
+    """Calcula P[f(x) ≠ g(x)] para a função alvo de `generate_target_function`.
+
+    - Se a hipótese for linear, dada pelos pesos (w0, w1, w2), o resultado é exato
+      (`exact_disagreement`), sem sorteio nem variância.
+    - Se for uma função de predição em lote, o resultado é estimado em `n_points` pontos
+      sorteados com `rng` (`sampled_disagreement`).
+
+    Args:
+        point1 (Sequence[float]): Primeiro ponto que define a função alvo.
+        point2 (Sequence[float]): Segundo ponto que define a função alvo.
+        hypothesis: Os pesos de uma hipótese linear ou a sua predição em lote.
+        rng (Optional[random.Random]): O gerador aleatório, usado só na amostragem.
+        n_points (int): O número de pontos de teste, usado só na amostragem.
+
+    Returns:
+        float: A probabilidade (ou a estimativa) de discordância.
+
+    Raises:
+        ValueError: Se os pesos não tiverem três coeficientes.
+    """
+    if callable(hypothesis):
+        return sampled_disagreement(point1, point2, hypothesis, n_points, rng)
+    if len(hypothesis) != 3:
+        raise ValueError(
+            f"Uma hipótese linear no plano tem 3 pesos, mas foram dados {len(hypothesis)}"
+        )
+    w0, w1, w2 = hypothesis
+    return exact_disagreement(target_line(point1, point2), (w0, w1, w2))
@@ -0,0 +1,493 @@
+import importlib
+import math
+from concurrent.futures import Future
+from statistics import NormalDist
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cache import ResultCache
+from constants import CONFIDENCE_LEVEL, MIN_RUNS, SHARD_SIZE
+from utils import Color, ProgressReporter, RandomStream
+
+Metrics = Dict[str, float]
+"""As métricas de uma execução de um experimento, por nome."""
+
+
+def is_experiment(module: ModuleType) -> bool:
+    """Verifica se um módulo de exercício segue o protocolo de experimentos.
+
+    Um experimento expõe `N_RUNS`, uma função por execução `simulate_run(rng) -> Metrics`
+    (ou a versão em lote `simulate_runs(rngs) -> List[Metrics]`) e `report(summary)`,
+    que imprime o resultado. Opcionalmente, `reduce(results) -> Metrics` substitui a
+    média simples de cada métrica, e `ALTERNATIVES` (um dicionário métrica -> opções de
+    resposta) permite parar assim que a resposta de cada métrica estiver decidida.
+
+    Args:
+        module (ModuleType): O módulo do exercício.
+
+    Returns:
+        bool: True se o módulo pode ser executado por `run_experiment`.
+    """
+    has_simulation = hasattr(module, "simulate_run") or hasattr(module, "simulate_runs")
+    return has_simulation and hasattr(module, "N_RUNS") and hasattr(module, "report")
+
+
+def average_metrics(results: Sequence[Metrics]) -> Metrics:
+    """Calcula a média de cada métrica sobre as execuções.
+
+    Args:
+        results (Sequence[Metrics]): As métricas de cada execução, na ordem.
+
+    Returns:
+        Metrics: A média de cada métrica.
+    """
+    return {
+        key: math.fsum(result[key] for result in results) / len(results)
+        for key in results[0]
+    }
+
+
+def shard_ranges(n_runs: int, shard_size: int = SHARD_SIZE) -> List[Tuple[int, int]]:
+    """Divide as execuções 0..n_runs-1 em intervalos contíguos.
+
+    Args:
+        n_runs (int): O número de execuções.
+        shard_size (int): O número de execuções por intervalo.
+
+    Returns:
+        List[Tuple[int, int]]: Os intervalos [início, fim), na ordem.
+    """
+    return [
+        (start, min(start + shard_size, n_runs))
+        for start in range(0, n_runs, shard_size)
+    ]
+
+
+def simulate_shard(module_name: str, seed: int, start: int, stop: int) -> List[Metrics]:
+    """Executa as execuções start..stop-1 de um experimento.
+
+    A execução k usa sempre o fluxo `RandomStream(seed).spawn(k)`, então seu resultado
+    não depende de qual processo ou intervalo a executou.
+
+    Args:
+        module_name (str): O nome do módulo do exercício (importado no processo atual).
+        seed (int): A semente raiz do experimento.
+        start (int): A primeira execução do intervalo.
+        stop (int): A execução seguinte à última do intervalo.
+
+    Returns:
+        List[Metrics]: As métricas de cada execução, na ordem.
+    """
+    module = importlib.import_module(module_name)
+    root = RandomStream(seed)
+    rngs = [root.spawn(k) for k in range(start, stop)]
+
+    simulate_runs = getattr(module, "simulate_runs", None)
+    if simulate_runs is not None:
+        return simulate_runs(rngs)
+    return [module.simulate_run(rng) for rng in rngs]
+
+
+class RunningStats:
+    """Média e variância de uma métrica, atualizadas amostra a amostra (Welford).
+
+    Cada atualização custa O(1) e não guarda as amostras. A forma de Welford evita o
+    cancelamento catastrófico de E[x^2] - E[x]^2 quando a variância é pequena em relação
+    à média.
+    """
+
+    def __init__(self) -> None:
+        """Cria as estatísticas de uma métrica sem amostras."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        """Acrescenta uma amostra.
+
+        Args:
+            value (float): O valor da métrica em uma execução.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @classmethod
+    def from_state(cls, state: Sequence[float]) -> "RunningStats":
+        """Recria as estatísticas a partir de `state()`.
+
+        Args:
+            state (Sequence[float]): O número de amostras, a média e a soma dos quadrados
+                dos desvios.
+
+        Returns:
+            RunningStats: As estatísticas.
+        """
+        stats = cls()
+        count, stats.mean, stats._m2 = state
+        stats.count = int(count)
+        return stats
+
+    def state(self) -> Tuple[int, float, float]:
+        """Retorna o estado interno, para ser serializado.
+
+        Returns:
+            Tuple[int, float, float]: O número de amostras, a média e a soma dos
+                quadrados dos desvios.
+        """
+        return self.count, self.mean, self._m2
+
+    @property
+    def variance(self) -> float:
+        """Retorna a variância amostral (com n - 1 no denominador).
+
+        Returns:
+            float: A variância, ou 0 com menos de duas amostras.
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_error(self) -> float:
+        """Retorna o erro padrão da média.
+
+        Returns:
+            float: O desvio padrão da média amostral.
+        """
+        return math.sqrt(self.variance / self.count) if self.count else math.inf
+
+    def confidence_interval(
+        self, level: float = CONFIDENCE_LEVEL
+    ) -> Tuple[float, float]:
+        """Retorna o intervalo de confiança da média, pela aproximação normal.
+
+        Args:
+            level (float): O nível de confiança, por exemplo 0.99.
+
+        Returns:
+            Tuple[float, float]: Os limites inferior e superior.
+        """
+        half_width = NormalDist().inv_cdf((1 + level) / 2) * self.standard_error
+        return self.mean - half_width, self.mean + half_width
+
+
+def closest_alternative(value: float, alternatives: Sequence[float]) -> int:
+    """Retorna o índice da opção de resposta mais próxima de um valor.
+
+    Args:
+        value (float): O valor estimado.
+        alternatives (Sequence[float]): As opções de resposta.
+
+    Returns:
+        int: O índice da opção mais próxima (a primeira, em caso de empate).
+    """
+    return min(range(len(alternatives)), key=lambda i: abs(alternatives[i] - value))
+
+
+def sequential_level(n_looks: int, level: float = CONFIDENCE_LEVEL) -> float:
+    """Ajusta o nível de confiança para várias verificações do mesmo experimento.
+
+    O intervalo é conferido ao fim de cada intervalo de execuções, e cada conferência é
+    uma nova chance de parar por acaso. Pela correção de Bonferroni, se cada uma das
+    `n_looks` conferências usa o nível 1 - (1 - level) / n_looks, a probabilidade de
+    alguma delas errar é no máximo 1 - level.
+
+    Args:
+        n_looks (int): O número máximo de conferências.
+        level (float): O nível de confiança desejado para o experimento inteiro.
+
+    Returns:
+        float: O nível de confiança de cada conferência.
+    """
+    return 1 - (1 - level) / max(n_looks, 1)
+
+
+def is_decided(
+    stats: RunningStats, alternatives: Sequence[float], level: float = CONFIDENCE_LEVEL
+) -> bool:
+    """Verifica se o intervalo de confiança inteiro está mais perto de uma única opção.
+
+    Na reta, a região mais próxima de cada opção é um intervalo, então basta que os dois
+    limites do intervalo de confiança tenham a mesma opção mais próxima.
+
+    Args:
+        stats (RunningStats): As estatísticas da métrica.
+        alternatives (Sequence[float]): As opções de resposta da métrica.
+        level (float): O nível de confiança do intervalo.
+
+    Returns:
+        bool: True se a opção mais próxima já não depende de mais execuções.
+    """
+    low, high = stats.confidence_interval(level)
+    return closest_alternative(low, alternatives) == closest_alternative(
+        high, alternatives
+    )
+
+
+def should_stop(
+    stats: Dict[str, RunningStats],
+    alternatives: Optional[Dict[str, Sequence[float]]],
+    target_width: Optional[float],
+    level: float = CONFIDENCE_LEVEL,
+) -> bool:
+    """Decide se o experimento já pode parar.
+
+    O experimento para quando todas as métricas com opções de resposta estão decididas
+    (veja `is_decided`) ou quando o intervalo de confiança de todas as métricas tem
+    largura de no máximo `target_width`. Antes de `MIN_RUNS` execuções ele nunca para,
+    pois a aproximação normal ainda não é confiável. Como a decisão é tomada várias
+    vezes ao longo do experimento, `level` deve vir de `sequential_level`.
+
+    Args:
+        stats (Dict[str, RunningStats]): As estatísticas de cada métrica.
+        alternatives (Optional[Dict[str, Sequence[float]]]): As opções de resposta de
+            cada métrica, ou None para não usar esse critério.
+        target_width (Optional[float]): A largura alvo do intervalo de confiança, ou None
+            para não usar esse critério.
+        level (float): O nível de confiança dos intervalos desta conferência.
+
+    Returns:
+        bool: True se as execuções restantes não são necessárias.
+    """
+    if not stats or next(iter(stats.values())).count < MIN_RUNS:
+        return False
+    if alternatives and all(
+        is_decided(stats[key], options, level) for key, options in alternatives.items()
+    ):
+        return True
+    if target_width is not None:
+        return all(
+            high - low <= target_width
+            for low, high in (s.confidence_interval(level) for s in stats.values())
+        )
+    return False
+
+
+class ExperimentResult:
+    """O resultado de `run_experiment`.
+
+    Args:
+        summary (Metrics): O resumo das métricas (`reduce` do módulo ou a média).
+        stats (Dict[str, RunningStats]): As estatísticas de cada métrica.
+        n_runs (int): O número de execuções realizadas.
+        seed (int): A semente raiz usada.
+        stopped_early (bool): Se o experimento parou antes de `N_RUNS` execuções.
+        from_cache (bool): Se o resultado foi lido do cache, sem executar o experimento.
+    """
+
+    def __init__(
+        self,
+        summary: Metrics,
+        stats: Dict[str, RunningStats],
+        n_runs: int,
+        seed: int,
+        stopped_early: bool,
+        from_cache: bool = False,
+    ) -> None:
+        """Guarda o resultado do experimento.
+
+        Args:
+            summary (Metrics): O resumo das métricas.
+            stats (Dict[str, RunningStats]): As estatísticas de cada métrica.
+            n_runs (int): O número de execuções realizadas.
+            seed (int): A semente raiz usada.
+            stopped_early (bool): Se o experimento parou antes de `N_RUNS` execuções.
+            from_cache (bool): Se o resultado foi lido do cache.
+        """
+        self.summary = summary
+        self.stats = stats
+        self.n_runs = n_runs
+        self.seed = seed
+        self.stopped_early = stopped_early
+        self.from_cache = from_cache
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o resultado para um dicionário serializável em JSON.
+
+        Returns:
+            Dict[str, Any]: O resultado.
+        """
+        return {
+            "summary": self.summary,
+            "stats": {key: stats.state() for key, stats in self.stats.items()},
+            "n_runs": self.n_runs,
+            "seed": self.seed,
+            "stopped_early": self.stopped_early,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs: Any) -> "ExperimentResult":
+        """Recria um resultado a partir de `to_dict()`.
+
+        Args:
+            data (Dict[str, Any]): O resultado serializado.
+            **kwargs (Any): Atributos adicionais, como `from_cache`.
+
+        Returns:
+            ExperimentResult: O resultado.
+        """
+        stats = {
+            key: RunningStats.from_state(state) for key, state in data["stats"].items()
+        }
+        return cls(
+            data["summary"],
+            stats,
+            data["n_runs"],
+            data["seed"],
+            data["stopped_early"],
+            **kwargs,
+        )
+
+
+def print_confidence_intervals(result: ExperimentResult) -> None:
+    """Imprime a média e o intervalo de confiança de cada métrica.
+
+    Args:
+        result (ExperimentResult): O resultado do experimento.
+    """
+    level = f"{CONFIDENCE_LEVEL:.0%}"
+    stopped = " (parada antecipada)" if result.stopped_early else ""
+    if result.from_cache:
+        stopped += " (do cache)"
+    print(
+        Color.text(
+            f"Intervalos de confiança de {level} após {result.n_runs} execuções{stopped}:",
+            Color.GRAY,
+        )
+    )
+    for key, stats in result.stats.items():
+        low, high = stats.confidence_interval()
+        print(
+            Color.text(f"  {key}: {stats.mean:.4f} [{low:.4f}, {high:.4f}]", Color.GRAY)
+        )
+
+
+def report_experiment(module: ModuleType, result: ExperimentResult) -> None:
+    """Imprime o resultado do exercício e os intervalos de confiança das métricas.
+
+    Args:
+        module (ModuleType): O módulo do exercício.
+        result (ExperimentResult): O resultado do experimento.
+    """
+    module.report(result.summary)
+    print_confidence_intervals(result)
+
+
+def run_experiment(
+    module: ModuleType,
+    seed: Optional[int] = None,
+    jobs: int = 1,
+    n_runs: Optional[int] = None,
+    early_stop: bool = True,
+    target_width: Optional[float] = None,
+    cache: Optional[ResultCache] = None,
+) -> ExperimentResult:
+    """Executa um experimento, parando quando o resultado já está decidido.
+
+    As execuções são divididas em intervalos de `SHARD_SIZE`. Com `jobs > 1`, os
+    intervalos são distribuídos entre processos de um `ProcessPoolExecutor`. Cada
+    intervalo devolve as métricas das suas execuções, que são consumidas na ordem das
+    execuções: as estatísticas de Welford de cada métrica são atualizadas e, ao fim de
+    cada intervalo, `should_stop` decide se as execuções restantes são necessárias.
+    O resumo é calculado uma única vez no processo principal.
+
+    A parada é conferida em até uma fronteira por intervalo, então o nível de confiança
+    de cada conferência é corrigido por Bonferroni (`sequential_level`): sem isso, com
+    CONFIDENCE_LEVEL = 99% e 19 conferências, a chance de parar cedo demais em alguma
+    delas poderia chegar a 1 - 0.99^19 ≈ 17%. Os intervalos impressos no relatório
+    final continuam com CONFIDENCE_LEVEL.
+
+    Como cada execução tem seu próprio fluxo aleatório e a parada só é avaliada nas
+    fronteiras dos intervalos, na ordem, o resultado para uma dada semente (inclusive o
+    número de execuções) é idêntico, bit a bit, qualquer que seja o número de processos.
+    Por isso, com uma semente fixa, o resultado pode ser guardado em `cache` e reusado
+    enquanto o código do exercício, suas dependências e os parâmetros não mudarem.
+
+    Args:
+        module (ModuleType): O módulo do exercício (veja `is_experiment`).
+        seed (Optional[int]): A semente raiz. Se None, uma semente nova é sorteada.
+        jobs (int): O número de processos.
+        n_runs (Optional[int]): O número máximo de execuções. Por padrão, `module.N_RUNS`.
+        early_stop (bool): Se pode parar antes de `n_runs` execuções. Se False, todas as
+            execuções são feitas e `target_width` é ignorado.
+        target_width (Optional[float]): Para ao atingir essa largura do intervalo de
+            confiança em todas as métricas (além de quando as opções de resposta,
+            `ALTERNATIVES`, estiverem decididas).
+        cache (Optional[ResultCache]): O cache de resultados. Só é usado quando a
+            semente é dada, pois sem ela cada execução é diferente.
+
+    Returns:
+        ExperimentResult: O resumo, as estatísticas e a semente raiz usada.
+    """
+    n_runs = n_runs or module.N_RUNS
+    if not early_stop:
+        target_width = None
+    key = None
+    if cache is not None and seed is not None:
+        key = cache.key(
+            module,
+            seed=seed,
+            n_runs=n_runs,
+            early_stop=early_stop,
+            target_width=target_width,
+            shard_size=SHARD_SIZE,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return ExperimentResult.from_dict(cached, from_cache=True)
+
+    seed = RandomStream(seed).root_seed
+    reduce = getattr(module, "reduce", average_metrics)
+    alternatives = getattr(module, "ALTERNATIVES", None) if early_stop else None
+    shards = shard_ranges(n_runs)
+    level = sequential_level(sum(stop >= MIN_RUNS for _, stop in shards))
+
+    results: List[Metrics] = []
+    stats: Dict[str, RunningStats] = {}
+
+    progress = ProgressReporter(n_runs)
+
+    def consume(shard_results: List[Metrics], completed: int) -> bool:
+        for metrics in shard_results:
+            for name, value in metrics.items():
+                stats.setdefault(name, RunningStats()).update(value)
+        results.extend(shard_results)
+        progress.update(completed, {name: s.mean for name, s in stats.items()})
+        return should_stop(stats, alternatives, target_width, level)
+
+    def on_shard_done(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            progress.update(len(future.result()))
+
+    stopped = False
+    with progress:
+        if jobs <= 1:
+            for start, stop in shards:
+                shard_results = simulate_shard(module.__name__, seed, start, stop)
+                if consume(shard_results, len(shard_results)):
+                    stopped = True
+                    break
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(simulate_shard, module.__name__, seed, start, stop)
+                    for start, stop in shards
+                ]
+                # O progresso conta cada intervalo assim que um processo o termina, em
+                # qualquer ordem; as métricas são consumidas na ordem das execuções.
+                for future in futures:
+                    future.add_done_callback(on_shard_done)
+                for future in futures:
+                    if consume(future.result(), 0):
+                        stopped = True
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+
+    result = ExperimentResult(
+        reduce(results), stats, len(results), seed, stopped and len(results) < n_runs
+    )
+    if key is not None:
+        cache.put(key, result.to_dict())
+    return result
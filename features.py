@@ -0,0 +1,266 @@
+from itertools import islice
+from operator import mul
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from matrix import Matrix
+from profiling import timed_iter
+
+Stage = Callable[[Sequence[float]], Sequence[float]]
+"""Uma etapa da transformação: recebe uma linha e devolve a linha transformada."""
+
+
+class LazyFeatures:
+    """Matriz de características transformada sob demanda, linha a linha.
+
+    Guarda apenas a matriz de entrada e a sequência de etapas (funções de linha). Cada
+    iteração aplica as etapas às linhas conforme elas são consumidas, então a matriz
+    transformada nunca existe por inteiro na memória: `LinearRegression.fit` (que
+    acumula X^T X em blocos) e `predict_batch` a consomem diretamente. Se a matriz
+    completa for necessária, `materialize()` ou `to_matrix()` a constroem.
+
+    A matriz de entrada pode ser uma lista, uma `Matrix` ou outra `LazyFeatures`; para
+    ser iterada mais de uma vez (por exemplo, no ajuste e depois na predição), ela não
+    pode ser um gerador.
+
+    Com um nome, cada passagem completa pela matriz conta como uma chamada dessa fase
+    no perfil (veja `profiling.timed_iter`).
+
+    Args:
+        X (Iterable[Sequence[float]]): A matriz de entrada, uma amostra por linha.
+        *stages (Stage): As etapas, aplicadas na ordem dada.
+        name (Optional[str]): O nome da fase da transformação no perfil.
+    """
+
+    def __init__(
+        self, X: Iterable[Sequence[float]], *stages: Stage, name: Optional[str] = None
+    ) -> None:
+        """Cria a visão transformada de X.
+
+        Args:
+            X (Iterable[Sequence[float]]): A matriz de entrada.
+            *stages (Stage): As etapas, aplicadas na ordem dada.
+            name (Optional[str]): O nome da fase da transformação no perfil.
+        """
+        self._source = X
+        self._stages = stages
+        self.name = name
+
+    def then(self, stage: Stage) -> "LazyFeatures":
+        """Retorna uma nova visão com mais uma etapa no final.
+
+        Args:
+            stage (Stage): A etapa a ser acrescentada.
+
+        Returns:
+            LazyFeatures: A visão composta.
+        """
+        return LazyFeatures(self._source, *self._stages, stage, name=self.name)
+
+    def _transform(self, row: Sequence[float]) -> Sequence[float]:
+        """Aplica todas as etapas a uma única linha."""
+        for stage in self._stages:
+            row = stage(row)
+        return row
+
+    def __iter__(self) -> Iterator[Sequence[float]]:
+        rows: Iterator[Sequence[float]] = iter(self._source)
+        for stage in self._stages:
+            rows = map(stage, rows)
+        return timed_iter(self.name, rows) if self.name else rows
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __getitem__(
+        self, i: Union[int, slice]
+    ) -> Union[Sequence[float], "LazyFeatures"]:
+        if isinstance(i, slice):
+            return LazyFeatures(self._source[i], *self._stages, name=self.name)
+        return self._transform(self._source[i])
+
+    def chunks(self, chunk_size: int) -> Iterator[List[Sequence[float]]]:
+        """Itera sobre a matriz transformada em blocos de linhas.
+
+        Args:
+            chunk_size (int): O número de linhas de cada bloco.
+
+        Returns:
+            Iterator[List[Sequence[float]]]: Os blocos, na ordem.
+        """
+        rows = iter(self)
+        while chunk := list(islice(rows, chunk_size)):
+            yield chunk
+
+    def materialize(self) -> List[List[float]]:
+        """Constrói a matriz transformada completa como `List[List[float]]`.
+
+        Returns:
+            List[List[float]]: As linhas transformadas.
+        """
+        return [list(row) for row in self]
+
+    @property
+    def typecode(self) -> str:
+        """Retorna o tipo dos elementos da matriz de entrada, se ela for uma `Matrix`.
+
+        As etapas calculam em float64 (floats do Python), mas a precisão de
+        armazenamento da entrada é mantida ao materializar com `to_matrix()`.
+
+        Returns:
+            str: O typecode da entrada, ou "d" para listas e outras entradas.
+        """
+        return getattr(self._source, "typecode", "d")
+
+    def to_matrix(self, typecode: Optional[str] = None) -> Matrix:
+        """Constrói a matriz transformada completa em um buffer compacto.
+
+        Args:
+            typecode (Optional[str]): O tipo dos elementos no `array`. Por padrão, o da
+                matriz de entrada (veja `typecode`).
+
+        Returns:
+            Matrix: As linhas transformadas.
+        """
+        return Matrix.from_rows(self, typecode or self.typecode)
+
+
+def linear_features(x: Sequence[float]) -> Tuple[float, ...]:
+    """Acrescenta o bias a um ponto: (1, x1, x2).
+
+    Args:
+        x (Sequence[float]): O ponto (x1, x2).
+
+    Returns:
+        Tuple[float, ...]: O vetor de características.
+    """
+    x1, x2 = x
+    return 1, x1, x2
+
+
+def quadratic_features(x: Sequence[float]) -> Tuple[float, ...]:
+    """Transforma um ponto no vetor não linear (1, x1, x2, x1x2, x1^2, x2^2).
+
+    Args:
+        x (Sequence[float]): O ponto (x1, x2).
+
+    Returns:
+        Tuple[float, ...]: O vetor de características.
+    """
+    x1, x2 = x
+    return 1, x1, x2, x1 * x2, x1**2, x2**2
+
+
+class PolynomialFeatures:
+    """Gera todos os monômios de grau até `degree` em `n_inputs` variáveis.
+
+    O plano de monômios é calculado uma única vez, no construtor. Cada monômio de grau
+    k > 0 é o produto de um monômio de grau k - 1 já calculado (o "pai") por uma
+    variável: por exemplo, x1^2 x2 = (x1 x2) * x1. Assim, cada linha custa exatamente
+    uma multiplicação por característica gerada, sem recalcular potências termo a termo.
+
+    Os monômios seguem a ordem graduada: primeiro o bias (se incluído), depois os de
+    grau 1, grau 2 e assim por diante, cada grau em ordem lexicográfica das variáveis.
+    Para 2 entradas e grau 2: (1, x1, x2, x1^2, x1x2, x2^2).
+
+    Uma instância é uma etapa de linha (`Stage`), então pode ser usada em `LazyFeatures`.
+
+    Args:
+        degree (int): O grau máximo dos monômios.
+        n_inputs (int): O número de variáveis de entrada.
+        include_bias (bool): Se o monômio constante 1 deve ser incluído.
+    """
+
+    def __init__(self, degree: int, n_inputs: int, include_bias: bool = True) -> None:
+        """Calcula o plano de monômios.
+
+        Args:
+            degree (int): O grau máximo dos monômios.
+            n_inputs (int): O número de variáveis de entrada.
+            include_bias (bool): Se o monômio constante 1 deve ser incluído.
+
+        Raises:
+            ValueError: Se o grau for negativo ou não houver variáveis de entrada.
+        """
+        if degree < 0 or n_inputs < 1:
+            raise ValueError("O grau deve ser >= 0 e deve haver ao menos uma entrada")
+
+        self.degree = degree
+        self.n_inputs = n_inputs
+        self.include_bias = include_bias
+
+        # O monômio 0 é o constante 1. Cada entrada do plano é (índice do pai, variável),
+        # e `last_var` guarda a última variável de cada monômio: os filhos só multiplicam
+        # variáveis >= a ela, para que cada monômio seja gerado uma única vez.
+        self.powers: List[Tuple[int, ...]] = [(0,) * n_inputs]
+        self._plan: List[Tuple[int, int]] = []
+        last_var = [0]
+        previous_degree = [0]
+        for _ in range(degree):
+            current_degree = []
+            for parent in previous_degree:
+                for var in range(last_var[parent], n_inputs):
+                    exponents = list(self.powers[parent])
+                    exponents[var] += 1
+                    self.powers.append(tuple(exponents))
+                    self._plan.append((parent, var))
+                    last_var.append(var)
+                    current_degree.append(len(self.powers) - 1)
+            previous_degree = current_degree
+
+        if not include_bias:
+            self.powers = self.powers[1:]
+
+    @property
+    def n_output_features(self) -> int:
+        """Retorna o número de características geradas.
+
+        Returns:
+            int: O número de monômios.
+        """
+        return len(self.powers)
+
+    def __call__(self, x: Sequence[float]) -> Tuple[float, ...]:
+        """Transforma um ponto no vetor de monômios.
+
+        Args:
+            x (Sequence[float]): O ponto, com `n_inputs` coordenadas.
+
+        Returns:
+            Tuple[float, ...]: Os monômios, na ordem de `powers`.
+        """
+        values = [1.0]
+        append = values.append
+        for parent, var in self._plan:
+            append(values[parent] * x[var])
+        return tuple(values) if self.include_bias else tuple(values[1:])
+
+    def transform_columns(
+        self, columns: Sequence[Sequence[float]]
+    ) -> List[List[float]]:
+        """Transforma um bloco de amostras dado por colunas (uma por variável).
+
+        É o caminho em blocos: cada coluna gerada é o produto, elemento a elemento, da
+        coluna do pai pela coluna da variável, feito por `map` em C.
+
+        Args:
+            columns (Sequence[Sequence[float]]): As `n_inputs` colunas do bloco.
+
+        Returns:
+            List[List[float]]: As colunas dos monômios, na ordem de `powers`.
+        """
+        n_samples = len(columns[0]) if columns else 0
+        values: List[List[float]] = [[1.0] * n_samples]
+        for parent, var in self._plan:
+            values.append(list(map(mul, values[parent], columns[var])))
+        return values if self.include_bias else values[1:]
+
+    def transform(self, X: Iterable[Sequence[float]]) -> LazyFeatures:
+        """Aplica a transformação a X de forma preguiçosa.
+
+        Args:
+            X (Iterable[Sequence[float]]): A matriz de entrada.
+
+        Returns:
+            LazyFeatures: A matriz de monômios gerada sob demanda.
+        """
+        return LazyFeatures(X, self)
@@ -1,29 +1,551 @@
-from typing import List
+import math
+from itertools import chain
+from operator import mul
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 
+from constants import GRAM_CHUNK_SIZE
+from profiling import timed
+from solvers import (
+    SOLVERS,
+    Solver,
+    qr_solve,
+    qr_solve_many,
+    solve,
+    solve_many,
+    symmetric_eigen,
+)
 from utils import (
-    matrix_inverse,
-    matrix_multiply,
-    matrix_vector_multiply,
-    sign,
-    transpose,
+    accumulate_cross_products,
+    accumulate_normal_equations,
+    dot,
+    mirror_upper_triangle,
 )
 
-#  TODO: add docstrings to all methods
 
+class NormalEquations:
+    """Estatísticas suficientes dos mínimos quadrados, acumuladas bloco a bloco.
+
+    Guarda X^T X, X^T y, y^T y e o número de amostras. Isso basta para resolver as
+    equações normais e para calcular o erro quadrático de qualquer vetor de pesos, com
+    memória O(d^2) independente do número de amostras. Como todas as estatísticas são
+    somas sobre as amostras, estatísticas de partes disjuntas dos dados (por exemplo,
+    calculadas em processos diferentes) podem ser combinadas com `+`.
+    """
 
-class LinearRegression:
     def __init__(self) -> None:
-        self.weights: List[float] = []
+        """Inicializa as estatísticas vazias."""
+        self.X_T_X: List[List[float]] = []
+        self.X_T_y: List[float] = []
+        self.y_T_y = 0.0
+        self.n_samples = 0
 
-    def fit(self, X: List[List[float]], y: List[float]) -> None:
-        X_T = transpose(X)
-        X_T_X = matrix_multiply(X_T, X)
-        X_T_X_inv = matrix_inverse(X_T_X)
-        X_T_y = matrix_vector_multiply(X_T, y)
-        self.weights = matrix_vector_multiply(X_T_X_inv, X_T_y)
+    def update(
+        self,
+        X: Iterable[Sequence[float]],
+        y: Iterable[float],
+        chunk_size: int = GRAM_CHUNK_SIZE,
+    ) -> None:
+        """Acumula as amostras de um bloco de dados.
 
-    def predict(self, X: List[List[float]]) -> List[float]:
+        Args:
+            X (Iterable[Sequence[float]]): As linhas do bloco (lista, gerador, `Matrix`...).
+            y (Iterable[float]): Os rótulos do bloco.
+            chunk_size (int): Quantas linhas são processadas de cada vez.
+
+        Raises:
+            ValueError: Se as linhas não tiverem todas o número de características das
+                já acumuladas.
+        """
+        n_samples, y_T_y = accumulate_normal_equations(
+            X, y, self.X_T_X, self.X_T_y, chunk_size
+        )
+        mirror_upper_triangle(self.X_T_X)
+        self.n_samples += n_samples
+        self.y_T_y += y_T_y
+
+    def __add__(self, other: "NormalEquations") -> "NormalEquations":
+        """Combina as estatísticas de duas partes disjuntas dos dados.
+
+        Args:
+            other (NormalEquations): As estatísticas da outra parte.
+
+        Returns:
+            NormalEquations: As estatísticas de todos os dados (as parcelas não mudam).
+
+        Raises:
+            ValueError: Se as estatísticas tiverem números de características diferentes.
+        """
+        if self.X_T_y and other.X_T_y and len(self.X_T_y) != len(other.X_T_y):
+            raise ValueError("As estatísticas têm dimensões diferentes")
+
+        merged = NormalEquations()
+        if not other.X_T_y:
+            merged.X_T_X = [list(row) for row in self.X_T_X]
+            merged.X_T_y = list(self.X_T_y)
+        elif not self.X_T_y:
+            merged.X_T_X = [list(row) for row in other.X_T_X]
+            merged.X_T_y = list(other.X_T_y)
+        else:
+            merged.X_T_X = [
+                [a + b for a, b in zip(row_a, row_b)]
+                for row_a, row_b in zip(self.X_T_X, other.X_T_X)
+            ]
+            merged.X_T_y = [a + b for a, b in zip(self.X_T_y, other.X_T_y)]
+        merged.y_T_y = self.y_T_y + other.y_T_y
+        merged.n_samples = self.n_samples + other.n_samples
+        return merged
+
+    def __sub__(self, other: "NormalEquations") -> "NormalEquations":
+        """Remove as amostras de `other`, que devem ser parte das de `self`.
+
+        Serve para obter as estatísticas de treino de uma partição (por exemplo, um fold
+        da validação cruzada) a partir das estatísticas de todos os dados, sem rever as
+        amostras que ficam.
+
+        A diferença é feita em ponto flutuante, então sofre cancelamento: cada entrada
+        do resultado tem erro absoluto da ordem de ε vezes a entrada de `self` (ε ≈
+        2.2e-16), e não da entrada restante. Quando `other` é quase todo `self`, o
+        resultado é pequeno e o erro relativo cresce na mesma proporção (por exemplo,
+        remover 99% das amostras multiplica o erro relativo por cerca de 100). Nesses
+        casos, é melhor acumular as amostras restantes diretamente.
+
+        Args:
+            other (NormalEquations): As estatísticas das amostras a remover.
+
+        Returns:
+            NormalEquations: As estatísticas das amostras restantes.
+
+        Raises:
+            ValueError: Se as estatísticas tiverem números de características diferentes
+                ou `other` tiver mais amostras que `self`.
+        """
+        if not other.X_T_y:
+            return self + NormalEquations()
+        if len(self.X_T_y) != len(other.X_T_y):
+            raise ValueError("As estatísticas têm dimensões diferentes")
+        if other.n_samples > self.n_samples:
+            raise ValueError(
+                "Não é possível remover mais amostras do que as acumuladas"
+            )
+
+        remaining = NormalEquations()
+        remaining.X_T_X = [
+            [a - b for a, b in zip(row_a, row_b)]
+            for row_a, row_b in zip(self.X_T_X, other.X_T_X)
+        ]
+        remaining.X_T_y = [a - b for a, b in zip(self.X_T_y, other.X_T_y)]
+        remaining.y_T_y = self.y_T_y - other.y_T_y
+        remaining.n_samples = self.n_samples - other.n_samples
+        return remaining
+
+    def residual_sum_of_squares(self, weights: Sequence[float]) -> float:
+        """Calcula ||X w - y||^2 = y^T y - 2 w^T X^T y + w^T X^T X w sem rever os dados.
+
+        Args:
+            weights (Sequence[float]): O vetor de pesos w.
+
+        Returns:
+            float: A soma dos quadrados dos resíduos.
+        """
+        quadratic = dot(weights, [dot(row, weights) for row in self.X_T_X])
+        return self.y_T_y - 2 * dot(weights, self.X_T_y) + quadratic
+
+
+class LinearRegression:
+    """Regressão Linear para classificação, pelos mínimos quadrados.
+
+    Os pesos minimizam ||X w - y||^2 (mais λ ||w||^2, com decaimento de pesos) e a
+    classificação é o sinal de w · x. X já deve incluir a coluna do bias.
+
+    Args:
+        solver (Solver): O método de resolução dos mínimos quadrados.
+        weight_decay (float): O λ do decaimento de pesos.
+    """
+
+    def __init__(self, solver: Solver = "cholesky", weight_decay: float = 0.0) -> None:
+        """Inicializa a Regressão Linear com o método de resolução escolhido.
+
+        Args:
+            solver (Solver): Como resolver os mínimos quadrados: "cholesky" (padrão,
+                com eliminação de Gauss como reserva) ou "gauss" sobre as equações
+                normais X^T X w = X^T y, "qr" diretamente sobre X (para projetos mal
+                condicionados) ou "inverse" (inversa explícita de X^T X).
+            weight_decay (float): O λ do decaimento de pesos (ridge): minimiza
+                ||X w - y||^2 + λ ||w||^2, isto é, resolve (X^T X + λI) w = X^T y. O
+                bias também é regularizado, como no livro. Por padrão, 0 (sem
+                regularização).
+
+        Raises:
+            ValueError: Se o método não for suportado ou λ for negativo.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Método de resolução desconhecido: {solver}")
+        if weight_decay < 0:
+            raise ValueError(f"O decaimento de pesos deve ser >= 0: {weight_decay}")
+
+        self.solver = solver
+        self.weight_decay = weight_decay
+        self.statistics = NormalEquations()
+        self._weights: List[float] = []
+        self._pending = False
+        # Autodecomposição de X^T X calculada por fit_path, junto com as estatísticas
+        # (e o n) de que ela saiu; fit e partial_fit a descartam
+        self._eigen: Optional[
+            Tuple[NormalEquations, int, List[float], List[List[float]]]
+        ] = None
+
+    @classmethod
+    def from_statistics(
+        cls,
+        statistics: NormalEquations,
+        solver: Solver = "cholesky",
+        weight_decay: float = 0.0,
+    ) -> "LinearRegression":
+        """Cria um modelo a partir de estatísticas já acumuladas (e possivelmente somadas).
+
+        Args:
+            statistics (NormalEquations): As estatísticas suficientes dos dados.
+            solver (Solver): O método de resolução das equações normais.
+            weight_decay (float): O λ do decaimento de pesos.
+
+        Returns:
+            LinearRegression: O modelo, que é resolvido no primeiro acesso aos pesos.
+
+        Raises:
+            ValueError: Se o método de resolução for "qr", que precisa de X inteiro.
+        """
+        if solver == "qr":
+            raise ValueError("from_statistics não é suportado com o método 'qr'")
+
+        model = cls(solver, weight_decay)
+        model.statistics = statistics
+        model._pending = True
+        return model
+
+    @property
+    def weights(self) -> List[float]:
+        """Retorna os pesos, resolvendo as equações normais se houver dados pendentes.
+
+        Returns:
+            List[float]: O vetor de pesos w.
+        """
+        if self._pending:
+            self.finalize()
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: List[float]) -> None:
+        """Define os pesos diretamente, descartando a solução pendente.
+
+        Args:
+            weights (List[float]): O vetor de pesos w.
+        """
+        self._weights = weights
+        self._pending = False
+
+    @timed("LinearRegression.fit")
+    def fit(self, X: Iterable[Sequence[float]], y: Iterable[float]) -> None:
+        """Ajusta o modelo a um conjunto de dados, descartando o que foi acumulado antes.
+
+        Com "qr", X é decomposta diretamente (o decaimento entra como linhas √λ I a
+        mais); com os outros métodos, equivale a `partial_fit(X, y)` seguido de
+        `finalize()`.
+
+        Args:
+            X (Iterable[Sequence[float]]): A matriz de características (já transformada,
+                incluindo a coluna do bias), uma amostra por linha.
+            y (Iterable[float]): Os rótulos.
+
+        Raises:
+            ValueError: Se as linhas tiverem tamanhos diferentes ou os mínimos
+                quadrados não tiverem solução única.
+        """
+        self.statistics = NormalEquations()
+        self._eigen = None
+        if self.solver == "qr":
+            if self.weight_decay:
+                # ||X w - y||^2 + λ||w||^2 = ||[X; √λ I] w - [y; 0]||^2
+                X = list(X)
+                n_features = len(X[0])
+                X = chain(X, self._decay_rows(n_features))
+                y = chain(y, [0.0] * n_features)
+            self.weights = qr_solve(X, y)
+            return
+
+        self.partial_fit(X, y)
+        self.finalize()
+
+    @timed("LinearRegression.accumulate")
+    def partial_fit(
+        self, X_chunk: Iterable[Sequence[float]], y_chunk: Iterable[float]
+    ) -> None:
+        """Acumula um bloco de dados sem resolver o modelo.
+
+        Só as estatísticas suficientes (X^T X, X^T y, y^T y e n) são guardadas, então os
+        blocos podem vir de geradores ou arquivos e o total de amostras não precisa caber
+        em memória. A solução é calculada em `finalize()` ou no próximo acesso a `weights`.
+
+        Args:
+            X_chunk (Iterable[Sequence[float]]): As linhas do bloco.
+            y_chunk (Iterable[float]): Os rótulos do bloco.
+
+        Raises:
+            ValueError: Se o método de resolução for "qr", que precisa de X inteiro, ou
+                as linhas não tiverem o número de características das já acumuladas.
+        """
+        if self.solver == "qr":
+            raise ValueError("partial_fit não é suportado com o método 'qr'")
+
+        self.statistics.update(X_chunk, y_chunk)
+        self._eigen = None
+        self._pending = True
+
+    @timed("LinearRegression.solve")
+    def finalize(self) -> List[float]:
+        """Resolve as equações normais com as estatísticas acumuladas até agora.
+
+        Returns:
+            List[float]: O vetor de pesos w.
+
+        Raises:
+            ValueError: Se nenhuma amostra foi acumulada.
+        """
+        if not self.statistics.n_samples:
+            raise ValueError("Nenhuma amostra foi acumulada")
+
+        X_T_X = self._regularized(self.statistics.X_T_X)
+        self.weights = solve(X_T_X, self.statistics.X_T_y, self.solver)
+        return self._weights
+
+    def _regularized(self, X_T_X: List[List[float]]) -> List[List[float]]:
+        """Soma λ à diagonal de X^T X (sem alterar a original), se houver decaimento."""
+        if not self.weight_decay:
+            return X_T_X
+        return [
+            [a + self.weight_decay if i == j else a for j, a in enumerate(row)]
+            for i, row in enumerate(X_T_X)
+        ]
+
+    def _decay_rows(self, n_features: int) -> List[List[float]]:
+        """As linhas √λ I que, acrescentadas a X (com rótulo 0), dão o decaimento no QR."""
+        root = math.sqrt(self.weight_decay)
         return [
-            sign(sum(self.weights[j] * x_i[j] for j in range(len(self.weights))))
-            for x_i in X
+            [root if j == i else 0.0 for j in range(n_features)]
+            for i in range(n_features)
         ]
+
+    @timed("LinearRegression.fit_targets")
+    def fit_targets(
+        self,
+        X: Iterable[Sequence[float]],
+        Y: Sequence[Sequence[float]],
+        layout: Literal["samples", "targets"] = "samples",
+    ) -> List[List[float]]:
+        """Ajusta vários vetores de rótulos sobre a mesma matriz de características.
+
+        X^T X é acumulada e fatorada uma única vez (ou, com "qr", as reflexões de X são
+        calculadas uma vez), e cada vetor de rótulos custa só X^T y_t e as substituições.
+        Serve, por exemplo, para comparar ruídos ou funções alvo diferentes sobre os
+        mesmos pontos. O modelo em si não é alterado.
+
+        Args:
+            X (Iterable[Sequence[float]]): A matriz de características (já transformada,
+                incluindo a coluna do bias), uma amostra por linha.
+            Y (Sequence[Sequence[float]]): Os rótulos: uma matriz n x k, com os k
+                rótulos de cada amostra por linha ("samples"), ou uma sequência de k
+                vetores de rótulos ("targets").
+            layout (Literal["samples", "targets"]): Como Y está organizada.
+
+        Returns:
+            List[List[float]]: Os k vetores de pesos, um por vetor de rótulos (a matriz
+                de pesos, transposta).
+
+        Raises:
+            ValueError: Se o layout for desconhecido ou os tamanhos não baterem.
+        """
+        if layout not in ("samples", "targets"):
+            raise ValueError(f"Layout desconhecido: {layout}")
+
+        rows = list(X)
+        if layout == "samples":
+            n_targets = len(Y[0]) if Y else 0
+            if len(Y) != len(rows) or any(len(labels) != n_targets for labels in Y):
+                raise ValueError("Cada amostra deve ter um rótulo por vetor de rótulos")
+        else:
+            n_targets = len(Y)
+            if any(len(y) != len(rows) for y in Y):
+                raise ValueError("Cada vetor de rótulos deve ter um rótulo por amostra")
+        if not n_targets:
+            return []
+
+        if self.solver == "qr":
+            # As reflexões são aplicadas a cada vetor de rótulos inteiro
+            targets = [list(y) for y in (zip(*Y) if layout == "samples" else Y)]
+            if self.weight_decay:
+                n_features = len(rows[0])
+                rows += self._decay_rows(n_features)
+                targets = [y + [0.0] * n_features for y in targets]
+            return qr_solve_many(rows, targets)
+
+        # X^T X e os X^T y_t são acumulados em blocos de amostras, sem transpor X nem Y
+        # por inteiro: o primeiro vetor de rótulos entra junto com X^T X, e os demais
+        # linha a linha
+        if layout == "samples":
+            first: Iterable[float] = (labels[0] for labels in Y)
+            others: Iterable[Sequence[float]] = (labels[1:] for labels in Y)
+        else:
+            first, others = Y[0], zip(*Y[1:])
+        statistics = NormalEquations()
+        statistics.update(rows, first)
+        X_T_Y: List[List[float]] = []
+        accumulate_cross_products(rows, others, X_T_Y)
+        return solve_many(
+            self._regularized(statistics.X_T_X),
+            [statistics.X_T_y, *X_T_Y],
+            self.solver,
+        )
+
+    @timed("LinearRegression.fit_path")
+    def fit_path(
+        self,
+        X: Optional[Iterable[Sequence[float]]],
+        y: Optional[Iterable[float]],
+        lambdas: Sequence[float],
+        X_val: Optional[Sequence[Sequence[float]]] = None,
+        y_val: Optional[Sequence[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Ajusta o decaimento de pesos para vários λ, fatorando X^T X uma única vez.
+
+        Com X^T X = V diag(e) V^T (método de Jacobi) e c = V^T X^T y, a solução de cada λ é
+            w(λ) = V diag(1 / (e + λ)) c,
+        que custa O(d^2), em vez de acumular e resolver tudo de novo. Com dados de
+        validação, a saída de cada λ sai direto dos pesos, em O(n_val d), sem transpor
+        nem projetar X_val.
+
+        A decomposição fica guardada no modelo até as estatísticas mudarem (`fit`,
+        `partial_fit` ou outro `fit_path` com dados). Com X e y None, o caminho é
+        calculado sobre as estatísticas já acumuladas, reaproveitando a decomposição:
+        varrer outros λ (ou outra validação) nos mesmos dados não refaz o método de
+        Jacobi.
+
+        Ao final, o modelo fica com o λ de menor erro de classificação na validação (em
+        caso de empate, o de menor erro quadrático), ou com o último λ sem validação.
+
+        Args:
+            X (Optional[Iterable[Sequence[float]]]): A matriz de características de
+                treinamento, ou None para usar as estatísticas já acumuladas.
+            y (Optional[Iterable[float]]): Os rótulos de treinamento, ou None junto
+                com X.
+            lambdas (Sequence[float]): Os valores de λ (>= 0).
+            X_val (Optional[Sequence[Sequence[float]]]): As características de validação.
+            y_val (Optional[Sequence[float]]): Os rótulos de validação.
+
+        Returns:
+            List[Dict[str, Any]]: Para cada λ, na ordem dada: "lambda", "weights",
+                "train_mse" (erro quadrático médio no treino) e, com validação,
+                "val_mse" e "val_error" (fração de sinais errados).
+
+        Raises:
+            ValueError: Se não houver λ, algum for negativo, só um de X e y (ou dos
+                dados de validação) for dado, não houver dados acumulados ou
+                X^T X + λI for singular.
+        """
+        if not lambdas:
+            raise ValueError("Nenhum valor de λ foi dado")
+        if any(weight_decay < 0 for weight_decay in lambdas):
+            raise ValueError("Os valores de λ devem ser >= 0")
+        if (X_val is None) != (y_val is None):
+            raise ValueError("X_val e y_val devem ser dados juntos")
+        if (X is None) != (y is None):
+            raise ValueError("X e y devem ser dados juntos")
+
+        if X is not None and y is not None:
+            self.statistics = NormalEquations()
+            self.statistics.update(X, y)
+            self._eigen = None
+        statistics = self.statistics
+        if not statistics.n_samples:
+            raise ValueError("Não há dados acumulados para ajustar")
+
+        cached = self._eigen
+        if (
+            cached is None
+            or cached[0] is not statistics
+            or cached[1] != statistics.n_samples
+        ):
+            eigenvalues, V = symmetric_eigen(statistics.X_T_X)
+            self._eigen = statistics, statistics.n_samples, eigenvalues, V
+        else:
+            eigenvalues, V = cached[2], cached[3]
+        # c = V^T X^T y, uma coluna de V (um autovetor) por vez
+        projected = [dot(column, self.statistics.X_T_y) for column in zip(*V)]
+
+        path: List[Dict[str, Any]] = []
+        for weight_decay in lambdas:
+            if any(e + weight_decay <= 0 for e in eigenvalues):
+                raise ValueError(f"X^T X + λI é singular para λ = {weight_decay}")
+            coefficients = [
+                c / (e + weight_decay) for c, e in zip(projected, eigenvalues)
+            ]
+            weights = [dot(row, coefficients) for row in V]
+
+            point: Dict[str, Any] = {
+                "lambda": weight_decay,
+                "weights": weights,
+                "train_mse": self.statistics.residual_sum_of_squares(weights)
+                / self.statistics.n_samples,
+            }
+            if X_val is not None and y_val is not None:
+                outputs = [dot(x, weights) for x in X_val]
+                point["val_mse"] = sum(
+                    (output - target) ** 2 for output, target in zip(outputs, y_val)
+                ) / len(y_val)
+                point["val_error"] = sum(
+                    (1 if output >= 0 else -1) != target
+                    for output, target in zip(outputs, y_val)
+                ) / len(y_val)
+            path.append(point)
+
+        best = path[-1]
+        if X_val is not None:
+            best = min(path, key=lambda point: (point["val_error"], point["val_mse"]))
+        self.weight_decay = best["lambda"]
+        self.weights = best["weights"]
+        return path
+
+    def decision_function(self, X: Sequence[Sequence[float]]) -> List[float]:
+        """Calcula a saída real w · x_i de todas as amostras, sem aplicar o sinal.
+
+        Args:
+            X (Sequence[Sequence[float]]): A matriz de características (já transformada,
+                incluindo a coluna do bias), uma amostra por linha.
+
+        Returns:
+            List[float]: A saída real de cada amostra.
+        """
+        weights = self.weights
+        return [sum(map(mul, weights, x_i)) for x_i in X]
+
+    @timed("LinearRegression.predict")
+    def predict_batch(self, X: Sequence[Sequence[float]]) -> List[int]:
+        """Classifica todas as amostras de uma matriz pelo sinal de w · x_i.
+
+        Args:
+            X (Sequence[Sequence[float]]): A matriz de características (já transformada,
+                incluindo a coluna do bias), uma amostra por linha.
+
+        Returns:
+            List[int]: O rótulo predito para cada amostra (1 ou -1).
+        """
+        return [1 if z >= 0 else -1 for z in self.decision_function(X)]
+
+    def predict(self, X: List[List[float]]) -> List[float]:
+        """Classifica todas as amostras de uma matriz (o mesmo que `predict_batch`).
+
+        Args:
+            X (List[List[float]]): A matriz de características, uma amostra por linha.
+
+        Returns:
+            List[float]: O rótulo predito para cada amostra (1 ou -1).
+        """
+        return self.predict_batch(X)
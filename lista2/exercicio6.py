@@ -1,33 +1,49 @@
-import itertools
 from typing import Callable, Dict, List, Literal, Tuple
 
+from bitmask_scoring import (
+    agreement_histogram,
+    histogram_score,
+    truth_table_mask,
+    unobserved_inputs,
+)
+from registry import lazy_instructions
 from utils import Color
 
-INSTRUCTIONS = (
-    f"{Color.text('Pontuação =', Color.BRIGHT_BLUE)}\n"
-    f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em todos os 3 pontos)', Color.BRIGHT_PURPLE)} {Color.text('× 3', Color.BRIGHT_GREEN)} +\n"
-    f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em exatamente 2 pontos)', Color.PURPLE)} {Color.text('× 2', Color.GREEN)} +\n"
-    f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em exatamente 1 ponto)', Color.TEAL)} {Color.text('× 1', Color.YELLOW)} +\n"
-    f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em 0 pontos)', Color.CYAN)} {Color.text('× 0', Color.RED)}.\n\n"
-    f"{Color.text('6. Qual hipótese g concorda mais com as possíveis funções alvo em termos da pontuação acima?', Color.BRIGHT_CYAN)}\n\n"
-    f"{Color.text('a)', Color.ORANGE)} {Color.text('g(x) = 1', Color.BRIGHT_RED)}\n"
-    f"{Color.text('b)', Color.ORANGE)} {Color.text('g(x) = 0', Color.RED)}\n"
-    f"{Color.text('c)', Color.ORANGE)} {Color.text('g é a função XOR, ou seja, g(x) = 1 se o número de 1s em x for ímpar,', Color.BRIGHT_PURPLE)} {Color.text('caso contrário g(x) = 0', Color.PURPLE)}\n"
-    f"{Color.text('d)', Color.ORANGE)} {Color.text('g é o oposto da função XOR, ou seja, g(x) = 1 se o número de 1s em x for par,', Color.BRIGHT_TEAL)} {Color.text('caso contrário g(x) = 0', Color.TEAL)}\n"
-    f"{Color.text('e)', Color.ORANGE)} {Color.text('Elas são todas equivalentes (mesma pontuação para g em [a] até [d]).', Color.BRIGHT_ORANGE)}"
-)
+
+def _instructions() -> str:
+    """Monta o enunciado colorido do exercício (só quando ele é exibido)."""
+    return (
+        f"{Color.text('Pontuação =', Color.BRIGHT_BLUE)}\n"
+        f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em todos os 3 pontos)', Color.BRIGHT_PURPLE)} {Color.text('× 3', Color.BRIGHT_GREEN)} +\n"
+        f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em exatamente 2 pontos)', Color.PURPLE)} {Color.text('× 2', Color.GREEN)} +\n"
+        f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em exatamente 1 ponto)', Color.TEAL)} {Color.text('× 1', Color.YELLOW)} +\n"
+        f"\t{Color.text('(Número de funções alvo que concordam com a hipótese em 0 pontos)', Color.CYAN)} {Color.text('× 0', Color.RED)}.\n\n"
+        f"{Color.text('6. Qual hipótese g concorda mais com as possíveis funções alvo em termos da pontuação acima?', Color.BRIGHT_CYAN)}\n\n"
+        f"{Color.text('a)', Color.ORANGE)} {Color.text('g(x) = 1', Color.BRIGHT_RED)}\n"
+        f"{Color.text('b)', Color.ORANGE)} {Color.text('g(x) = 0', Color.RED)}\n"
+        f"{Color.text('c)', Color.ORANGE)} {Color.text('g é a função XOR, ou seja, g(x) = 1 se o número de 1s em x for ímpar,', Color.BRIGHT_PURPLE)} {Color.text('caso contrário g(x) = 0', Color.PURPLE)}\n"
+        f"{Color.text('d)', Color.ORANGE)} {Color.text('g é o oposto da função XOR, ou seja, g(x) = 1 se o número de 1s em x for par,', Color.BRIGHT_TEAL)} {Color.text('caso contrário g(x) = 0', Color.TEAL)}\n"
+        f"{Color.text('e)', Color.ORANGE)} {Color.text('Elas são todas equivalentes (mesma pontuação para g em [a] até [d]).', Color.BRIGHT_ORANGE)}"
+    )
+
+
+__getattr__ = lazy_instructions(__name__, _instructions)
+"""Constrói `INSTRUCTIONS` sob demanda, para que importar o exercício seja rápido."""
+
 
 T = Literal[1, 0]
 
-# Definição dos pontos não observados (101, 110, 111)
-unobserved_points: List[Tuple[T, T, T]] = [
-    (1, 0, 1),
-    (1, 1, 0),
-    (1, 1, 1),
+# Pontos observados no conjunto de treinamento (000, 001, 010, 011, 100)
+observed_points: List[Tuple[T, T, T]] = [
+    (0, 0, 0),
+    (0, 0, 1),
+    (0, 1, 0),
+    (0, 1, 1),
+    (1, 0, 0),
 ]
 
-# Geração das funções alvo possíveis (8 combinações de 0s e 1s para os 3 pontos não observados)
-target_functions: List[Tuple[T, ...]] = list(itertools.product([0, 1], repeat=3))
+# Definição dos pontos não observados (101, 110, 111)
+unobserved_points: List[Tuple[T, ...]] = unobserved_inputs(3, observed_points)
 
 
 def hypothesis_a(x: Tuple[T, T, T]) -> T:
@@ -81,24 +97,21 @@ def hypothesis_d(x: Tuple[T, T, T]) -> T:
 def calculate_scores(hypothesis: Callable[[Tuple[T, T, T]], T]) -> int:
     """Calcula a pontuação da hipótese com base na concordância com as funções alvo possíveis.
 
+    A hipótese vira uma máscara de bits nos pontos não observados, e o histograma de
+    concordância com as 2^k funções alvo sai em forma fechada (veja `bitmask_scoring`),
+    sem enumerar os alvos.
+
     Args:
         hypothesis (Callable[[Tuple[T, T, T]], T]): A hipótese a ser avaliada.
 
     Returns:
         int: A pontuação da hipótese.
     """
-    scores = [0, 0, 0, 0]  # Contador para concordância em 3, 2, 1, 0 pontos
-
-    for fn in target_functions:
-        agreement = 0
-        for i, point in enumerate(unobserved_points):
-            if hypothesis(point) == fn[i]:
-                agreement += 1
-
-        scores[agreement] += 1
-
-    final_score = sum(scores[i] * i for i in range(4))
-    return final_score
+    k = len(unobserved_points)
+    mask = truth_table_mask(hypothesis, unobserved_points)
+    # Contador para concordância em 0, 1, ..., k pontos
+    scores = agreement_histogram(mask, k)
+    return histogram_score(scores)
 
 
 hypotheses: Dict[str, Callable[[Tuple[T, T, T]], T]] = {
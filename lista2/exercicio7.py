@@ -1,48 +1,105 @@
+import random
+import sys
 from string import ascii_lowercase
+from typing import Dict, List, Sequence
 
-from perceptron import Perceptron
+from registry import lazy_instructions
 from utils import Color, generate_data
 
-INSTRUCTIONS = (
-    f"{Color.text('Para obter uma estimativa confiável dessas duas quantidades, você deve repetir o experimento ', Color.BRIGHT_CYAN)}"
-    f"{Color.text('1000 vezes', Color.BRIGHT_RED)} "
-    f"{Color.text('(cada execução conforme especificado acima) e calcular a média sobre essas execuções.', Color.BRIGHT_CYAN)}\n\n"
-    f"{Color.text('7. Considere N = 10. Quantas iterações, em média, são necessárias para que o PLA converja ', Color.BRIGHT_BLUE)}"
-    f"{Color.text('com N = 10 pontos de treinamento?', Color.BRIGHT_BLUE)}\n"
-    f"{Color.text('Escolha o valor mais próximo dos seus resultados.', Color.BRIGHT_PURPLE)}\n"
-    f"{Color.text('(\'mais próximo\' significa: |sua resposta - opção dada| é a mais próxima de 0).', Color.TEAL)}"
-)
 
+def _instructions() -> str:
+    """Monta o enunciado colorido do exercício (só quando ele é exibido)."""
+    return (
+        f"{Color.text('Para obter uma estimativa confiável dessas duas quantidades, você deve repetir o experimento ', Color.BRIGHT_CYAN)}"
+        f"{Color.text('1000 vezes', Color.BRIGHT_RED)} "
+        f"{Color.text('(cada execução conforme especificado acima) e calcular a média sobre essas execuções.', Color.BRIGHT_CYAN)}\n\n"
+        f"{Color.text('7. Considere N = 10. Quantas iterações, em média, são necessárias para que o PLA converja ', Color.BRIGHT_BLUE)}"
+        f"{Color.text('com N = 10 pontos de treinamento?', Color.BRIGHT_BLUE)}\n"
+        f"{Color.text('Escolha o valor mais próximo dos seus resultados.', Color.BRIGHT_PURPLE)}\n"
+        f"{Color.text('(\'mais próximo\' significa: |sua resposta - opção dada| é a mais próxima de 0).', Color.TEAL)}"
+    )
+
+
+__getattr__ = lazy_instructions(__name__, _instructions)
+"""Constrói `INSTRUCTIONS` sob demanda, para que importar o exercício seja rápido."""
+
+
+N_RUNS = 1000
+"""Número máximo de execuções do experimento."""
+
+N_POINTS = 10
+"""Número de pontos de treinamento de cada execução."""
+
+ALTERNATIVES = {"iterations": [1, 15, 300, 5000, 10000]}
+"""As opções de resposta de cada métrica."""
+
+
+def simulate_run(rng: random.Random) -> Dict[str, float]:
+    """Executa o PLA uma vez com N_POINTS pontos.
+
+    Args:
+        rng (random.Random): O gerador aleatório desta execução.
+
+    Returns:
+        Dict[str, float]: O número de iterações até a convergência.
+    """
+    from perceptron import Perceptron
+
+    X, y = generate_data(N_POINTS, rng=rng)
+    pla = Perceptron(n_iters=1000, rng=rng)
+    pla.fit(X, y)
+    return {"iterations": pla.iterations}
 
-def run() -> None:
-    """Executa o experimento para calcular o número médio de iterações até a convergência do PLA."""
-    n_runs = 1000
-    total_iterations = 0
-    n_points = 10
-
-    for i in range(n_runs):
-        print(
-            Color.text(
-                f"Executando iteração {i + 1} de {n_runs}...", Color.BRIGHT_YELLOW
-            ),
-            end="\r",
-            flush=True,
-        )
-        X, y = generate_data(n_points)
-        pla = Perceptron(n_iters=1000)
-        pla.fit(X, y)
-        total_iterations += pla.iterations
 
-    average_iterations = total_iterations / n_runs
+def simulate_runs(rngs: Sequence[random.Random]) -> List[Dict[str, float]]:
+    """Executa várias vezes o PLA de uma só vez, com `fit_batch`.
+
+    O resultado de cada execução é o mesmo de `simulate_run` com o mesmo gerador. Com o
+    NumPy instalado, as varreduras são vetorizadas entre as execuções (o resultado não
+    muda).
+
+    Args:
+        rngs (Sequence[random.Random]): Um gerador aleatório por execução.
+
+    Returns:
+        List[Dict[str, float]]: O número de iterações de cada execução.
+    """
+    from perceptron import fit_batch
+
+    try:
+        import numpy  # noqa: F401
+
+        backend = "numpy"
+    except ImportError:
+        backend = "python"
+
+    data = [generate_data(N_POINTS, rng=rng) for rng in rngs]
+    _, iterations = fit_batch(
+        [X for X, _ in data],
+        [y for _, y in data],
+        n_iters=1000,
+        rngs=rngs,
+        backend=backend,
+    )
+    return [{"iterations": n_iterations} for n_iterations in iterations]
+
+
+def report(summary: Dict[str, float]) -> None:
+    """Exibe a média de iterações e a alternativa mais próxima.
+
+    Args:
+        summary (Dict[str, float]): A média das métricas sobre as execuções.
+    """
+    average_iterations = summary["iterations"]
 
     print(
         Color.text(
-            f"\nMédia de iterações para convergência com N = {n_points}: {average_iterations}",
+            f"Média de iterações para convergência com N = {N_POINTS}: {average_iterations}",
             Color.BRIGHT_CYAN,
         )
     )
 
-    alternatives = zip(ascii_lowercase, [1, 15, 300, 5000, 10000])
+    alternatives = zip(ascii_lowercase, ALTERNATIVES["iterations"])
     closest = min(alternatives, key=lambda x: abs(x[1] - average_iterations))
     print(
         Color.text(
@@ -52,5 +109,13 @@ def run() -> None:
     )
 
 
+def run() -> None:
+    """Executa o experimento para calcular o número médio de iterações até a convergência do PLA."""
+    from experiment import report_experiment, run_experiment
+
+    module = sys.modules[__name__]
+    report_experiment(module, run_experiment(module))
+
+
 if __name__ == "__main__":
     run()
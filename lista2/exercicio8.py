@@ -1,7 +1,11 @@
+import random
+import sys
 from string import ascii_lowercase
-from typing import List, Tuple, Union
+from typing import Dict, List, Union
 
-from perceptron import Perceptron
+from disagreement import disagreement
+from profiling import phase
+from registry import lazy_instructions
 from utils import (
     Color,
     evaluate_target_function,
@@ -9,81 +13,88 @@ from utils import (
     generate_target_function,
 )
 
-INSTRUCTIONS = (
-    f"{Color.text('8. Qual das seguintes opções está mais próxima de P[f(x) ≠ g(x)] para N = 10?', Color.BRIGHT_CYAN)}\n"
-    f"{Color.text('[a] 0.001', Color.BRIGHT_RED)}\n"
-    f"{Color.text('[b] 0.01', Color.BRIGHT_RED)}\n"
-    f"{Color.text('[c] 0.1', Color.BRIGHT_RED)}\n"
-    f"{Color.text('[d] 0.5', Color.BRIGHT_RED)}"
-)
+
+def _instructions() -> str:
+    """Monta o enunciado colorido do exercício (só quando ele é exibido)."""
+    return (
+        f"{Color.text('8. Qual das seguintes opções está mais próxima de P[f(x) ≠ g(x)] para N = 10?', Color.BRIGHT_CYAN)}\n"
+        f"{Color.text('[a] 0.001', Color.BRIGHT_RED)}\n"
+        f"{Color.text('[b] 0.01', Color.BRIGHT_RED)}\n"
+        f"{Color.text('[c] 0.1', Color.BRIGHT_RED)}\n"
+        f"{Color.text('[d] 0.5', Color.BRIGHT_RED)}"
+    )
+
+
+__getattr__ = lazy_instructions(__name__, _instructions)
+"""Constrói `INSTRUCTIONS` sob demanda, para que importar o exercício seja rápido."""
 
 
-def simulate_run(n_points: int, n_test_points: int = 1000) -> Tuple[int, float]:
+N_RUNS = 1000
+"""Número máximo de execuções do experimento."""
+
+N_POINTS = 10
+"""Número de pontos de treinamento de cada execução."""
+
+ALTERNATIVES = {
+    "iterations": [1, 15, 300, 5000, 10000],
+    "disagreement": [0.001, 0.01, 0.1, 0.5],
+}
+"""As opções de resposta de cada métrica (as iterações usam as da questão 7, que também
+tem N = 10)."""
+
+
+def simulate_run(rng: random.Random) -> Dict[str, float]:
     """Simula uma execução do Perceptron Learning Algorithm.
 
     Args:
-        n_points (int): Número de pontos de treinamento.
-        n_test_points (int): Número de pontos de teste para estimar P[f(x) ≠ g(x)].
+        rng (random.Random): O gerador aleatório desta execução.
 
     Returns:
-        Tuple[int, float]: Número de iterações para convergência e a estimativa de P[f(x) ≠ g(x)].
+        Dict[str, float]: Número de iterações para convergência e P[f(x) ≠ g(x)], exato
+            (a hipótese do Perceptron é uma reta).
     """
-    point1, point2 = generate_target_function()
+    from perceptron import Perceptron
+
+    point1, point2 = generate_target_function(rng=rng)
 
-    X_train, y_train = generate_data(n_points)
+    X_train, y_train = generate_data(N_POINTS, rng=rng)
     y_train: List[Union[int, float]] = [
         evaluate_target_function(point1, point2, x) for x in X_train
     ]
 
-    pla = Perceptron(n_iters=1000)
+    pla = Perceptron(n_iters=1000, rng=rng)
     pla.fit(X_train, y_train)
 
-    X_test, _ = generate_data(n_test_points)
-    y_test_f = [evaluate_target_function(point1, point2, x) for x in X_test]
-    y_test_g = [pla.predict([1] + x) for x in X_test]
+    with phase("score"):
+        # Calcula P[f(x) ≠ g(x)] pela área entre as retas de f e g
+        probability = disagreement(point1, point2, pla.weights)
 
-    # Calcula P[f(x) ≠ g(x)]
-    disagreement = sum(1 if f != g else 0 for f, g in zip(y_test_f, y_test_g)) / len(
-        y_test_f
-    )
+    return {"iterations": pla.iterations, "disagreement": probability}
 
-    return pla.iterations, disagreement
 
+def report(summary: Dict[str, float]) -> None:
+    """Exibe as médias de iterações e de P[f(x) ≠ g(x)] e a alternativa mais próxima.
 
-def run() -> None:
-    """Roda a simulação 1000 vezes e calcula as médias de iterações e P[f(x) ≠ g(x)]."""
-    total_iterations = 0
-    total_disagreement = 0
-    n_runs = 1000
-    n_points = 10
-
-    for i in range(n_runs):
-        print(
-            Color.text(f"Simulação {i + 1} de {n_runs}...", Color.BRIGHT_YELLOW),
-            end="\r",
-            flush=True,
-        )
-        iterations, disagreement = simulate_run(n_points)
-        total_iterations += iterations
-        total_disagreement += disagreement
-
-    average_iterations = total_iterations / n_runs
-    average_disagreement = total_disagreement / n_runs
+    Args:
+        summary (Dict[str, float]): A média das métricas sobre as execuções.
+    """
+    average_iterations = summary["iterations"]
+    average_disagreement = summary["disagreement"]
 
     print(
         Color.text(
-            f"\nMédia de iterações para convergência com N = {n_points}: {average_iterations:.3f}",
+            f"Média de iterações para convergência com N = {N_POINTS}: {average_iterations:.3f}",
             Color.BRIGHT_CYAN,
         )
     )
     print(
         Color.text(
-            f"Média de P[f(x) ≠ g(x)] para N = {n_points}: {average_disagreement:.3f}",
+            f"Média de P[f(x) ≠ g(x)] para N = {N_POINTS}: {average_disagreement:.3f}",
             Color.BRIGHT_CYAN,
         )
     )
 
-    alternatives_disagreement = zip(ascii_lowercase, [0.001, 0.01, 0.1, 0.5])
+    alternatives_disagreement = zip(ascii_lowercase, ALTERNATIVES["disagreement"])
     closest_disagreement = min(
         alternatives_disagreement, key=lambda x: abs(x[1] - average_disagreement)
     )
@@ -95,5 +106,13 @@ def run() -> None:
     )
 
 
+def run() -> None:
+    """Roda a simulação (até N_RUNS vezes) e calcula as médias de iterações e P[f(x) ≠ g(x)]."""
+    from experiment import report_experiment, run_experiment
+
+    module = sys.modules[__name__]
+    report_experiment(module, run_experiment(module))
+
+
 if __name__ == "__main__":
     run()
@@ -1,60 +1,86 @@
+import random
+import sys
 from string import ascii_lowercase
+from typing import Dict
 
-from linear_regression import LinearRegression
+from profiling import phase
+from registry import lazy_instructions
 from utils import Color, generate_data_with_noise, without_transformation
 
-INSTRUCTIONS = (
-    f"{Color.text('Para obter uma estimativa confiável do erro de classificação in-sample (E_in), ', Color.BRIGHT_CYAN)}"
-    f"{Color.text('você deve realizar a Regressão Linear sem transformação, ou seja, usando o vetor de características ', Color.BRIGHT_CYAN)}"
-    f"{Color.text('(1, x1, x2).', Color.BRIGHT_RED)}\n\n"
-    f"{Color.text('8. Qual é o valor mais próximo do erro de classificação in-sample E_in? ', Color.BRIGHT_BLUE)}"
-    f"{Color.text('Execute o experimento 1000 vezes e tire a média de E_in para reduzir a variação nos seus resultados.', Color.BRIGHT_BLUE)}\n"
-    f"{Color.text('Escolha a opção mais próxima do seu resultado:', Color.BRIGHT_PURPLE)}\n"
-    f"{Color.text('[a] 0', Color.TEAL)}\n"
-    f"{Color.text('[b] 0.1', Color.TEAL)}\n"
-    f"{Color.text('[c] 0.3', Color.TEAL)}\n"
-    f"{Color.text('[d] 0.5', Color.TEAL)}\n"
-    f"{Color.text('[e] 0.8', Color.TEAL)}"
-)
 
+def _instructions() -> str:
+    """Monta o enunciado colorido do exercício (só quando ele é exibido)."""
+    return (
+        f"{Color.text('Para obter uma estimativa confiável do erro de classificação in-sample (E_in), ', Color.BRIGHT_CYAN)}"
+        f"{Color.text('você deve realizar a Regressão Linear sem transformação, ou seja, usando o vetor de características ', Color.BRIGHT_CYAN)}"
+        f"{Color.text('(1, x1, x2).', Color.BRIGHT_RED)}\n\n"
+        f"{Color.text('8. Qual é o valor mais próximo do erro de classificação in-sample E_in? ', Color.BRIGHT_BLUE)}"
+        f"{Color.text('Execute o experimento 1000 vezes e tire a média de E_in para reduzir a variação nos seus resultados.', Color.BRIGHT_BLUE)}\n"
+        f"{Color.text('Escolha a opção mais próxima do seu resultado:', Color.BRIGHT_PURPLE)}\n"
+        f"{Color.text('[a] 0', Color.TEAL)}\n"
+        f"{Color.text('[b] 0.1', Color.TEAL)}\n"
+        f"{Color.text('[c] 0.3', Color.TEAL)}\n"
+        f"{Color.text('[d] 0.5', Color.TEAL)}\n"
+        f"{Color.text('[e] 0.8', Color.TEAL)}"
+    )
 
-def run() -> None:
-    """Executa o experimento para calcular o erro médio in-sample (E_in) utilizando Regressão Linear."""
-    n_runs = 1000
-    n_points = 1000
-    total_e_in = 0.0
-
-    for i in range(n_runs):
-        print(
-            Color.text(
-                f"Executando iteração {i + 1} de {n_runs}...", Color.BRIGHT_YELLOW
-            ),
-            end="\r",
-            flush=True,
-        )
-        X, y = generate_data_with_noise(n_points=n_points, noise_percentage=0.1)
-        X_transformed = without_transformation(X)
 
-        model = LinearRegression()
-        model.fit(X_transformed, y)
-        predictions = model.predict(X_transformed)
+__getattr__ = lazy_instructions(__name__, _instructions)
+"""Constrói `INSTRUCTIONS` sob demanda, para que importar o exercício seja rápido."""
+
+
+N_RUNS = 1000
+"""Número máximo de execuções do experimento."""
+
+N_POINTS = 1000
+"""Número de pontos de treinamento de cada execução."""
+
+ALTERNATIVES = {"e_in": [0, 0.1, 0.3, 0.5, 0.8]}
+"""As opções de resposta de cada métrica."""
+
+
+def simulate_run(rng: random.Random) -> Dict[str, float]:
+    """Ajusta a Regressão Linear uma vez e calcula o erro in-sample.
+
+    Args:
+        rng (random.Random): O gerador aleatório desta execução.
 
-        # Calcular o erro E_in (erro in-sample)
+    Returns:
+        Dict[str, float]: O erro de classificação in-sample (E_in).
+    """
+    from linear_regression import LinearRegression
+
+    X, y = generate_data_with_noise(n_points=N_POINTS, noise_percentage=0.1, rng=rng)
+    X_transformed = without_transformation(X)
+
+    model = LinearRegression()
+    model.fit(X_transformed, y)
+    predictions = model.predict(X_transformed)
+
+    # Calcular o erro E_in (erro in-sample)
+    with phase("score"):
         e_in = (
-            sum(1 for pred, actual in zip(predictions, y) if pred != actual) / n_points
+            sum(1 for pred, actual in zip(predictions, y) if pred != actual) / N_POINTS
         )
-        total_e_in += e_in
+    return {"e_in": e_in}
+
+
+def report(summary: Dict[str, float]) -> None:
+    """Exibe o E_in médio e a alternativa mais próxima.
 
-    average_e_in = total_e_in / n_runs
+    Args:
+        summary (Dict[str, float]): A média das métricas sobre as execuções.
+    """
+    average_e_in = summary["e_in"]
 
     print(
         Color.text(
-            f"\nMédia de E_in (erro in-sample) após {n_runs} execuções: {average_e_in:.3f}",
+            f"Média de E_in (erro in-sample): {average_e_in:.3f}",
             Color.BRIGHT_CYAN,
         )
     )
 
-    alternatives_e_in = zip(ascii_lowercase[:5], [0, 0.1, 0.3, 0.5, 0.8])
+    alternatives_e_in = zip(ascii_lowercase, ALTERNATIVES["e_in"])
     closest_e_in = min(alternatives_e_in, key=lambda x: abs(x[1] - average_e_in))
     print(
         Color.text(
@@ -64,5 +90,13 @@ def run() -> None:
     )
 
 
+def run() -> None:
+    """Executa o experimento para calcular o erro médio in-sample (E_in) utilizando Regressão Linear."""
+    from experiment import report_experiment, run_experiment
+
+    module = sys.modules[__name__]
+    report_experiment(module, run_experiment(module))
+
+
 if __name__ == "__main__":
     run()
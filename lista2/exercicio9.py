@@ -1,21 +1,34 @@
-from typing import List
-
-from linear_regression import LinearRegression
-from utils import Color, generate_data_with_noise, sign, transform_features
-
-INSTRUCTIONS = (
-    f"{Color.text('Agora, transforme os N = 1000 dados de treinamento no seguinte vetor de características não lineares:', Color.BRIGHT_CYAN)}\n"
-    f"{Color.text('(1, x1, x2, x1x2, x1^2, x2^2)', Color.BRIGHT_RED)}\n\n"
-    f"{Color.text('9. Encontre o vetor de pesos w que corresponde à solução da Regressão Linear. ', Color.BRIGHT_BLUE)}"
-    f"{Color.text('Qual das seguintes hipóteses está mais próxima da que você encontrou?', Color.BRIGHT_BLUE)}\n"
-    f"{Color.text('Mais próxima significa aquela que mais concorda com sua hipótese (tem a maior probabilidade de concordar em um ponto selecionado aleatoriamente).', Color.BRIGHT_PURPLE)}\n"
-    f"{Color.text('Escolha a opção mais próxima do seu resultado:', Color.BRIGHT_PURPLE)}\n"
-    f"{Color.text('[a] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 1.5x1^2 + 1.5x2^2)', Color.TEAL)}\n"
-    f"{Color.text('[b] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 1.5x1^2 + 15x2^2)', Color.TEAL)}\n"
-    f"{Color.text('[c] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 15x1^2 + 1.5x2^2)', Color.TEAL)}\n"
-    f"{Color.text('[d] g(x1, x2) = sign(−1 − 1.5x1 + 0.08x2 + 0.13x1x2 + 0.05x1^2 + 0.05x2^2)', Color.TEAL)}\n"
-    f"{Color.text('[e] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 1.5x1x2 + 0.15x1^2 + 0.15x2^2)', Color.TEAL)}"
-)
+import random
+import sys
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+from agreement import AgreementEvaluator
+from profiling import phase, timed
+from registry import lazy_instructions
+from utils import Color, generate_data_with_noise, transform_features
+
+
+def _instructions() -> str:
+    """Monta o enunciado colorido do exercício (só quando ele é exibido)."""
+    return (
+        f"{Color.text('Agora, transforme os N = 1000 dados de treinamento no seguinte vetor de características não lineares:', Color.BRIGHT_CYAN)}\n"
+        f"{Color.text('(1, x1, x2, x1x2, x1^2, x2^2)', Color.BRIGHT_RED)}\n\n"
+        f"{Color.text('9. Encontre o vetor de pesos w que corresponde à solução da Regressão Linear. ', Color.BRIGHT_BLUE)}"
+        f"{Color.text('Qual das seguintes hipóteses está mais próxima da que você encontrou?', Color.BRIGHT_BLUE)}\n"
+        f"{Color.text('Mais próxima significa aquela que mais concorda com sua hipótese (tem a maior probabilidade de concordar em um ponto selecionado aleatoriamente).', Color.BRIGHT_PURPLE)}\n"
+        f"{Color.text('Escolha a opção mais próxima do seu resultado:', Color.BRIGHT_PURPLE)}\n"
+        f"{Color.text('[a] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 1.5x1^2 + 1.5x2^2)', Color.TEAL)}\n"
+        f"{Color.text('[b] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 1.5x1^2 + 15x2^2)', Color.TEAL)}\n"
+        f"{Color.text('[c] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 0.13x1x2 + 15x1^2 + 1.5x2^2)', Color.TEAL)}\n"
+        f"{Color.text('[d] g(x1, x2) = sign(−1 − 1.5x1 + 0.08x2 + 0.13x1x2 + 0.05x1^2 + 0.05x2^2)', Color.TEAL)}\n"
+        f"{Color.text('[e] g(x1, x2) = sign(−1 − 0.05x1 + 0.08x2 + 1.5x1x2 + 0.15x1^2 + 0.15x2^2)', Color.TEAL)}"
+    )
+
+
+__getattr__ = lazy_instructions(__name__, _instructions)
+"""Constrói `INSTRUCTIONS` sob demanda, para que importar o exercício seja rápido."""
+
 
 HYPOTHESES = {
     "a": [-1, -0.05, 0.08, 0.13, 1.5, 1.5],
@@ -26,62 +39,130 @@ HYPOTHESES = {
 }
 
 
+@lru_cache(maxsize=None)
+def _evaluator() -> AgreementEvaluator:
+    """Cria (uma vez por processo) o avaliador de concordância com as hipóteses."""
+    return AgreementEvaluator(HYPOTHESES, transform_features)
+
+
+@timed("score")
 def compare_hypotheses(w: List[float]) -> str:
     """Compara a hipótese encontrada com as opções fornecidas e retorna a mais próxima.
 
+    A mais próxima é a que concorda com a hipótese encontrada na maior fração dos pontos
+    de uma amostra de teste compartilhada (veja `AgreementEvaluator`).
+
     Args:
         w (List[float]): Vetor de pesos encontrado.
 
     Returns:
         str: A opção mais próxima.
     """
-    best_match = ""
-    best_score = float("-inf")
+    return _evaluator().closest([w])[0]
 
-    for key, hypothesis in HYPOTHESES.items():
-        score = sum(
-            1 if sign(sum(h * w_i for h, w_i in zip(hypothesis, w))) == sign(w_i) else 0
-            for w_i in w
-        )
-        if score > best_score:
-            best_score = score
-            best_match = key
 
-    return best_match
+N_RUNS = 1000
+"""Número de execuções do experimento.
 
+Não há `ALTERNATIVES`: a resposta é a hipótese escolhida com mais frequência, e não a
+opção mais próxima de uma média, então a parada antecipada por opções decididas não se
+aplica e o experimento sempre faz as N_RUNS execuções (a menos que `--ci-width` seja
+dado)."""
 
-def run() -> None:
-    """Executa o experimento para encontrar a hipótese mais próxima usando transformação não linear."""
-    n_runs = 1000
-    n_points = 1000
-    closest_matches = {key: 0 for key in HYPOTHESES.keys()}
-
-    for i in range(n_runs):
-        print(
-            Color.text(
-                f"Executando iteração {i + 1} de {n_runs}...", Color.BRIGHT_YELLOW
-            ),
-            end="\r",
-            flush=True,
-        )
-        X, y = generate_data_with_noise(n_points=n_points, noise_percentage=0.1)
-        X_transformed = transform_features(X)
+N_POINTS = 1000
+"""Número de pontos de treinamento de cada execução."""
+
+
+def simulate_run(rng: random.Random) -> Dict[str, float]:
+    """Ajusta a Regressão Linear com a transformação não linear e compara as hipóteses.
+
+    Args:
+        rng (random.Random): O gerador aleatório desta execução.
+
+    Returns:
+        Dict[str, float]: 1 para a hipótese mais próxima e 0 para as demais.
+    """
+    from linear_regression import LinearRegression
+
+    X, y = generate_data_with_noise(n_points=N_POINTS, noise_percentage=0.1, rng=rng)
+    X_transformed = transform_features(X)
+
+    model = LinearRegression()
+    model.fit(X_transformed, y)
+
+    best_match = compare_hypotheses(model.weights)
+    return {key: 1 if key == best_match else 0 for key in HYPOTHESES}
+
+
+def simulate_runs(rngs: Sequence[random.Random]) -> List[Dict[str, float]]:
+    """Ajusta a Regressão Linear de várias execuções e compara todas de uma só vez.
 
+    O resultado de cada execução é o mesmo de `simulate_run` com o mesmo gerador, mas a
+    concordância de todos os pesos ajustados com as hipóteses sai de um único produto de
+    matrizes.
+
+    Args:
+        rngs (Sequence[random.Random]): Um gerador aleatório por execução.
+
+    Returns:
+        List[Dict[str, float]]: 1 para a hipótese mais próxima e 0 para as demais, por
+            execução.
+    """
+    from linear_regression import LinearRegression
+
+    weights_batch = []
+    for rng in rngs:
+        X, y = generate_data_with_noise(
+            n_points=N_POINTS, noise_percentage=0.1, rng=rng
+        )
         model = LinearRegression()
-        model.fit(X_transformed, y)
+        model.fit(transform_features(X), y)
+        weights_batch.append(model.weights)
+
+    with phase("score"):
+        best_matches = _evaluator().closest(weights_batch)
+    return [
+        {key: 1 if key == best_match else 0 for key in HYPOTHESES}
+        for best_match in best_matches
+    ]
+
 
-        best_match = compare_hypotheses(model.weights)
-        closest_matches[best_match] += 1
+def reduce(results: Sequence[Dict[str, float]]) -> Dict[str, float]:
+    """Conta quantas vezes cada hipótese foi a mais próxima.
 
-    most_frequent_match = max(closest_matches, key=closest_matches.__getitem__)
+    Args:
+        results (Sequence[Dict[str, float]]): As métricas de cada execução.
+
+    Returns:
+        Dict[str, float]: O número de aparições de cada hipótese.
+    """
+    return {key: sum(result[key] for result in results) for key in HYPOTHESES}
+
+
+def report(summary: Dict[str, float]) -> None:
+    """Exibe a hipótese escolhida com mais frequência.
+
+    Args:
+        summary (Dict[str, float]): O número de aparições de cada hipótese.
+    """
+    most_frequent_match = max(summary, key=summary.__getitem__)
+    appearances = summary[most_frequent_match]
 
     print(
         Color.text(
-            f"\nA hipótese mais próxima em média é: {most_frequent_match}) com {closest_matches[most_frequent_match]} aparições.",
+            f"A hipótese mais próxima em média é: {most_frequent_match}) com {appearances} aparições.",
             Color.BRIGHT_CYAN,
         )
     )
 
 
+def run() -> None:
+    """Executa o experimento para encontrar a hipótese mais próxima usando transformação não linear."""
+    from experiment import report_experiment, run_experiment
+
+    module = sys.modules[__name__]
+    report_experiment(module, run_experiment(module))
+
+
 if __name__ == "__main__":
     run()
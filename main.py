@@ -1,8 +1,22 @@
 import importlib
+import sys
 from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from typing import TYPE_CHECKING, List, Optional
 
+import profiling
+
+from constants import BENCH_THRESHOLD
+from registry import ExerciseInfo, find_exercise, scan_exercises
 from utils import Color, clear_screen, print_divider
 
+if TYPE_CHECKING:
+    from cache import ResultCache
+
+# Os módulos de experimentos, cache e benchmark (e, por meio deles, os modelos) só são
+# importados quando usados: `--list-exercises` e a validação dos argumentos não os
+# carregam, e o CLI é chamado muitas vezes por agendadores.
+
 
 def parse_arguments() -> Namespace:
     """Parsa os argumentos da linha de comando.
@@ -17,7 +31,6 @@ def parse_arguments() -> Namespace:
     parser.add_argument(
         "-l",
         "--list",
-        required=True,
         type=int,
         help="Número da lista, por exemplo, '1' para 'lista1'.",
     )
@@ -25,11 +38,16 @@ def parse_arguments() -> Namespace:
     parser.add_argument(
         "-e",
         "--exercise",
-        required=True,
         type=str,
         help="Número do exercício, por exemplo, '7' para 'exercicio7'.",
     )
 
+    parser.add_argument(
+        "--list-exercises",
+        action="store_true",
+        help="Lista os exercícios disponíveis (de todas as listas ou só da lista -l).",
+    )
+
     parser.add_argument(
         "-r",
         "--repetitions",
@@ -45,7 +63,95 @@ def parse_arguments() -> Namespace:
         help="Limpa a tela antes de cada execução.",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Número de processos usados para as execuções do experimento.",
+        default=1,
+    )
+
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        help="Semente raiz do experimento, para resultados reproduzíveis.",
+        default=None,
+    )
+
+    stopping = parser.add_mutually_exclusive_group()
+    stopping.add_argument(
+        "--ci-width",
+        type=float,
+        help="Para o experimento quando o intervalo de confiança de todas as métricas tiver essa largura.",
+        default=None,
+    )
+
+    stopping.add_argument(
+        "--no-early-stop",
+        action="store_true",
+        help="Executa todas as execuções do experimento, sem parada antecipada.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignora o cache de resultados e executa o experimento de novo.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mede o tempo de cada fase (geração, transformação, ajuste, predição...).",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        help="Com --profile, grava também as estatísticas do cProfile nesse arquivo.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Executa os benchmarks dos kernels e dos exercícios em vez de um exercício.",
+    )
+
+    parser.add_argument(
+        "--bench-output",
+        type=str,
+        help="Arquivo JSON onde o resultado dos benchmarks é gravado.",
+        default="benchmark.json",
+    )
+
+    parser.add_argument(
+        "--bench-baseline",
+        type=str,
+        help="Arquivo JSON de referência; aponta os casos que ficaram mais lentos.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--bench-threshold",
+        type=float,
+        help="Aumento relativo tolerado na comparação, por exemplo 0.1 para 10%%.",
+        default=BENCH_THRESHOLD,
+    )
+
+    parser.add_argument(
+        "--bench-filter",
+        type=str,
+        help="Só executa os benchmarks cujo nome contém esse texto.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+    if args.list_exercises:
+        return args
+    if not args.bench and (args.list is None or args.exercise is None):
+        parser.error("os argumentos -l/--list e -e/--exercise são obrigatórios")
+    return args
 
 
 def import_exercise_module(list_num: int, exercise_num: int):
@@ -59,9 +165,20 @@ def import_exercise_module(list_num: int, exercise_num: int):
         module: Módulo importado.
 
     Raises:
-        ImportError: Se o módulo não puder ser importado.
+        ImportError: Se o exercício não existir ou não puder ser importado.
     """
-    exercise_path = f"lista{list_num}.exercicio{exercise_num}"
+    info = find_exercise(list_num, exercise_num)
+    if info is None:
+        print(
+            Color.text(
+                f"Exercício {exercise_num} da lista {list_num} não encontrado. "
+                "Use --list-exercises para ver os exercícios disponíveis.",
+                Color.RED,
+            )
+        )
+        raise ImportError(f"lista{list_num}.exercicio{exercise_num}")
+
+    exercise_path = info["module"]
     try:
         module = importlib.import_module(exercise_path)
     except ImportError as e:
@@ -99,13 +216,40 @@ def print_execution_start_message(
         )
 
 
-def execute_exercise(module, repetitions: int) -> None:
+def execute_exercise(
+    module,
+    repetitions: int,
+    jobs: int = 1,
+    seed: Optional[int] = None,
+    early_stop: bool = True,
+    ci_width: Optional[float] = None,
+    cache: Optional["ResultCache"] = None,
+) -> int:
     """Executa o exercício a partir do módulo importado, exibindo as instruções.
 
+    Exercícios que seguem o protocolo de experimentos (veja `experiment.is_experiment`)
+    são executados por `run_experiment`, com `jobs` processos. A repetição i usa a
+    semente `seed + i`; sem semente, cada repetição sorteia uma nova. O experimento
+    para assim que a resposta estiver decidida (ou o intervalo de confiança atingir
+    `ci_width`), a menos que `early_stop` seja False. Com semente e `cache`, um
+    resultado já calculado com o mesmo código e os mesmos parâmetros é reusado.
+
     Args:
         module: Módulo importado do exercício.
         repetitions (int): Número de repetições da execução.
+        jobs (int): Número de processos usados pelo experimento.
+        seed (Optional[int]): Semente raiz da primeira repetição.
+        early_stop (bool): Se o experimento pode parar antes de `N_RUNS` execuções.
+        ci_width (Optional[float]): Largura alvo do intervalo de confiança.
+        cache (Optional[ResultCache]): Cache de resultados, ou None para não usar.
+
+    Returns:
+        int: O número total de execuções feitas (uma por repetição, se o exercício não
+            for um experimento).
     """
+    from experiment import is_experiment, report_experiment, run_experiment
+
+    n_runs = 0
     statement = getattr(module, "INSTRUCTIONS", None)
 
     if statement:
@@ -124,9 +268,91 @@ def execute_exercise(module, repetitions: int) -> None:
             print(execution_msg, end="\n\n")
             print_divider()
 
-        module.run()
+        if is_experiment(module):
+            result = run_experiment(
+                module,
+                None if seed is None else seed + i,
+                jobs,
+                early_stop=early_stop,
+                target_width=ci_width,
+                cache=cache,
+            )
+            report_experiment(module, result)
+            print(Color.text(f"Semente: {result.seed}", Color.GRAY))
+            n_runs += result.n_runs
+        else:
+            module.run()
+            n_runs += 1
         print_divider()
 
+    return n_runs
+
+
+def print_profile(wall_time: float, n_runs: int) -> None:
+    """Imprime o tempo de cada fase medida por `profiling`.
+
+    Para cada fase: o tempo total (exclusivo, sem as fases internas), o tempo médio por
+    execução do experimento e a fração do tempo de parede. O que não pertence a nenhuma
+    fase aparece como "(fora das fases)".
+
+    Args:
+        wall_time (float): O tempo de parede do exercício, em segundos.
+        n_runs (int): O número de execuções do experimento.
+    """
+    totals = profiling.phase_totals()
+    measured = sum(seconds for seconds, _ in totals.values())
+    rows = [(name, seconds, calls) for name, (seconds, calls) in totals.items()]
+    rows.append(("(fora das fases)", max(wall_time - measured, 0.0), 0))
+
+    print(Color.text("Tempo por fase:", Color.CYAN))
+    print(
+        Color.text(
+            f"{'fase':<28} {'total (s)':>10} {'por execução (ms)':>18} "
+            f"{'chamadas':>9} {'% do tempo':>10}",
+            Color.GRAY,
+        )
+    )
+    for name, seconds, calls in rows:
+        print(
+            f"{Color.text(f'{name:<28}', Color.CYAN)} "
+            f"{seconds:>10.3f} {1000 * seconds / max(n_runs, 1):>18.3f} "
+            f"{calls or '':>9} {Color.text(f'{seconds / wall_time:>10.1%}', Color.GREEN)}"
+        )
+    print(
+        Color.text(
+            f"Tempo de parede: {wall_time:.3f} s em {n_runs} execuções", Color.GRAY
+        )
+    )
+
+
+def print_exercises(exercises: List[ExerciseInfo]) -> None:
+    """Imprime os exercícios do registro com título, parâmetros e opções de resposta.
+
+    Args:
+        exercises (List[ExerciseInfo]): Os exercícios (veja `registry.scan_exercises`).
+    """
+    for info in exercises:
+        list_num, exercise_num, module = info["list"], info["exercise"], info["module"]
+        print(
+            f"{Color.text(f'lista {list_num}', Color.BLUE)} "
+            f"{Color.text(f'exercício {exercise_num}', Color.GREEN)} "
+            f"{Color.text(f'({module})', Color.GRAY)}"
+        )
+        if "error" in info:
+            print(f"  {Color.text(info['error'], Color.RED)}")
+        if info["title"]:
+            print(f"  {Color.text(info['title'], Color.WHITE)}")
+        if info["params"]:
+            params = ", ".join(
+                f"{key}={value}" for key, value in info["params"].items()
+            )
+            print(f"  {Color.text('Parâmetros:', Color.CYAN)} {params}")
+        choices = info["choices"]
+        if isinstance(choices, dict):
+            choices = [f"{key}: {values}" for key, values in choices.items()]
+        for choice in choices:
+            print(f"  {Color.text('•', Color.TEAL)} {choice}")
+
 
 def main() -> None:
     """Função principal que executa o fluxo do programa."""
@@ -135,13 +361,75 @@ def main() -> None:
     if args.clear:
         clear_screen()
 
+    if args.list_exercises:
+        exercises = scan_exercises()
+        if args.list is not None:
+            exercises = [info for info in exercises if info["list"] == args.list]
+        print_exercises(exercises)
+        return
+
+    if args.bench:
+        from benchmark import bench
+
+        sys.exit(
+            bench(
+                args.bench_output,
+                args.bench_baseline,
+                args.bench_threshold,
+                args.bench_filter,
+            )
+        )
+
     list_num = args.list
     exercise_num = args.exercise
 
     print_execution_start_message(list_num, exercise_num, args.repetitions)
 
     module = import_exercise_module(list_num, exercise_num)
-    execute_exercise(module, args.repetitions)
+
+    jobs = args.jobs
+    cache = None
+    if not args.no_cache:
+        from cache import ResultCache
+
+        cache = ResultCache()
+    profiler = None
+    if args.profile:
+        # As fases só são medidas no processo principal, e um resultado do cache não
+        # executa nada: o perfil roda em um único processo e sem cache.
+        jobs, cache = 1, None
+        profiling.enable()
+        if args.profile_output:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+    start = perf_counter()
+    n_runs = execute_exercise(
+        module,
+        args.repetitions,
+        jobs,
+        args.seed,
+        not args.no_early_stop,
+        args.ci_width,
+        cache,
+    )
+    wall_time = perf_counter() - start
+
+    if args.profile:
+        profiling.disable()
+        print_profile(wall_time, n_runs)
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile_output)
+            print(
+                Color.text(
+                    f"Estatísticas do cProfile gravadas em {args.profile_output} "
+                    "(veja com `python -m pstats`).",
+                    Color.GRAY,
+                )
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,364 @@
+from array import array
+from collections.abc import Sequence as SequenceABC
+from itertools import chain, repeat
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+Row = Sequence[float]
+"""Uma linha (ou coluna) de matriz: lista, tupla, memoryview ou visão de bias."""
+
+Dtype = Literal["float64", "float32"]
+"""A precisão dos elementos armazenados em uma `Matrix`."""
+
+TYPECODES: Dict[str, str] = {"float64": "d", "float32": "f"}
+"""O typecode do `array` de cada precisão: "d" (8 bytes) ou "f" (4 bytes)."""
+
+
+def typecode_of(dtype: Dtype) -> str:
+    """Retorna o typecode do `array` de uma precisão.
+
+    Args:
+        dtype (Dtype): "float64" ou "float32".
+
+    Returns:
+        str: O typecode, "d" ou "f".
+
+    Raises:
+        ValueError: Se a precisão não for suportada.
+    """
+    try:
+        return TYPECODES[dtype]
+    except KeyError:
+        raise ValueError(
+            f"Precisão desconhecida: {dtype} (use {', '.join(TYPECODES)})"
+        ) from None
+
+
+class _BiasRow(SequenceABC):
+    """Visão de uma linha com um 1 implícito na frente, sem copiar a linha original."""
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: Row) -> None:
+        self._row = row
+
+    def __len__(self) -> int:
+        return len(self._row) + 1
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return list(self)[j]
+        if j == 0 or j == -len(self):
+            return 1.0
+        return self._row[j - 1 if j > 0 else j]
+
+    def __iter__(self) -> Iterator[float]:
+        return chain((1.0,), self._row)
+
+
+class _Ones(SequenceABC):
+    """Visão de uma linha (ou coluna) de 1s, sem armazenar os valores."""
+
+    __slots__ = ("_length",)
+
+    def __init__(self, length: int) -> None:
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [1.0] * len(range(*j.indices(self._length)))
+        if not -self._length <= j < self._length:
+            raise IndexError("Índice fora da matriz")
+        return 1.0
+
+    def __iter__(self) -> Iterator[float]:
+        return repeat(1.0, self._length)
+
+
+class Matrix:
+    """Matriz densa armazenada em um buffer contíguo (`array`), em ordem row-major.
+
+    Os elementos ficam em um único `array('d')` (8 bytes por valor, sem um objeto Python
+    por float). A matriz é descrita pelos metadados `shape`, `strides` (em número de
+    elementos) e `offset`, então a transposição e as visões de linhas e colunas apenas
+    reinterpretam o mesmo buffer, sem copiá-lo.
+
+    A matriz também pode ter uma coluna (ou, se transposta, uma linha) de bias implícita:
+    `with_bias()` devolve uma visão em que a coluna 0 vale sempre 1, sem armazená-la.
+
+    Linhas e colunas são devolvidas como `memoryview` sobre o buffer, então podem ser
+    iteradas, indexadas e passadas para `zip`, `sum`, `map` etc. Por isso a `Matrix`
+    funciona diretamente nas funções de `utils` que recebem `List[List[float]]`.
+
+    Args:
+        data (array): O buffer com os elementos.
+        shape (Tuple[int, int]): O número de linhas e colunas armazenadas no buffer.
+        strides (Optional[Tuple[int, int]]): O passo, em elementos, entre linhas e entre
+            colunas. Por padrão, o passo row-major contíguo.
+        offset (int): A posição do elemento (0, 0) no buffer.
+        bias (Optional[int]): O eixo do bias implícito: 1 para uma coluna de 1s na frente,
+            0 para uma linha de 1s no topo, None para nenhum.
+    """
+
+    __slots__ = ("_data", "_view", "_shape", "strides", "offset", "bias")
+
+    def __init__(
+        self,
+        data: array,
+        shape: Tuple[int, int],
+        strides: Optional[Tuple[int, int]] = None,
+        offset: int = 0,
+        bias: Optional[int] = None,
+    ) -> None:
+        """Cria uma matriz (ou visão) sobre um buffer existente.
+
+        Args:
+            data (array): O buffer com os elementos.
+            shape (Tuple[int, int]): O número de linhas e colunas armazenadas.
+            strides (Optional[Tuple[int, int]]): O passo entre linhas e entre colunas.
+            offset (int): A posição do elemento (0, 0) no buffer.
+            bias (Optional[int]): O eixo do bias implícito (0, 1 ou None).
+        """
+        self._data = data
+        self._view = memoryview(data)
+        self._shape = shape
+        self.strides = strides if strides is not None else (shape[1], 1)
+        self.offset = offset
+        self.bias = bias
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Iterable[float]], typecode: str = "d"
+    ) -> "Matrix":
+        """Cria uma matriz copiando as linhas para um buffer contíguo.
+
+        Args:
+            rows (Iterable[Iterable[float]]): As linhas da matriz (listas, tuplas,
+                geradores...).
+            typecode (str): O tipo dos elementos no `array`.
+
+        Returns:
+            Matrix: A matriz com os dados copiados.
+
+        Raises:
+            ValueError: Se as linhas não tiverem todas o mesmo tamanho.
+        """
+        data = array(typecode)
+        n_rows, n_cols = 0, None
+        for row in rows:
+            size = len(data)
+            data.extend(row)
+            if n_cols is None:
+                n_cols = len(data) - size
+            elif len(data) - size != n_cols:
+                raise ValueError("Todas as linhas devem ter o mesmo tamanho")
+            n_rows += 1
+        return cls(data, (n_rows, n_cols or 0))
+
+    @classmethod
+    def zeros(cls, n_rows: int, n_cols: int, typecode: str = "d") -> "Matrix":
+        """Cria uma matriz de zeros.
+
+        Args:
+            n_rows (int): O número de linhas.
+            n_cols (int): O número de colunas.
+            typecode (str): O tipo dos elementos no `array`.
+
+        Returns:
+            Matrix: A matriz de zeros.
+        """
+        data = array(typecode, bytes(array(typecode).itemsize * n_rows * n_cols))
+        return cls(data, (n_rows, n_cols))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Retorna o formato lógico da matriz, incluindo o bias implícito.
+
+        Returns:
+            Tuple[int, int]: O número de linhas e de colunas.
+        """
+        n_rows, n_cols = self._shape
+        if self.bias == 1:
+            return n_rows, n_cols + 1
+        if self.bias == 0:
+            return n_rows + 1, n_cols
+        return n_rows, n_cols
+
+    @property
+    def typecode(self) -> str:
+        """Retorna o typecode do buffer ("d" para float64, "f" para float32).
+
+        Returns:
+            str: O typecode do `array`.
+        """
+        return self._data.typecode
+
+    @property
+    def nbytes(self) -> int:
+        """Retorna o tamanho, em bytes, do buffer (compartilhado com as visões).
+
+        Returns:
+            int: O número de bytes dos elementos armazenados.
+        """
+        return len(self._data) * self._data.itemsize
+
+    @property
+    def T(self) -> "Matrix":
+        """Retorna a transposta como uma visão sobre o mesmo buffer.
+
+        Returns:
+            Matrix: A matriz transposta (sem cópia).
+        """
+        return Matrix(
+            self._data,
+            (self._shape[1], self._shape[0]),
+            (self.strides[1], self.strides[0]),
+            self.offset,
+            None if self.bias is None else 1 - self.bias,
+        )
+
+    def with_bias(self) -> "Matrix":
+        """Retorna uma visão com uma coluna de 1s implícita na frente (o bias).
+
+        Returns:
+            Matrix: A visão com o bias, de formato (n, m + 1).
+
+        Raises:
+            ValueError: Se a matriz já tiver um bias implícito.
+        """
+        if self.bias is not None:
+            raise ValueError("A matriz já possui um bias implícito")
+        return Matrix(self._data, self._shape, self.strides, self.offset, 1)
+
+    def _stored_row(self, i: int) -> memoryview:
+        """Retorna a linha i do buffer (sem o bias) como uma visão."""
+        n_rows, n_cols = self._shape
+        if not 0 <= i < n_rows:
+            raise IndexError("Índice fora da matriz")
+        row_stride, col_stride = self.strides
+        start = self.offset + i * row_stride
+        return self._view[start : start + (n_cols - 1) * col_stride + 1 : col_stride]
+
+    def row(self, i: int) -> Row:
+        """Retorna a linha i como uma visão, sem copiar os dados.
+
+        Args:
+            i (int): O índice da linha.
+
+        Returns:
+            Row: A linha i.
+        """
+        if i < 0:
+            i += self.shape[0]
+        if self.bias == 1:
+            return _BiasRow(self._stored_row(i))
+        if self.bias == 0:
+            return _Ones(self._shape[1]) if i == 0 else self._stored_row(i - 1)
+        return self._stored_row(i)
+
+    def column(self, j: int) -> Row:
+        """Retorna a coluna j como uma visão, sem copiar os dados.
+
+        Args:
+            j (int): O índice da coluna.
+
+        Returns:
+            Row: A coluna j.
+        """
+        return self.T.row(j)
+
+    def rows(self) -> Iterator[Row]:
+        """Itera sobre as linhas da matriz como visões.
+
+        Returns:
+            Iterator[Row]: As linhas, na ordem.
+        """
+        return map(self.row, range(self.shape[0]))
+
+    def columns(self) -> Iterator[Row]:
+        """Itera sobre as colunas da matriz como visões.
+
+        Returns:
+            Iterator[Row]: As colunas, na ordem.
+        """
+        return self.T.rows()
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __iter__(self) -> Iterator[Row]:
+        return self.rows()
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> Union[Row, float]:
+        if isinstance(index, tuple):
+            i, j = index
+            return self.row(i)[j]
+        return self.row(index)
+
+    def __repr__(self) -> str:
+        return f"Matrix(shape={self.shape}, typecode={self._data.typecode!r})"
+
+    def tolist(self) -> List[List[float]]:
+        """Copia a matriz para o formato `List[List[float]]`.
+
+        Returns:
+            List[List[float]]: As linhas da matriz.
+        """
+        return [list(row) for row in self.rows()]
+
+    def to_numpy(self):
+        """Exporta a matriz para um `numpy.ndarray`.
+
+        Sem bias implícito, o array compartilha o buffer da matriz (nenhuma cópia é
+        feita, inclusive para visões transpostas). Com bias, a coluna de 1s precisa
+        existir de fato, então o resultado é uma cópia.
+
+        Returns:
+            numpy.ndarray: A matriz como array do NumPy.
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        import numpy as np
+
+        buffer = np.frombuffer(self._data, dtype=self._data.typecode)
+        itemsize = buffer.itemsize
+        stored = np.lib.stride_tricks.as_strided(
+            buffer[self.offset :],
+            shape=self._shape,
+            strides=(self.strides[0] * itemsize, self.strides[1] * itemsize),
+            writeable=False,
+        )
+        if self.bias is None:
+            return stored
+        return np.insert(stored, 0, 1.0, axis=self.bias)
+
+
+def as_matrix(
+    X: Union[Matrix, Iterable[Iterable[float]]], typecode: Optional[str] = None
+) -> Matrix:
+    """Converte a entrada para `Matrix`, sem copiar se ela já for uma (do tipo pedido).
+
+    Args:
+        X (Union[Matrix, Iterable[Iterable[float]]]): A matriz ou as linhas.
+        typecode (Optional[str]): O tipo dos elementos. Por padrão, o da própria matriz
+            ou "d" para as demais entradas.
+
+    Returns:
+        Matrix: A matriz.
+    """
+    if isinstance(X, Matrix) and typecode in (None, X.typecode):
+        return X
+    return Matrix.from_rows(X, typecode or "d")
@@ -1,5 +1,20 @@
+import math
 import random
-from typing import List, Union
+import time
+from itertools import compress
+from operator import lt, mul, ne
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from constants import GRAM_CACHE_LIMIT
+from matrix import Matrix, as_matrix
+from profiling import timed
+from utils import RandomStream
+
+Init = Union[Literal["random", "zeros", "linreg"], Sequence[float]]
+"""Os pesos iniciais do PLA: uma estratégia ou o próprio vetor (com o bias em [0])."""
+
+INIT_STRATEGIES = ("random", "zeros", "linreg")
+"""As estratégias de inicialização dos pesos aceitas por `Perceptron.fit`."""
 
 
 class Perceptron:
@@ -16,19 +31,41 @@ class Perceptron:
         learning_rate (float): A taxa de aprendizado que controla o quanto os pesos são
             ajustados a cada iteração. Valor padrão é 0.01.
         n_iters (int): O número máximo de iterações do algoritmo. Valor padrão é 1000.
+        mode (Literal["sweep", "incremental"]): A estratégia de treinamento. Em "sweep"
+            (padrão) cada iteração é uma varredura completa sobre as amostras; em
+            "incremental" cada iteração é uma única atualização de pesos feita sobre um
+            ponto mal classificado escolhido aleatoriamente, como no livro.
+        rng (Optional[random.Random]): O gerador aleatório usado nos pesos iniciais e na
+            escolha dos pontos. Por padrão, o estado global do módulo `random`.
     """
 
     weights: List[Union[float, int]]
 
-    def __init__(self, learning_rate: float = 0.01, n_iters: int = 1000) -> None:
+    def __init__(
+        self,
+        learning_rate: float = 0.01,
+        n_iters: int = 1000,
+        mode: Literal["sweep", "incremental"] = "sweep",
+        rng: Optional[random.Random] = None,
+    ) -> None:
         """Inicializa o Perceptron com uma taxa de aprendizado e número de iterações.
 
         Args:
             learning_rate (float): A taxa de aprendizado.
             n_iters (int): O número máximo de iterações.
+            mode (Literal["sweep", "incremental"]): A estratégia de treinamento.
+            rng (Optional[random.Random]): O gerador aleatório.
+
+        Raises:
+            ValueError: Se o modo de treinamento não for suportado.
         """
+        if mode not in ("sweep", "incremental"):
+            raise ValueError(f"Modo de treinamento desconhecido: {mode}")
+
         self.lr = learning_rate
         self.n_iters = n_iters
+        self.mode = mode
+        self.rng = rng
         self._iterations = 0
 
     @property
@@ -40,16 +77,23 @@ class Perceptron:
         """
         return self._iterations
 
-    def fit(self, X: List[List[Union[float, int]]], y: List[Union[float, int]]) -> None:
+    @timed("Perceptron.fit")
+    def fit(
+        self,
+        X: Union[Matrix, List[List[Union[float, int]]]],
+        y: List[Union[float, int]],
+        init: Init = "random",
+    ) -> None:
         """Treina o Perceptron usando os dados de treinamento.
 
         Este método ajusta os pesos do Perceptron para minimizar os erros de classificação.
 
         Args:
-            X (List[List[Union[float, int]]]): A matriz de características de entrada, onde cada elemento
-                é uma lista que representa as características de uma amostra.
+            X (Union[Matrix, List[List[Union[float, int]]]]): A matriz de características de entrada,
+                onde cada elemento é uma lista que representa as características de uma amostra.
             y (List[Union[float, int]]): O vetor de rótulos de saída, onde cada elemento é o rótulo
                 associado a uma amostra de entrada.
+            init (Init): Os pesos iniciais (veja `initial_weights`). Por padrão, aleatórios.
 
         A fórmula para o ajuste dos pesos é:
             w_j = w_j + η * (y_i - ŷ) * x_ij
@@ -60,20 +104,140 @@ class Perceptron:
             ŷ = predição do Perceptron para a amostra i
             x_ij = valor da característica j na amostra i
         """
-        self.weights = [random.random() for _ in range(len(X[0]) + 1)]
+        self.weights = self.initial_weights(X, y, init)
         self._iterations = 0
 
-        # self.weights[0] é o bias
-        X = [[1] + x for x in X]
+        # self.weights[0] é o bias, associado a uma coluna de 1s implícita (sem cópia)
+        X = as_matrix(X)
+
+        if self.mode == "incremental":
+            self._fit_incremental(X.with_bias(), y)
+            return
 
         for _ in range(self.n_iters):
             self._iterations += 1
             if not self._update_weights(X, y):
                 break
 
-    def _update_weights(
-        self, X: List[List[Union[float, int]]], y: List[Union[float, int]]
-    ) -> bool:
+    def initial_weights(
+        self,
+        X: Union[Matrix, List[List[Union[float, int]]]],
+        y: List[Union[float, int]],
+        init: Init = "random",
+    ) -> List[Union[float, int]]:
+        """Calcula os pesos iniciais do PLA (com o bias em [0]).
+
+        - "random": uniformes em [0, 1), sorteados com o gerador do Perceptron;
+        - "zeros": todos nulos;
+        - "linreg": a solução da Regressão Linear (equações normais) sobre (1, x1, ...),
+          que costuma já classificar quase todos os pontos e reduz muito as iterações;
+        - um vetor de pesos: usado como está (uma cópia).
+
+        Args:
+            X (Union[Matrix, List[List[Union[float, int]]]]): A matriz de características.
+            y (List[Union[float, int]]): O vetor de rótulos.
+            init (Init): A estratégia ou o vetor de pesos.
+
+        Returns:
+            List[Union[float, int]]: Os pesos iniciais.
+
+        Raises:
+            ValueError: Se a estratégia for desconhecida ou o vetor tiver o tamanho errado.
+        """
+        n_weights = len(X[0]) + 1
+        if not isinstance(init, str):
+            if len(init) != n_weights:
+                raise ValueError(
+                    f"Os pesos iniciais devem ter {n_weights} elementos (com o bias), "
+                    f"mas têm {len(init)}"
+                )
+            return list(init)
+        if init == "random":
+            rand = (self.rng or random).random
+            return [rand() for _ in range(n_weights)]
+        if init == "zeros":
+            return [0.0] * n_weights
+        if init == "linreg":
+            from linear_regression import LinearRegression
+
+            model = LinearRegression()
+            model.fit(as_matrix(X).with_bias(), y)
+            return list(model.weights)
+        raise ValueError(
+            f"Inicialização desconhecida: {init} (use {', '.join(INIT_STRATEGIES)} "
+            "ou um vetor de pesos)"
+        )
+
+    def _fit_incremental(self, X: Matrix, y: List[Union[float, int]]) -> None:
+        """Treina o Perceptron atualizando um ponto mal classificado por iteração.
+
+        Cada amostra guarda sua margem com sinal s_i = y_i * (w · x_i). Como em
+        `_activation`, z = 0 é classificado como -1, então o ponto i está mal
+        classificado se s_i < 0, ou se s_i = 0 e y_i = 1 (os dois modos concordam sobre
+        quais pontos estão errados). Ao escolher o ponto k, o ajuste é
+        w ← w + η * 2 * y_k * x_k (o mesmo de `_update_weights`, pois ŷ_k = -y_k), e as
+        margens são atualizadas por s_i ← s_i + η * 2 * G_ki, onde
+        G_ki = (y_k * x_k) · (y_i * x_i) é calculada uma única vez por ponto escolhido.
+
+        Os índices mal classificados ficam em uma lista com um mapa de posições: só os
+        pontos cuja classificação mudou na atualização entram ou saem (a remoção troca o
+        ponto com o último da lista), então escolher um ponto é O(1) e a convergência é
+        detectada quando a lista fica vazia, sem uma varredura de predições.
+
+        Args:
+            X (Matrix): A matriz de características de entrada, com o bias implícito.
+            y (List[Union[float, int]]): O vetor de rótulos de saída.
+        """
+        signed_X = [[y_i * x_ij for x_ij in x] for x, y_i in zip(X, y)]
+        # s_i <= 0 é o mesmo que s_i < (o menor float positivo), então o erro de cada
+        # ponto é uma única comparação s_i < t_i
+        thresholds = [math.nextafter(0.0, 1.0) if y_i > 0 else 0.0 for y_i in y]
+        gram_rows: Dict[int, List[float]] = {}
+        indices = range(len(X))
+        step = 2 * self.lr
+
+        while True:
+            # Recalcula as margens exatamente (no início e ao convergir), para que o
+            # erro de arredondamento acumulado não declare uma convergência falsa.
+            margins = [sum(map(mul, self.weights, x)) for x in signed_X]
+            wrong = list(map(lt, margins, thresholds))
+            misclassified = list(compress(indices, wrong))
+            if not misclassified:
+                break
+            position = {i: p for p, i in enumerate(misclassified)}
+
+            while misclassified and self._iterations < self.n_iters:
+                self._iterations += 1
+                k = (self.rng or random).choice(misclassified)
+                x_k = signed_X[k]
+                self.weights = [
+                    w_j + step * x_kj for w_j, x_kj in zip(self.weights, x_k)
+                ]
+
+                gram_row = gram_rows.get(k)
+                if gram_row is None:
+                    gram_row = [sum(map(mul, x_k, x_i)) for x_i in signed_X]
+                    if (len(gram_rows) + 1) * len(X) <= GRAM_CACHE_LIMIT:
+                        gram_rows[k] = gram_row
+
+                margins = [s_i + step * g for s_i, g in zip(margins, gram_row)]
+                now_wrong = list(map(lt, margins, thresholds))
+                for i in compress(indices, map(ne, wrong, now_wrong)):
+                    if now_wrong[i]:
+                        position[i] = len(misclassified)
+                        misclassified.append(i)
+                    else:
+                        p = position.pop(i)
+                        last = misclassified.pop()
+                        if last != i:
+                            misclassified[p] = last
+                            position[last] = p
+                wrong = now_wrong
+
+            if self._iterations >= self.n_iters:
+                break
+
+    def _update_weights(self, X: Matrix, y: List[Union[float, int]]) -> bool:
         """Atualiza os pesos do Perceptron com base nas amostras de treinamento.
 
         Este método percorre cada amostra de treinamento e ajusta os pesos com base no erro
@@ -89,8 +253,10 @@ class Perceptron:
             ŷ = predição do Perceptron para a amostra i
             x_ij = valor da característica j na amostra i
 
+        O bias w_0 é ajustado à parte (x_i0 = 1), sem montar a amostra com o bias.
+
         Args:
-            X (List[List[Union[float, int]]]): A matriz de características de entrada, com o bias adicionado.
+            X (Matrix): A matriz de características de entrada, sem o bias.
             y (List[Union[float, int]]): O vetor de rótulos de saída.
 
         Returns:
@@ -98,19 +264,22 @@ class Perceptron:
                   False se todos os pontos foram corretamente classificados.
         """
         all_classified_correctly = True
+        bias, weights = self.weights[0], self.weights[1:]
 
-        for i in range(len(X)):
-            y_hat = self.predict(X[i])
-            error = y[i] - y_hat
+        for x_i, y_i in zip(X, y):
+            y_hat = self._activation(sum(map(mul, weights, x_i), bias))
+            error = y_i - y_hat
 
             if error != 0:
                 all_classified_correctly = False
-                for j in range(len(X[i])):
-                    self.weights[j] += self.lr * error * X[i][j]
+                step = self.lr * error
+                bias += step
+                weights = [w_j + step * x_ij for w_j, x_ij in zip(weights, x_i)]
 
+        self.weights = [bias, *weights]
         return not all_classified_correctly
 
-    def predict(self, X: List[Union[float, int]]) -> float:
+    def predict(self, X: Sequence[Union[float, int]]) -> float:
         """Prediz o rótulo de uma amostra de entrada com base nos pesos atuais.
 
         A predição é feita pela soma ponderada das características:
@@ -122,14 +291,45 @@ class Perceptron:
         A função de ativação é então aplicada a z para determinar o rótulo predito.
 
         Args:
-            X (List[Union[float, int]]): Uma lista que representa as características de uma amostra.
+            X (Sequence[Union[float, int]]): Uma lista que representa as características de uma amostra.
 
         Returns:
             float: O rótulo predito para a amostra (1 ou -1).
         """
-        z = sum(X[i] * self.weights[i] for i in range(len(X)))
+        z = sum(map(mul, X, self.weights))
         return self._activation(z)
 
+    def decision_function(
+        self, X: Sequence[Sequence[Union[float, int]]]
+    ) -> List[float]:
+        """Calcula a soma ponderada z de todas as amostras de uma matriz.
+
+        O bias é somado diretamente como w_0, sem acrescentar a coluna de 1s em cada
+        amostra, então o resultado é igual ao de `predict([1] + x)` para cada linha.
+
+        Args:
+            X (Sequence[Sequence[Union[float, int]]]): A matriz de características (sem o
+                bias), uma amostra por linha.
+
+        Returns:
+            List[float]: A soma ponderada z de cada amostra.
+        """
+        bias, weights = self.weights[0], self.weights[1:]
+        return [sum(map(mul, weights, x), bias) for x in X]
+
+    @timed("Perceptron.predict")
+    def predict_batch(self, X: Sequence[Sequence[Union[float, int]]]) -> List[int]:
+        """Prediz os rótulos de todas as amostras de uma matriz de uma só vez.
+
+        Args:
+            X (Sequence[Sequence[Union[float, int]]]): A matriz de características (sem o
+                bias), uma amostra por linha.
+
+        Returns:
+            List[int]: O rótulo predito para cada amostra (1 ou -1).
+        """
+        return [1 if z > 0 else -1 for z in self.decision_function(X)]
+
     def _activation(self, z: float) -> float:
         """Função de ativação que aplica a função degrau.
 
@@ -140,3 +340,207 @@ class Perceptron:
             float: O rótulo de saída (1 se z > 0, caso contrário -1).
         """
         return 1 if z > 0 else -1
+
+
+@timed("Perceptron.fit_batch")
+def fit_batch(
+    X_batch: Sequence[Sequence[Sequence[Union[float, int]]]],
+    y_batch: Sequence[Sequence[Union[float, int]]],
+    learning_rate: float = 0.01,
+    n_iters: int = 1000,
+    rngs: Optional[Sequence[random.Random]] = None,
+    backend: Literal["python", "numpy"] = "python",
+) -> Tuple[List[List[float]], List[int]]:
+    """Treina K problemas independentes do PLA de uma só vez.
+
+    Cada problema k é treinado exatamente como em `Perceptron.fit` (mesma regra de
+    atualização, mesma contagem de iterações), mas todos os problemas avançam juntos,
+    varredura a varredura, e os que já convergiram saem do conjunto ativo.
+
+    - Com o backend "python", cada problema ativo é varrido por vez; o custo é o mesmo
+      de K chamadas a `Perceptron.fit`, sem ganho de velocidade.
+    - Com o backend "numpy", os pesos formam uma matriz K x (d + 1) e as amostras um
+      array K x N x (d + 1). Cada passo da varredura processa a amostra i de todos os
+      problemas ativos em algumas operações vetoriais, então o custo em Python é
+      O(N * d) por varredura, e não O(K * N * d). O produto interno é somado na mesma
+      ordem que em Python, então os pesos e as iterações são idênticos aos do outro
+      backend.
+
+    Args:
+        X_batch (Sequence[Sequence[Sequence[Union[float, int]]]]): Os K conjuntos de
+            características (sem o bias), todos com o mesmo formato N x d.
+        y_batch (Sequence[Sequence[Union[float, int]]]): Os K vetores de rótulos.
+        learning_rate (float): A taxa de aprendizado.
+        n_iters (int): O número máximo de iterações por problema.
+        rngs (Optional[Sequence[random.Random]]): Um gerador aleatório por problema,
+            usado nos pesos iniciais daquele problema. Por padrão, o estado global do
+            módulo `random`.
+        backend (Literal["python", "numpy"]): Quem executa as varreduras.
+
+    Returns:
+        Tuple[List[List[float]], List[int]]: Os pesos (com o bias em [0]) e o número de
+            iterações de cada problema.
+
+    Raises:
+        ValueError: Se algum conjunto de dados estiver vazio, os K conjuntos não tiverem
+            o mesmo formato ou o número de geradores aleatórios for diferente de K.
+        ImportError: Se o backend "numpy" for pedido sem o NumPy instalado.
+    """
+    if len(X_batch) != len(y_batch):
+        raise ValueError("X_batch e y_batch devem ter o mesmo número de problemas")
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Backend desconhecido: {backend}")
+    if not X_batch:
+        return [], []
+    if not X_batch[0]:
+        raise ValueError("Os conjuntos de dados não podem ser vazios")
+
+    shape = (len(X_batch[0]), len(X_batch[0][0]))
+    for X, y in zip(X_batch, y_batch):
+        if len(X) != shape[0] or len(y) != shape[0] or len(X[0]) != shape[1]:
+            raise ValueError("Todos os problemas devem ter o mesmo formato")
+
+    # weights[k][0] é o bias, como em Perceptron.fit
+    rngs = rngs or [random] * len(X_batch)
+    if len(rngs) != len(X_batch):
+        raise ValueError("Deve haver um gerador aleatório por problema")
+    weights = [[rng.random() for _ in range(shape[1] + 1)] for rng in rngs]
+
+    if backend == "numpy":
+        return _fit_batch_numpy(X_batch, y_batch, weights, learning_rate, n_iters)
+
+    samples = [
+        [((1, *x), target) for x, target in zip(X, y)] for X, y in zip(X_batch, y_batch)
+    ]
+    iterations = [0] * len(X_batch)
+
+    active = list(range(len(X_batch)))
+    for _ in range(n_iters):
+        if not active:
+            break
+
+        still_active = []
+        for k in active:
+            iterations[k] += 1
+            w = weights[k]
+            updated = False
+
+            for x, target in samples[k]:
+                y_hat = 1 if sum(map(mul, w, x)) > 0 else -1
+                if y_hat != target:
+                    updated = True
+                    step = learning_rate * (target - y_hat)
+                    w = [w_j + step * x_j for w_j, x_j in zip(w, x)]
+
+            weights[k] = w
+            if updated:
+                still_active.append(k)
+        active = still_active
+
+    return weights, iterations
+
+
+def _fit_batch_numpy(
+    X_batch: Sequence[Sequence[Sequence[Union[float, int]]]],
+    y_batch: Sequence[Sequence[Union[float, int]]],
+    weights: List[List[float]],
+    learning_rate: float,
+    n_iters: int,
+) -> Tuple[List[List[float]], List[int]]:
+    """Executa as varreduras de `fit_batch` com o NumPy, sobre todos os problemas ativos.
+
+    Args:
+        X_batch (Sequence[Sequence[Sequence[Union[float, int]]]]): Os K conjuntos de
+            características (sem o bias).
+        y_batch (Sequence[Sequence[Union[float, int]]]): Os K vetores de rótulos.
+        weights (List[List[float]]): Os pesos iniciais de cada problema.
+        learning_rate (float): A taxa de aprendizado.
+        n_iters (int): O número máximo de iterações por problema.
+
+    Returns:
+        Tuple[List[List[float]], List[int]]: Os pesos e o número de iterações de cada
+            problema.
+    """
+    import numpy as np
+
+    W = np.array(weights, dtype=np.float64)
+    features = np.asarray([as_matrix(X).to_numpy() for X in X_batch], dtype=np.float64)
+    samples = np.concatenate((np.ones(features.shape[:2] + (1,)), features), axis=2)
+    targets = np.asarray(y_batch, dtype=np.float64)
+    iterations = np.zeros(len(W), dtype=np.int64)
+
+    # Só os problemas ativos ficam nos arrays de trabalho; os demais são compactados
+    # para fora assim que convergem, e seus pesos voltam para W.
+    active = np.arange(len(W))
+    w, S, t = W.copy(), samples, targets
+    for _ in range(n_iters):
+        if not active.size:
+            break
+
+        iterations[active] += 1
+        updated = np.zeros(len(active), dtype=bool)
+        for i in range(S.shape[1]):
+            x = S[:, i]
+            # Soma coluna a coluna, na mesma ordem de sum(map(mul, w, x))
+            z = w[:, 0] * x[:, 0]
+            for j in range(1, x.shape[1]):
+                z += w[:, j] * x[:, j]
+            error = t[:, i] - np.where(z > 0, 1.0, -1.0)
+            w += (learning_rate * error)[:, None] * x
+            updated |= error != 0
+
+        if not updated.all():
+            W[active] = w
+            active = active[updated]
+            w, S, t = w[updated], S[updated], t[updated]
+
+    W[active] = w
+    return W.tolist(), iterations.tolist()
+
+
+def compare_initializations(
+    X: Union[Matrix, List[List[Union[float, int]]]],
+    y: List[Union[float, int]],
+    inits: Sequence[Init] = ("random", "linreg"),
+    seed: Optional[int] = None,
+    **kwargs: Any,
+) -> Dict[str, Dict[str, float]]:
+    """Treina o PLA nos mesmos dados com cada inicialização e compara o custo.
+
+    O tempo inclui o cálculo dos pesos iniciais (por exemplo, a Regressão Linear de
+    "linreg"), para que a economia medida seja a real. Cada treino usa um `RandomStream`
+    novo com a mesma semente, então a única diferença entre eles é a inicialização.
+
+    Args:
+        X (Union[Matrix, List[List[Union[float, int]]]]): A matriz de características.
+        y (List[Union[float, int]]): O vetor de rótulos.
+        inits (Sequence[Init]): As inicializações; a primeira é a referência.
+        seed (Optional[int]): A semente do gerador de cada treino. Por padrão, uma
+            semente aleatória, a mesma para todas as inicializações.
+        **kwargs: Os demais argumentos de `Perceptron` (n_iters, mode...).
+
+    Returns:
+        Dict[str, Dict[str, float]]: Para cada inicialização (pelo nome, ou "pesos[i]"
+            para um vetor), as iterações, o tempo em segundos e quantas iterações e
+            segundos foram economizados em relação à referência.
+
+    Raises:
+        ValueError: Se uma inicialização pelo nome aparecer mais de uma vez.
+    """
+    seed = RandomStream(seed).root_seed
+    results: Dict[str, Dict[str, float]] = {}
+    for i, init in enumerate(inits):
+        name = init if isinstance(init, str) else f"pesos[{i}]"
+        if name in results:
+            raise ValueError(f"Inicialização repetida: {name}")
+        pla = Perceptron(rng=RandomStream(seed), **kwargs)
+        start = time.perf_counter()
+        pla.fit(X, y, init)
+        seconds = time.perf_counter() - start
+        results[name] = {"iterations": pla.iterations, "seconds": seconds}
+
+    reference = next(iter(results.values()), None)
+    for result in results.values():
+        result["iterations_saved"] = reference["iterations"] - result["iterations"]
+        result["seconds_saved"] = reference["seconds"] - result["seconds"]
+    return results
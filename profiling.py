@@ -0,0 +1,176 @@
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+_enabled = False
+"""Se os tempos das fases estão sendo medidos."""
+
+_totals: Dict[str, List[float]] = {}
+"""Tempo exclusivo (em segundos) e número de chamadas de cada fase."""
+
+_stack: List[float] = []
+"""Tempo gasto nas fases filhas de cada fase em andamento, da mais externa à atual."""
+
+
+def enable() -> None:
+    """Liga a medição das fases e zera os tempos acumulados."""
+    global _enabled
+    _enabled = True
+    reset()
+
+
+def disable() -> None:
+    """Desliga a medição das fases (os tempos acumulados são mantidos)."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Verifica se a medição das fases está ligada.
+
+    Returns:
+        bool: True se os tempos estão sendo medidos.
+    """
+    return _enabled
+
+
+def reset() -> None:
+    """Zera os tempos acumulados de todas as fases."""
+    _totals.clear()
+    _stack.clear()
+
+
+def _leave(elapsed: float) -> float:
+    """Fecha um trecho medido: desconta o seu tempo da fase pai e devolve o tempo
+    exclusivo do trecho (sem o das fases filhas)."""
+    children = _stack.pop()
+    if _stack:
+        _stack[-1] += elapsed
+    return elapsed - children
+
+
+def _add(name: str, exclusive: float) -> None:
+    """Acumula o tempo exclusivo de uma chamada de fase."""
+    entry = _totals.get(name)
+    if entry is None:
+        _totals[name] = [exclusive, 1]
+    else:
+        entry[0] += exclusive
+        entry[1] += 1
+
+
+def _record(name: str, elapsed: float) -> None:
+    """Acumula o tempo de uma chamada de fase, descontando o das fases filhas."""
+    _add(name, _leave(elapsed))
+
+
+class phase:
+    """Mede o tempo de um bloco de código como uma fase.
+
+    As fases podem ser aninhadas: o tempo de cada fase é exclusivo, isto é, o tempo das
+    fases internas é descontado do da fase externa, então a soma das fases nunca passa do
+    tempo total. Com a medição desligada, entrar e sair do bloco não faz nada.
+
+    Args:
+        name (str): O nome da fase.
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "phase":
+        if _enabled:
+            _stack.append(0.0)
+            self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if _enabled and _stack:
+            _record(self.name, perf_counter() - self._start)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorador que mede cada chamada da função como uma fase.
+
+    Com a medição desligada, o custo é uma verificação de uma variável global por chamada,
+    então só deve ser usado em funções que fazem uma quantidade razoável de trabalho (um
+    ajuste, uma predição em lote, a geração de um conjunto de dados), e não em funções
+    chamadas por ponto.
+
+    Args:
+        name (str): O nome da fase.
+
+    Returns:
+        Callable[[F], F]: O decorador.
+    """
+
+    def decorator(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return function(*args, **kwargs)
+            _stack.append(0.0)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed_iter(name: str, items: Iterable[T]) -> Iterator[T]:
+    """Mede o tempo gasto produzindo os itens de um iterador como uma única fase.
+
+    Serve para transformações preguiçosas, como as de `LazyFeatures`: o trabalho é feito
+    item a item, intercalado com o de quem consome, mas o lote inteiro conta como uma
+    única chamada da fase (e não uma por ponto). Cada item é descontado da fase em que
+    foi pedido. A decisão é tomada uma única vez, ao criar o iterador, então com a
+    medição desligada o próprio iterador é devolvido e não há custo algum.
+
+    Args:
+        name (str): O nome da fase.
+        items (Iterable[T]): Os itens.
+
+    Returns:
+        Iterator[T]: Os mesmos itens.
+    """
+    if not _enabled:
+        return iter(items)
+    return _timed_items(name, iter(items))
+
+
+def _timed_items(name: str, items: Iterator[T]) -> Iterator[T]:
+    """O iterador medido de `timed_iter`; registra a fase quando o lote termina."""
+    exclusive = 0.0
+    try:
+        while True:
+            _stack.append(0.0)
+            start = perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                exclusive += _leave(perf_counter() - start)
+            yield item
+    finally:
+        _add(name, exclusive)
+
+
+def phase_totals() -> Dict[str, Tuple[float, int]]:
+    """Retorna o tempo exclusivo e o número de chamadas de cada fase.
+
+    Returns:
+        Dict[str, Tuple[float, int]]: Os tempos, da fase mais cara à mais barata.
+    """
+    ordered = sorted(_totals.items(), key=lambda item: item[1][0], reverse=True)
+    return {name: (seconds, int(calls)) for name, (seconds, calls) in ordered}
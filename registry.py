@@ -0,0 +1,240 @@
+import ast
+import glob
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from constants import REGISTRY_CACHE
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+"""Diretório raiz do projeto, onde ficam as pastas `listaN/`."""
+
+ExerciseInfo = Dict[str, Any]
+"""Os metadados de um exercício: nome do módulo, lista, número, título, parâmetros e
+opções de resposta (e, se o arquivo não pôde ser lido, o erro em "error")."""
+
+_CHOICE = re.compile(r"^\s*\[?([a-e])[\])]\s*(.+)$")
+"""Uma opção de resposta nas instruções: "[a] 0.1" ou "a) g(x) = 1"."""
+
+_QUESTION = re.compile(r"^\s*\d+\.\s")
+"""O enunciado da pergunta nas instruções: "7. Considere N = 10..."."""
+
+
+def _plain_text(node: ast.expr) -> str:
+    """Reconstrói o texto (sem cores) de uma expressão de INSTRUCTIONS.
+
+    As instruções são f-strings de chamadas `Color.text('texto', cor)`; basta juntar as
+    partes constantes e o primeiro argumento de cada `Color.text`, sem executar nada.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(_plain_text(value) for value in node.values)
+    if isinstance(node, ast.FormattedValue):
+        return _plain_text(node.value)
+    if isinstance(node, ast.Call) and node.args:
+        return _plain_text(node.args[0])
+    return ""
+
+
+def _instructions_node(tree: ast.Module) -> Optional[ast.expr]:
+    """Encontra a expressão das instruções: a atribuição a INSTRUCTIONS ou o retorno de
+    `_instructions()`."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "INSTRUCTIONS"
+            for target in node.targets
+        ):
+            return node.value
+        if isinstance(node, ast.FunctionDef) and node.name == "_instructions":
+            for statement in ast.walk(node):
+                if isinstance(statement, ast.Return) and statement.value is not None:
+                    return statement.value
+    return None
+
+
+def lazy_instructions(
+    module_name: str, build: Callable[[], str]
+) -> Callable[[str], str]:
+    """Cria o `__getattr__` de um exercício que constrói `INSTRUCTIONS` sob demanda.
+
+    Montar o enunciado colorido custa bem mais que importar o exercício, e só é
+    necessário quando ele é exibido. No módulo do exercício:
+        __getattr__ = lazy_instructions(__name__, _instructions)
+
+    Args:
+        module_name (str): O nome do módulo do exercício, usado na mensagem de erro.
+        build (Callable[[], str]): Monta o enunciado (a função `_instructions`).
+
+    Returns:
+        Callable[[str], str]: O `__getattr__` do módulo.
+    """
+
+    def __getattr__(name: str) -> str:
+        if name == "INSTRUCTIONS":
+            return build()
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+def _identity(path: str) -> ExerciseInfo:
+    """Identifica um exercício pelo caminho de `listaN/exercicioM.py`: o nome do módulo,
+    a lista e o número."""
+    package = os.path.basename(os.path.dirname(path))
+    module = os.path.splitext(os.path.basename(path))[0]
+    return {
+        "module": f"{package}.{module}",
+        "list": int(package.removeprefix("lista")),
+        "exercise": module.removeprefix("exercicio"),
+    }
+
+
+def _exercise_order(info: ExerciseInfo) -> Tuple[Any, ...]:
+    """A chave de ordenação dos exercícios: lista e número, parte a parte.
+
+    As partes numéricas de "8_2" são comparadas como números (assim "10" vem depois de
+    "9"); as demais, como texto, depois das numéricas.
+    """
+    parts = [
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in info["exercise"].split("_")
+    ]
+    return info["list"], parts
+
+
+def parse_exercise(path: str) -> ExerciseInfo:
+    """Extrai os metadados de um exercício lendo o código-fonte, sem importá-lo.
+
+    - título: a linha da pergunta nas instruções ("7. Considere N = 10...");
+    - parâmetros: as constantes do módulo em maiúsculas com valor literal (N_RUNS...);
+    - opções: `ALTERNATIVES`, se existir, ou as linhas "[a] ..." / "a) ..." das
+      instruções;
+    - experimento: se o módulo define `simulate_run` ou `simulate_runs`.
+
+    Args:
+        path (str): O caminho de `listaN/exercicioM.py`.
+
+    Returns:
+        ExerciseInfo: Os metadados do exercício.
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido.
+        SyntaxError: Se o código não compilar nesta versão do Python.
+    """
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), path)
+
+    params: Dict[str, Any] = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1):
+            continue
+        target = node.targets[0]
+        if isinstance(target, ast.Name) and target.id.isupper():
+            try:
+                params[target.id] = ast.literal_eval(node.value)
+            except (ValueError, TypeError):
+                continue
+
+    node = _instructions_node(tree)
+    lines = _plain_text(node).splitlines() if node is not None else []
+    title = next((line.strip() for line in lines if _QUESTION.match(line)), "")
+
+    choices: Union[Dict[str, List[Any]], List[str]]
+    if "ALTERNATIVES" in params:
+        choices = params.pop("ALTERNATIVES")
+    else:
+        choices = [
+            f"{match.group(1)}) {match.group(2).strip()}"
+            for match in map(_CHOICE.match, lines)
+            if match
+        ]
+
+    functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return {
+        **_identity(path),
+        "title": title,
+        "params": {key: value for key, value in params.items() if key != "HYPOTHESES"},
+        "choices": choices,
+        "experiment": bool({"simulate_run", "simulate_runs"} & functions),
+    }
+
+
+def scan_exercises(
+    root: str = PROJECT_ROOT, cache_path: Optional[str] = REGISTRY_CACHE
+) -> List[ExerciseInfo]:
+    """Lista os exercícios de `listaN/exercicioM.py` com seus metadados.
+
+    Os metadados ficam em cache em `cache_path`, junto com a data de modificação e o
+    tamanho de cada arquivo. Só os arquivos novos ou alterados são lidos de novo, então
+    listar os exercícios não importa nenhum deles (nem os modelos que eles usam).
+
+    Um arquivo que não pode ser lido ou não compila (por exemplo, em uma versão antiga
+    do Python) não impede a listagem nem a execução dos demais: ele aparece só com o
+    módulo, a lista, o número e a mensagem em "error", e fica fora do cache.
+
+    Args:
+        root (str): O diretório com as pastas `listaN/`.
+        cache_path (Optional[str]): O arquivo de cache, ou None para não usar cache.
+
+    Returns:
+        List[ExerciseInfo]: Os exercícios, ordenados por lista e número.
+    """
+    cached: Dict[str, Any] = {}
+    if cache_path is not None:
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            cached = {}
+
+    entries: Dict[str, Any] = {}
+    exercises: List[ExerciseInfo] = []
+    for path in glob.glob(os.path.join(root, "lista*", "exercicio*.py")):
+        name = os.path.relpath(path, root)
+        try:
+            status = os.stat(path)
+            stamp = [status.st_mtime_ns, status.st_size]
+            entry = cached.get(name)
+            if entry is None or entry["stamp"] != stamp:
+                entry = {"stamp": stamp, "info": parse_exercise(path)}
+        except (OSError, SyntaxError, UnicodeDecodeError) as error:
+            exercises.append(
+                {
+                    **_identity(path),
+                    "title": "",
+                    "params": {},
+                    "choices": [],
+                    "experiment": False,
+                    "error": f"{type(error).__name__}: {error}",
+                }
+            )
+            continue
+        entries[name] = entry
+        exercises.append(entry["info"])
+
+    if cache_path is not None and entries != cached:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(entries, file, ensure_ascii=False)
+        os.replace(temporary, cache_path)
+
+    return sorted(exercises, key=_exercise_order)
+
+
+def find_exercise(list_num: int, exercise_num: str) -> Optional[ExerciseInfo]:
+    """Procura um exercício no registro.
+
+    Args:
+        list_num (int): Número da lista.
+        exercise_num (str): Número do exercício, por exemplo "7" ou "8_2".
+
+    Returns:
+        Optional[ExerciseInfo]: Os metadados do exercício, ou None se ele não existir.
+    """
+    for info in scan_exercises():
+        if info["list"] == list_num and info["exercise"] == str(exercise_num):
+            return info
+    return None
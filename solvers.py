@@ -0,0 +1,328 @@
+import math
+from typing import Iterable, List, Literal, Sequence, Tuple
+
+from utils import dot, matrix_inverse, matrix_vector_multiply
+
+Solver = Literal["cholesky", "qr", "gauss", "inverse"]
+"""Métodos disponíveis para resolver o problema de mínimos quadrados."""
+
+SOLVERS = ("cholesky", "qr", "gauss", "inverse")
+"""Os nomes aceitos em `Solver`."""
+
+
+def cholesky(A: Sequence[Sequence[float]]) -> List[List[float]]:
+    """Calcula a decomposição de Cholesky A = L L^T de uma matriz simétrica definida positiva.
+
+    Args:
+        A (Sequence[Sequence[float]]): Matriz simétrica definida positiva.
+
+    Returns:
+        List[List[float]]: A matriz triangular inferior L.
+
+    Raises:
+        ValueError: Se a matriz não for definida positiva.
+    """
+    n = len(A)
+    L = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        L_i = L[i]
+        for j in range(i + 1):
+            L_j = L[j]
+            s = A[i][j] - dot(L_i[:j], L_j[:j])
+            if i == j:
+                if s <= 0:
+                    raise ValueError("Matriz não é definida positiva")
+                L_i[i] = math.sqrt(s)
+            else:
+                L_i[j] = s / L_j[j]
+    return L
+
+
+def forward_substitution(
+    L: Sequence[Sequence[float]], b: Sequence[float]
+) -> List[float]:
+    """Resolve L x = b para uma matriz triangular inferior L.
+
+    Args:
+        L (Sequence[Sequence[float]]): Matriz triangular inferior.
+        b (Sequence[float]): Lado direito.
+
+    Returns:
+        List[float]: A solução x.
+    """
+    x: List[float] = []
+    for i, L_i in enumerate(L):
+        x.append((b[i] - dot(L_i[:i], x)) / L_i[i])
+    return x
+
+
+def back_substitution(U: Sequence[Sequence[float]], b: Sequence[float]) -> List[float]:
+    """Resolve U x = b para uma matriz triangular superior U.
+
+    Args:
+        U (Sequence[Sequence[float]]): Matriz triangular superior.
+        b (Sequence[float]): Lado direito.
+
+    Returns:
+        List[float]: A solução x.
+    """
+    n = len(U)
+    x = [0.0] * n
+    for i in reversed(range(n)):
+        U_i = U[i]
+        x[i] = (b[i] - dot(U_i[i + 1 : n], x[i + 1 :])) / U_i[i]
+    return x
+
+
+def cholesky_solve(A: Sequence[Sequence[float]], b: Sequence[float]) -> List[float]:
+    """Resolve A x = b para uma matriz simétrica definida positiva, via Cholesky.
+
+    Resolve L z = b e depois L^T x = z, sem calcular a inversa de A.
+
+    Args:
+        A (Sequence[Sequence[float]]): Matriz simétrica definida positiva.
+        b (Sequence[float]): Lado direito.
+
+    Returns:
+        List[float]: A solução x.
+
+    Raises:
+        ValueError: Se a matriz não for definida positiva.
+    """
+    L = cholesky(A)
+    z = forward_substitution(L, b)
+    return back_substitution([list(column) for column in zip(*L)], z)
+
+
+def gauss_solve(A: Sequence[Sequence[float]], b: Sequence[float]) -> List[float]:
+    """Resolve A x = b por eliminação de Gauss com pivoteamento parcial.
+
+    Em cada coluna, a linha com o maior valor absoluto é usada como pivô, então um zero
+    na diagonal não interrompe a eliminação se a matriz for invertível.
+
+    Args:
+        A (Sequence[Sequence[float]]): Matriz quadrada.
+        b (Sequence[float]): Lado direito.
+
+    Returns:
+        List[float]: A solução x.
+
+    Raises:
+        ValueError: Se a matriz for singular.
+    """
+    return solve_many(A, [b], "gauss")[0]
+
+
+def qr_solve(X: Iterable[Sequence[float]], y: Iterable[float]) -> List[float]:
+    """Resolve o problema de mínimos quadrados min ||X w - y|| via QR (Householder).
+
+    Trabalha diretamente sobre X, sem formar X^T X, então o número de condição do
+    problema não é elevado ao quadrado. Isso é útil em projetos mal condicionados, como
+    características polinomiais de grau alto. As reflexões são aplicadas a X e a y e, ao
+    final, R w = Q^T y é resolvido por substituição regressiva.
+
+    Args:
+        X (Iterable[Sequence[float]]): Matriz de características, uma amostra por linha.
+        y (Iterable[float]): Vetor de rótulos.
+
+    Returns:
+        List[float]: Os pesos w.
+
+    Raises:
+        ValueError: Se X não tiver posto coluna completo.
+    """
+    return qr_solve_many(X, [y])[0]
+
+
+def qr_solve_many(
+    X: Iterable[Sequence[float]], Y: Sequence[Iterable[float]]
+) -> List[List[float]]:
+    """Resolve min ||X w_t - y_t|| via QR para vários vetores de rótulos de uma só vez.
+
+    Cada reflexão de Householder é calculada uma única vez e aplicada a todos os
+    vetores de rótulos, junto com as colunas de X (veja `qr_solve`).
+
+    Args:
+        X (Iterable[Sequence[float]]): Matriz de características, uma amostra por linha.
+        Y (Sequence[Iterable[float]]): Os vetores de rótulos.
+
+    Returns:
+        List[List[float]]: Os pesos de cada vetor de rótulos.
+
+    Raises:
+        ValueError: Se X não tiver posto coluna completo.
+    """
+    columns = [list(column) for column in zip(*X)]
+    targets = [list(y) for y in Y]
+    n_samples = len(columns[0]) if columns else 0
+    n_features = len(columns)
+    scale = max((max(map(abs, column), default=0.0) for column in columns), default=0.0)
+
+    for k in range(n_features):
+        v = columns[k][k:]
+        norm = math.sqrt(dot(v, v))
+        if norm <= 1e-12 * scale * math.sqrt(n_samples):
+            raise ValueError("X não tem posto coluna completo")
+
+        alpha = -norm if v[0] > 0 else norm
+        v[0] -= alpha
+        v_norm2 = dot(v, v)
+
+        for column in columns[k:] + targets:
+            factor = 2 * dot(v, column[k:]) / v_norm2
+            column[k:] = [c - factor * v_i for c, v_i in zip(column[k:], v)]
+
+    R = [[columns[j][i] for j in range(n_features)] for i in range(n_features)]
+    return [back_substitution(R, b[:n_features]) for b in targets]
+
+
+def symmetric_eigen(
+    A: Sequence[Sequence[float]], tolerance: float = 1e-12, max_sweeps: int = 100
+) -> Tuple[List[float], List[List[float]]]:
+    """Calcula a decomposição espectral A = V diag(λ) V^T de uma matriz simétrica.
+
+    Usa o método de Jacobi cíclico: cada rotação zera um elemento fora da diagonal, e as
+    varreduras sobre todos os pares (p, q) se repetem até que a norma fora da diagonal
+    fique desprezível em relação à da matriz. É preciso (os autovetores saem ortonormais
+    mesmo com autovalores próximos) e, para as matrizes d x d das equações normais, d
+    pequeno, o custo O(d^3) por varredura é irrelevante.
+
+    Args:
+        A (Sequence[Sequence[float]]): Matriz simétrica.
+        tolerance (float): A norma fora da diagonal tolerada, relativa à norma de A.
+        max_sweeps (int): O número máximo de varreduras.
+
+    Returns:
+        Tuple[List[float], List[List[float]]]: Os autovalores e a matriz V, com os
+            autovetores nas colunas (na mesma ordem dos autovalores).
+
+    Raises:
+        ValueError: Se a matriz não for quadrada ou se o método não convergir.
+    """
+    n = len(A)
+    if any(len(row) != n for row in A):
+        raise ValueError("Matriz não é quadrada")
+
+    M = [[float(a) for a in row] for row in A]
+    V = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    norm2 = sum(dot(row, row) for row in M)
+
+    for _ in range(max_sweeps):
+        off2 = sum(M[p][q] ** 2 for p in range(n) for q in range(p + 1, n))
+        if off2 <= tolerance**2 * norm2:
+            return [M[i][i] for i in range(n)], V
+
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                a_pq = M[p][q]
+                if a_pq == 0:
+                    continue
+                theta = (M[q][q] - M[p][p]) / (2 * a_pq)
+                if abs(theta) > 1e150:
+                    t = 0.5 / theta
+                else:
+                    t = math.copysign(1.0, theta) / (
+                        abs(theta) + math.sqrt(theta * theta + 1)
+                    )
+                c = 1 / math.sqrt(t * t + 1)
+                s = t * c
+
+                # A ← J^T A J, com a rotação J no plano (p, q); V ← V J
+                for row in M:
+                    a_kp, a_kq = row[p], row[q]
+                    row[p] = c * a_kp - s * a_kq
+                    row[q] = s * a_kp + c * a_kq
+                M_p, M_q = M[p], M[q]
+                M[p] = [c * a_pk - s * a_qk for a_pk, a_qk in zip(M_p, M_q)]
+                M[q] = [s * a_pk + c * a_qk for a_pk, a_qk in zip(M_p, M_q)]
+                for row in V:
+                    v_kp, v_kq = row[p], row[q]
+                    row[p] = c * v_kp - s * v_kq
+                    row[q] = s * v_kp + c * v_kq
+
+    raise ValueError("O método de Jacobi não convergiu")
+
+
+def solve(
+    A: Sequence[Sequence[float]], b: Sequence[float], method: Solver = "cholesky"
+) -> List[float]:
+    """Resolve o sistema A x = b das equações normais com o método escolhido.
+
+    Com "cholesky", se A não for numericamente definida positiva, a solução é refeita
+    por eliminação de Gauss com pivoteamento parcial.
+
+    Args:
+        A (Sequence[Sequence[float]]): A matriz X^T X.
+        b (Sequence[float]): O vetor X^T y.
+        method (Solver): "cholesky", "gauss" ou "inverse" (inversa explícita).
+
+    Returns:
+        List[float]: A solução x.
+
+    Raises:
+        ValueError: Se o método for desconhecido ou a matriz for singular.
+    """
+    if method == "cholesky":
+        try:
+            return cholesky_solve(A, b)
+        except ValueError:
+            return gauss_solve(A, b)
+    if method == "gauss":
+        return gauss_solve(A, b)
+    if method == "inverse":
+        return matrix_vector_multiply(matrix_inverse(A), b)
+    raise ValueError(f"Método desconhecido para as equações normais: {method}")
+
+
+def solve_many(
+    A: Sequence[Sequence[float]],
+    B: Sequence[Sequence[float]],
+    method: Solver = "cholesky",
+) -> List[List[float]]:
+    """Resolve A x_t = b_t para vários lados direitos, fatorando A uma única vez.
+
+    - "cholesky": L é calculada uma vez e cada b_t custa duas substituições, O(d^2);
+      se A não for numericamente definida positiva, a solução é refeita por Gauss;
+    - "gauss": uma única eliminação, com pivoteamento parcial, sobre A aumentada com
+      todos os b_t;
+    - "inverse": a inversa é calculada uma vez e aplicada a cada b_t.
+
+    Args:
+        A (Sequence[Sequence[float]]): A matriz X^T X.
+        B (Sequence[Sequence[float]]): Os lados direitos X^T y_t, um por vetor.
+        method (Solver): "cholesky", "gauss" ou "inverse".
+
+    Returns:
+        List[List[float]]: A solução de cada lado direito.
+
+    Raises:
+        ValueError: Se o método for desconhecido ou a matriz for singular.
+    """
+    if not B:
+        return []
+    if method == "cholesky":
+        try:
+            L = cholesky(A)
+        except ValueError:
+            return solve_many(A, B, "gauss")
+        U = [list(column) for column in zip(*L)]
+        return [back_substitution(U, forward_substitution(L, b)) for b in B]
+    if method == "gauss":
+        n = len(A)
+        M = [[*row, *b_i] for row, b_i in zip(A, zip(*B))]
+        for i in range(n):
+            p = max(range(i, n), key=lambda r: abs(M[r][i]))
+            if M[p][i] == 0:
+                raise ValueError("Matriz não tem inversa")
+            M[i], M[p] = M[p], M[i]
+
+            pivot_row = M[i]
+            for r in range(i + 1, n):
+                factor = M[r][i] / pivot_row[i]
+                if factor:
+                    M[r][i:] = [a - factor * c for a, c in zip(M[r][i:], pivot_row[i:])]
+        return [back_substitution(M, [row[n + t] for row in M]) for t in range(len(B))]
+    if method == "inverse":
+        inverse = matrix_inverse(A)
+        return [matrix_vector_multiply(inverse, b) for b in B]
+    raise ValueError(f"Método desconhecido para as equações normais: {method}")
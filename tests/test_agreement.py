@@ -0,0 +1,44 @@
+import pytest
+
+from agreement import AgreementEvaluator, shared_test_sample, sign_matrix
+from utils import sign, transform_features
+
+
+def test_shared_test_sample_is_deterministic_and_cached():
+    sample = shared_test_sample(transform_features, 50, 3)
+    assert shared_test_sample(transform_features, 50, 3) is sample
+    assert len(sample) == 50 and all(len(row) == 6 for row in sample)
+    assert shared_test_sample(transform_features, 50, 4) != sample
+
+
+def test_sign_matrix_matches_sign_of_dot_products():
+    features = [[1.0, 2.0], [1.0, -3.0], [0.0, 0.0]]
+    weights = [[0.0, 1.0], [1.0, 0.5]]
+    expected = [
+        [sign(sum(a * b for a, b in zip(x, w))) for x in features] for w in weights
+    ]
+    assert sign_matrix(features, weights) == expected
+
+
+def test_agreement_matches_direct_comparison():
+    hypotheses = {
+        "a": [-1.0, -0.05, 0.08, 0.13, 1.5, 1.5],
+        "b": [-1.0, -0.05, 0.08, 0.13, 1.5, 15.0],
+        "c": [-1.0, -1.5, 0.08, 0.13, 0.05, 0.05],
+    }
+    evaluator = AgreementEvaluator(hypotheses, transform_features, 200, 1)
+    fitted = [[-0.9, 0.0, 0.1, 0.1, 1.4, 1.6], [-1.0, -1.4, 0.0, 0.1, 0.0, 0.1]]
+    features = evaluator.features
+
+    scores = evaluator.agreement(fitted)
+    for weights, row in zip(fitted, scores):
+        g = sign_matrix(features, [weights])[0]
+        for name, h_weights in hypotheses.items():
+            h = sign_matrix(features, [h_weights])[0]
+            direct = sum(a == b for a, b in zip(g, h)) / len(features)
+            assert row[name] == pytest.approx(direct)
+
+    assert evaluator.closest(fitted) == [
+        max(row, key=row.__getitem__) for row in scores
+    ]
+    assert evaluator.closest([hypotheses["c"]]) == ["c"]
@@ -0,0 +1,98 @@
+import io
+
+import pytest
+
+import benchmark
+
+from benchmark import (
+    compare_benchmarks,
+    load_benchmarks,
+    precision_report,
+    run_benchmarks,
+    save_benchmarks,
+    summarize_times,
+    time_function,
+)
+from utils import ProgressReporter
+
+
+def report(**medians):
+    return {
+        "results": {
+            key: {"median": median, "iqr": iqr}
+            for key, (median, iqr) in medians.items()
+        }
+    }
+
+
+def test_summarize_times():
+    summary = summarize_times([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert summary["median"] == 3.0
+    assert summary["iqr"] == pytest.approx(3.0)
+    assert (summary["min"], summary["max"], summary["repeat"]) == (1.0, 5.0, 5)
+    assert summarize_times([2.0])["iqr"] == 0.0
+
+
+def test_time_function_skips_warmup_calls():
+    calls = []
+    times = time_function(lambda: calls.append(None), warmup=2, repeat=3)
+    assert len(calls) == 5
+    assert len(times) == 3
+
+
+def test_compare_flags_only_regressions_beyond_noise():
+    baseline = report(
+        slower=(1.0, 0.01), noisy=(1.0, 0.5), faster=(1.0, 0.01), same=(1.0, 0.01)
+    )
+    current = report(
+        slower=(1.3, 0.01),
+        noisy=(1.3, 0.01),
+        faster=(0.5, 0.01),
+        same=(1.05, 0.01),
+        new=(9.0, 0.01),
+    )
+    assert compare_benchmarks(baseline, current, threshold=0.1) == ["slower"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "benchmark.json")
+    data = report(case=(0.25, 0.01))
+    save_benchmarks(data, path)
+    assert load_benchmarks(path) == data
+
+
+def test_run_benchmarks_filters_cases():
+    result = run_benchmarks("generate_data", warmup=0, repeat=1)
+    assert result["results"]
+    assert all("generate_data" in key for key in result["results"])
+
+
+def test_precision_report_halves_memory_and_keeps_weights():
+    report = precision_report(sizes=(200,), warmup=0, repeat=1)
+    result = report["LinearRegression.fit[200]"]
+    assert result["memory_ratio"] == pytest.approx(0.5)
+    assert result["max_weight_error"] < 1e-4
+
+
+def test_time_function_reports_every_call():
+    progress = ProgressReporter(5, stream=io.StringIO(), line_interval=3600)
+    time_function(lambda: None, warmup=2, repeat=3, progress=progress)
+    assert progress.done == 5
+
+
+def test_run_benchmarks_prints_no_progress_outside_a_terminal(capsys):
+    run_benchmarks("generate_data", warmup=0, repeat=1)
+    assert "Medindo" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "name_filter, expected", [(None, True), ("precision", True), ("fit", False)]
+)
+def test_bench_adds_precision_report_only_when_asked(
+    monkeypatch, tmp_path, name_filter, expected
+):
+    monkeypatch.setattr(benchmark, "run_benchmarks", lambda name_filter: report())
+    monkeypatch.setattr(benchmark, "precision_report", lambda: {"case": {}})
+    output = str(tmp_path / "benchmark.json")
+    assert benchmark.bench(output, name_filter=name_filter) == 0
+    assert ("precision" in load_benchmarks(output)) == expected
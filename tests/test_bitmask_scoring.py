@@ -0,0 +1,62 @@
+import pytest
+
+from bitmask_scoring import (
+    agreement_histogram,
+    input_space,
+    score_hypotheses,
+    truth_table_mask,
+    unobserved_inputs,
+)
+
+
+def test_input_space_and_unobserved_inputs():
+    assert input_space(2) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    observed = [(0, 0, 0), (0, 0, 1), (0, 1, 0), (0, 1, 1), (1, 0, 0)]
+    assert unobserved_inputs(3, observed) == [(1, 0, 1), (1, 1, 0), (1, 1, 1)]
+    with pytest.raises(ValueError):
+        unobserved_inputs(3, [(0, 1)])
+
+
+def test_truth_table_mask_sets_one_bit_per_point():
+    points = [(1, 0, 1), (1, 1, 0), (1, 1, 1)]
+    assert truth_table_mask(lambda x: 1, points) == 0b111
+    assert truth_table_mask(lambda x: 0, points) == 0
+    assert truth_table_mask(lambda x: sum(x) % 2, points) == 0b100
+
+
+@pytest.mark.parametrize("k", [1, 3, 5])
+def test_closed_form_histogram_matches_enumeration(k):
+    targets = range(2**k)
+    for hypothesis in range(2**k):
+        assert agreement_histogram(hypothesis, k) == agreement_histogram(
+            hypothesis, k, targets
+        )
+
+
+def test_histogram_matches_explicit_agreement_count():
+    k = 4
+    targets = [0b0000, 0b1010, 0b1111, 0b0110]
+    hypothesis = 0b0011
+    expected = [0] * (k + 1)
+    for target in targets:
+        agree = sum((hypothesis >> i) & 1 == (target >> i) & 1 for i in range(k))
+        expected[agree] += 1
+    assert agreement_histogram(hypothesis, k, targets) == expected
+
+
+def test_agreement_histogram_rejects_wide_masks():
+    with pytest.raises(ValueError):
+        agreement_histogram(0b1000, 3)
+    with pytest.raises(ValueError):
+        agreement_histogram(0, 3, [0b1000])
+
+
+def test_score_hypotheses_all_targets_are_equivalent():
+    results = score_hypotheses({"a": 0b111, "b": 0, "c": 0b100}, 3)
+    assert {name: score for name, (_, score) in results.items()} == {
+        "a": 12,
+        "b": 12,
+        "c": 12,
+    }
+    histogram, score = score_hypotheses({"a": 0b111}, 3, targets=[0b111, 0])["a"]
+    assert histogram == [1, 0, 0, 1] and score == 3
@@ -0,0 +1,61 @@
+import os
+import types
+
+from cache import ResultCache
+from experiment import run_experiment
+from lista2 import exercicio7
+
+
+def fake_module(path, source):
+    path.write_text(source, encoding="utf-8")
+    module = types.ModuleType("fake_exercise")
+    module.__file__ = str(path)
+    return module
+
+
+def test_get_returns_what_put_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.get("missing") is None
+    cache.put("key", {"summary": {"x": 1.5}})
+    assert cache.get("key") == {"summary": {"x": 1.5}}
+
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    (tmp_path / "key.json").write_text("{", encoding="utf-8")
+    assert cache.get("key") is None
+
+
+def test_key_depends_on_source_and_params(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    module = fake_module(tmp_path / "exercise.py", "N_RUNS = 10\n")
+    key = cache.key(module, seed=1)
+    assert cache.key(module, seed=1) == key
+    assert cache.key(module, seed=2) != key
+
+    module = fake_module(tmp_path / "exercise.py", "N_RUNS = 20\n")
+    assert cache.key(module, seed=1) != key
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10**6)
+    for age, key in enumerate(["new", "old"]):
+        cache.put(key, {"data": "x" * 100})
+        os.utime(tmp_path / f"{key}.json", (1000 - age, 1000 - age))
+
+    cache.max_bytes = 150
+    cache.evict()
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+def test_run_experiment_reuses_cached_result(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    first = run_experiment(exercicio7, seed=3, n_runs=100, cache=cache)
+    second = run_experiment(exercicio7, seed=3, n_runs=100, cache=cache)
+    assert not first.from_cache and second.from_cache
+    assert second.summary == first.summary
+    assert second.n_runs == first.n_runs
+
+    unseeded = run_experiment(exercicio7, n_runs=100, cache=cache)
+    assert not unseeded.from_cache
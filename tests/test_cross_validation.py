@@ -0,0 +1,78 @@
+import pytest
+
+import cross_validation
+from cross_validation import fold_indices, k_fold, leave_one_out
+from linear_regression import LinearRegression
+from utils import RandomStream, generate_data_with_noise, transform_features
+
+
+@pytest.fixture(scope="module")
+def data():
+    X, y = generate_data_with_noise(
+        n_points=40, noise_percentage=0.1, rng=RandomStream(4)
+    )
+    return transform_features(X).materialize(), y
+
+
+def explicit_loo(X, y, weight_decay):
+    squared_error = 0.0
+    mistakes = 0
+    for i in range(len(X)):
+        model = LinearRegression(weight_decay=weight_decay)
+        model.fit(X[:i] + X[i + 1 :], y[:i] + y[i + 1 :])
+        residual = y[i] - sum(w * x for w, x in zip(model.weights, X[i]))
+        squared_error += residual * residual
+        mistakes += model.predict_batch([X[i]])[0] != y[i]
+    return squared_error / len(X), mistakes / len(X)
+
+
+@pytest.mark.parametrize("weight_decay", [0.0, 0.7])
+def test_leave_one_out_matches_refits(data, weight_decay):
+    X, y = data
+    errors = leave_one_out(X, y, weight_decay)
+    squared_error, classification_error = explicit_loo(X, y, weight_decay)
+    assert errors["squared_error"] == pytest.approx(squared_error, rel=1e-9)
+    assert errors["classification_error"] == classification_error
+
+
+def test_k_fold_with_one_point_per_fold_is_leave_one_out(data):
+    X, y = data
+    loo = leave_one_out(X, y, 0.3)
+    folds = k_fold(X, y, k=len(X), weight_decay=0.3)
+    assert folds["squared_error"] == pytest.approx(loo["squared_error"], rel=1e-9)
+    assert folds["classification_error"] == loo["classification_error"]
+
+
+def test_fold_indices_partition_samples():
+    folds = fold_indices(10, 3, RandomStream(0))
+    assert sorted(len(fold) for fold in folds) == [3, 3, 4]
+    assert sorted(i for fold in folds for i in fold) == list(range(10))
+
+
+def test_cross_validation_rejects_qr_and_bad_k(data):
+    X, y = data
+    with pytest.raises(ValueError):
+        leave_one_out(X, y, solver="qr")
+    with pytest.raises(ValueError):
+        k_fold(X, y, k=1)
+    with pytest.raises(ValueError):
+        k_fold(X, y, k=len(X) + 1)
+
+
+def test_leave_one_out_factors_once_and_accepts_iterators(data, monkeypatch):
+    X, y = data
+    expected = leave_one_out(X, y, 0.7)
+    calls = []
+    original = cross_validation.solve_many
+    monkeypatch.setattr(
+        cross_validation,
+        "solve_many",
+        lambda A, B, method: calls.append(len(B)) or original(A, B, method),
+    )
+    monkeypatch.setattr(
+        cross_validation.LinearRegression,
+        "finalize",
+        lambda self: pytest.fail("os pesos devem sair da mesma fatoração"),
+    )
+    assert leave_one_out(iter(X), iter(y), 0.7) == expected
+    assert calls == [len(X) + 1]
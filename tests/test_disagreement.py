@@ -0,0 +1,49 @@
+import pytest
+
+from disagreement import (
+    clip_polygon,
+    disagreement,
+    exact_disagreement,
+    polygon_area,
+    square,
+    target_line,
+)
+from utils import RandomStream
+
+
+def test_clipping_the_square_by_a_diagonal_halves_it():
+    half = clip_polygon(square(), (0.0, 1.0, -1.0))
+    assert polygon_area(square()) == pytest.approx(4.0)
+    assert polygon_area(half) == pytest.approx(2.0)
+    assert polygon_area(clip_polygon(square(), (-5.0, 1.0, 1.0))) == 0.0
+
+
+def test_exact_disagreement_of_same_and_opposite_lines():
+    line = (0.1, -0.4, 0.9)
+    assert exact_disagreement(line, line) == pytest.approx(0.0)
+    assert exact_disagreement(line, tuple(-w for w in line)) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_exact_disagreement_matches_sampling(seed):
+    rng = RandomStream(seed)
+    point1 = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+    point2 = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+    weights = [rng.uniform(-0.5, 0.5), rng.uniform(-1, 1), rng.uniform(-1, 1)]
+
+    def predict_batch(X):
+        return [
+            1 if weights[0] + weights[1] * a + weights[2] * b > 0 else -1 for a, b in X
+        ]
+
+    exact = exact_disagreement(target_line(point1, point2), tuple(weights))
+    sampled = disagreement(
+        point1, point2, predict_batch, rng=RandomStream(seed + 100), n_points=20000
+    )
+    # Desvio padrão da estimativa: no máximo sqrt(0.25 / 20000) ≈ 0.0035
+    assert sampled == pytest.approx(exact, abs=0.015)
+
+
+def test_disagreement_rejects_nonplanar_weights():
+    with pytest.raises(ValueError):
+        disagreement((0, 0), (1, 1), [0.0, 1.0])
@@ -0,0 +1,102 @@
+import statistics
+
+import pytest
+
+from constants import MIN_RUNS
+from experiment import (
+    RunningStats,
+    closest_alternative,
+    is_decided,
+    run_experiment,
+    sequential_level,
+    shard_ranges,
+    should_stop,
+    simulate_shard,
+)
+from lista2 import exercicio7, exercicio8, exercicio9
+from utils import RandomStream
+
+
+def running_stats(values):
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+    return stats
+
+
+def test_shard_ranges_cover_all_runs():
+    assert shard_ranges(120, 50) == [(0, 50), (50, 100), (100, 120)]
+    assert shard_ranges(0, 50) == []
+
+
+def test_batched_runs_match_single_runs():
+    root = RandomStream(4)
+    expected = [exercicio7.simulate_run(root.spawn(k)) for k in range(30)]
+    assert exercicio7.simulate_runs([root.spawn(k) for k in range(30)]) == expected
+    assert simulate_shard(exercicio7.__name__, 4, 0, 30) == expected
+
+
+def test_result_does_not_depend_on_jobs():
+    serial = run_experiment(exercicio7, seed=11, jobs=1, n_runs=120)
+    parallel = run_experiment(exercicio7, seed=11, jobs=2, n_runs=120)
+    assert serial.summary == parallel.summary
+    assert serial.n_runs == parallel.n_runs
+    assert serial.stopped_early == parallel.stopped_early
+
+
+def test_running_stats_match_statistics_module():
+    values = [1e9 + value for value in (0.5, 1.5, 2.0, 7.25, 3.0)]
+    stats = running_stats(values)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+
+
+def test_closest_alternative_and_decision():
+    assert closest_alternative(19.0, [1, 15, 300]) == 1
+    assert closest_alternative(8.0, [1, 15]) == 0
+    assert is_decided(running_stats([14.0, 16.0] * 50), [1, 15, 300])
+    assert not is_decided(running_stats([0.0, 16.0] * 50), [1, 15, 300])
+
+
+def test_should_stop_waits_for_min_runs():
+    decided = {"x": running_stats([15.0] * (MIN_RUNS - 1))}
+    assert not should_stop(decided, {"x": [1, 15, 300]}, None)
+    decided["x"].update(15.0)
+    assert should_stop(decided, {"x": [1, 15, 300]}, None)
+    assert should_stop(decided, None, 0.1)
+    assert not should_stop(decided, None, None)
+
+
+def test_early_stop():
+    result = run_experiment(exercicio7, seed=11)
+    assert result.stopped_early
+    assert MIN_RUNS <= result.n_runs < exercicio7.N_RUNS
+
+    full = run_experiment(exercicio7, seed=11, n_runs=300, early_stop=False)
+    assert not full.stopped_early
+    assert full.n_runs == 300
+
+
+def test_sequential_level_splits_the_error_across_looks():
+    assert sequential_level(1, 0.99) == pytest.approx(0.99)
+    assert sequential_level(10, 0.99) == pytest.approx(0.999)
+    assert sequential_level(0, 0.99) == pytest.approx(0.99)
+
+    # Média 8 e erro padrão ≈ 0.8: a fronteira entre 1 e 11 fica a 2.5 erros padrão
+    stats = running_stats([0.0, 16.0] * 50)
+    assert is_decided(stats, [1, 11], 0.9)
+    assert not is_decided(stats, [1, 11], 0.999)
+
+
+def test_no_early_stop_ignores_target_width():
+    result = run_experiment(
+        exercicio7, seed=11, n_runs=200, early_stop=False, target_width=1e9
+    )
+    assert not result.stopped_early
+    assert result.n_runs == 200
+
+
+def test_every_metric_with_choices_is_decided():
+    assert set(exercicio8.ALTERNATIVES) == {"iterations", "disagreement"}
+    assert not hasattr(exercicio9, "ALTERNATIVES")
@@ -0,0 +1,94 @@
+from itertools import combinations_with_replacement
+from math import comb
+
+import pytest
+
+from features import LazyFeatures, PolynomialFeatures
+from linear_regression import LinearRegression
+from matrix import Matrix
+from utils import transform_features, without_transformation
+
+X = [[0.5, -1.0], [2.0, 0.25], [-0.75, 1.5], [1.0, 1.0], [0.0, -2.0]]
+
+
+def test_stages_run_only_when_rows_are_consumed():
+    calls = []
+
+    def double(row):
+        calls.append(row)
+        return [2 * value for value in row]
+
+    features = LazyFeatures(X, double).then(lambda row: [row[0] + row[1]])
+    assert calls == []
+    rows = iter(features)
+    assert next(rows) == [-1.0]
+    assert len(calls) == 1
+    assert features.materialize() == [[2 * (a + b)] for a, b in X]
+
+
+def test_sequence_protocol():
+    features = LazyFeatures(X, lambda row: [row[1]])
+    assert len(features) == len(X)
+    assert features[2] == [1.5]
+    assert isinstance(features[1:3], LazyFeatures)
+    assert features[1:3].materialize() == [[0.25], [1.5]]
+    assert [len(chunk) for chunk in features.chunks(2)] == [2, 2, 1]
+
+
+def test_to_matrix_matches_materialize():
+    features = without_transformation(X)
+    matrix = features.to_matrix()
+    assert isinstance(matrix, Matrix)
+    assert matrix.tolist() == features.materialize()
+
+
+def test_transform_features_layout():
+    assert transform_features([[2.0, 3.0]]).materialize() == [
+        [1, 2.0, 3.0, 6.0, 4.0, 9.0]
+    ]
+
+
+def test_fit_consumes_lazy_features():
+    y = [1.0, -1.0, 1.0, 1.0, -1.0]
+    expected = LinearRegression()
+    expected.fit(without_transformation(X).materialize(), y)
+    model = LinearRegression()
+    model.fit(without_transformation(X), y)
+    assert model.weights == pytest.approx(expected.weights, abs=1e-12)
+
+
+def test_quadratic_plan_order():
+    features = PolynomialFeatures(2, 2)
+    assert features.powers == [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)]
+    assert features((2.0, 3.0)) == (1.0, 2.0, 3.0, 4.0, 6.0, 9.0)
+
+
+@pytest.mark.parametrize("degree, n_inputs", [(0, 2), (3, 2), (3, 3), (4, 1)])
+def test_plan_generates_every_monomial_once(degree, n_inputs):
+    features = PolynomialFeatures(degree, n_inputs)
+    assert features.n_output_features == comb(degree + n_inputs, n_inputs)
+    assert len(set(features.powers)) == len(features.powers)
+
+    x = (0.5, -1.5, 2.0)[:n_inputs]
+    expected = []
+    for d in range(degree + 1):
+        for variables in combinations_with_replacement(range(n_inputs), d):
+            value = 1.0
+            for var in variables:
+                value *= x[var]
+            expected.append(value)
+    assert sorted(features(x)) == pytest.approx(sorted(expected))
+
+
+def test_columns_match_rows():
+    features = PolynomialFeatures(3, 2, include_bias=False)
+    columns = features.transform_columns(list(zip(*X)))
+    assert [tuple(row) for row in zip(*columns)] == [features(x) for x in X]
+    assert features.transform(X).materialize() == [list(features(x)) for x in X]
+
+
+def test_invalid_plan_is_rejected():
+    with pytest.raises(ValueError):
+        PolynomialFeatures(-1, 2)
+    with pytest.raises(ValueError):
+        PolynomialFeatures(2, 0)
@@ -0,0 +1,235 @@
+import random
+
+import pytest
+
+import linear_regression
+from linear_regression import LinearRegression, NormalEquations
+from solvers import symmetric_eigen
+
+
+def noisy_data(n_samples=200, seed=0):
+    rng = random.Random(seed)
+    X = [[1.0, rng.uniform(-1, 1), rng.uniform(-1, 1)] for _ in range(n_samples)]
+    y = [x1 - 0.5 * x2 + rng.gauss(0, 0.1) for _, x1, x2 in X]
+    return X, y
+
+
+def test_predict_batch_is_sign_of_decision_function():
+    model = LinearRegression()
+    model.weights = [0.5, -1.0, 2.0]
+    X = [[1, 0.5, 0.0], [1, 0.0, -1.0], [1, 1.5, 0.5]]
+    assert model.decision_function(X) == pytest.approx([0.0, -1.5, 0.0])
+    # Como em `sign`, uma saída nula é classificada como 1
+    assert model.predict_batch(X) == [1, -1, 1]
+    assert model.predict(X) == model.predict_batch(X)
+
+
+def test_fit_recovers_exact_linear_target():
+    X = [[1.0, x1, x2] for x1 in (-1.0, 0.0, 0.5, 2.0) for x2 in (-0.5, 1.0, 3.0)]
+    y = [0.5 - 2.0 * x1 + 0.25 * x2 for _, x1, x2 in X]
+    model = LinearRegression()
+    model.fit(X, y)
+    assert model.weights == pytest.approx([0.5, -2.0, 0.25], abs=1e-9)
+
+
+@pytest.mark.parametrize("solver", ["cholesky", "qr", "gauss", "inverse"])
+def test_solvers_agree(solver):
+    X = [[1.0, x1, x1 * x2] for x1 in (-1.0, 0.3, 2.0) for x2 in (-0.5, 1.0, 1.5)]
+    y = [1.0 if x1 > 0 else -1.0 for _, x1, _ in X]
+    reference = LinearRegression("inverse")
+    reference.fit(X, y)
+    model = LinearRegression(solver)
+    model.fit(X, y)
+    assert model.weights == pytest.approx(reference.weights, abs=1e-9)
+
+
+def test_unknown_solver_is_rejected():
+    with pytest.raises(ValueError):
+        LinearRegression("svd")
+
+
+def test_partial_fit_over_chunks_matches_fit():
+    X, y = noisy_data()
+    expected = LinearRegression()
+    expected.fit(X, y)
+
+    model = LinearRegression()
+    for start in range(0, len(X), 64):
+        model.partial_fit(iter(X[start : start + 64]), y[start : start + 64])
+    assert model.statistics.n_samples == len(X)
+    assert model.weights == pytest.approx(expected.weights, abs=1e-12)
+
+
+def test_merged_statistics_match_fit():
+    X, y = noisy_data()
+    expected = LinearRegression()
+    expected.fit(X, y)
+
+    first, second = NormalEquations(), NormalEquations()
+    first.update(X[:50], y[:50])
+    second.update(X[50:], y[50:])
+    merged = first + second
+    assert first.n_samples == 50 and merged.n_samples == len(X)
+
+    model = LinearRegression.from_statistics(merged)
+    assert model.weights == pytest.approx(expected.weights, abs=1e-12)
+
+
+def test_subtracted_statistics_match_the_remaining_samples():
+    X, y = noisy_data()
+    total, removed, remaining = NormalEquations(), NormalEquations(), NormalEquations()
+    total.update(X, y)
+    removed.update(X[:100], y[:100])
+    remaining.update(X[100:], y[100:])
+
+    difference = total - removed
+    assert difference.n_samples == remaining.n_samples
+    for row, expected in zip(difference.X_T_X, remaining.X_T_X):
+        assert row == pytest.approx(expected, rel=1e-12)
+    assert difference.X_T_y == pytest.approx(remaining.X_T_y, rel=1e-12)
+    with pytest.raises(ValueError):
+        removed - total
+
+
+def test_residual_sum_of_squares_matches_direct_sum():
+    X, y = noisy_data()
+    statistics = NormalEquations()
+    statistics.update(X, y)
+    weights = [0.1, 0.9, -0.4]
+    direct = sum(
+        (sum(w * x_j for w, x_j in zip(weights, x)) - target) ** 2
+        for x, target in zip(X, y)
+    )
+    assert statistics.residual_sum_of_squares(weights) == pytest.approx(direct)
+
+
+def test_qr_rejects_partial_fit():
+    with pytest.raises(ValueError):
+        LinearRegression("qr").partial_fit([[1.0, 0.0]], [1.0])
+
+
+def test_weight_decay_solvers_agree():
+    X, y = noisy_data(50, seed=5)
+    reference = LinearRegression("inverse", weight_decay=0.7)
+    reference.fit(X, y)
+    for solver in ("cholesky", "qr", "gauss"):
+        model = LinearRegression(solver, weight_decay=0.7)
+        model.fit(X, y)
+        assert model.weights == pytest.approx(reference.weights, abs=1e-9)
+    with pytest.raises(ValueError):
+        LinearRegression(weight_decay=-1.0)
+
+
+def test_fit_path_matches_separate_ridge_fits():
+    X, y = noisy_data(80, seed=6)
+    lambdas = [0.0, 0.1, 5.0]
+    path = LinearRegression().fit_path(X, y, lambdas)
+    assert [point["lambda"] for point in path] == lambdas
+    for point in path:
+        model = LinearRegression(weight_decay=point["lambda"])
+        model.fit(X, y)
+        assert point["weights"] == pytest.approx(model.weights, abs=1e-9)
+        rss = model.statistics.residual_sum_of_squares(model.weights)
+        assert point["train_mse"] == pytest.approx(rss / len(X))
+
+
+def test_fit_path_keeps_the_best_validation_lambda():
+    X, y = noisy_data(60, seed=7)
+    X_val, y_val = noisy_data(40, seed=8)
+    y_val = [1.0 if target >= 0 else -1.0 for target in y_val]
+    model = LinearRegression()
+    path = model.fit_path(X, y, [0.0, 1.0, 100.0], X_val, y_val)
+    for point in path:
+        outputs = [sum(w * x_j for w, x_j in zip(point["weights"], x)) for x in X_val]
+        errors = sum((1 if z >= 0 else -1) != t for z, t in zip(outputs, y_val))
+        assert point["val_error"] == pytest.approx(errors / len(X_val))
+    best = min(path, key=lambda point: (point["val_error"], point["val_mse"]))
+    assert model.weight_decay == best["lambda"]
+    assert model.weights == best["weights"]
+    with pytest.raises(ValueError):
+        model.fit_path(X, y, [])
+    with pytest.raises(ValueError):
+        model.fit_path(X, y, [-1.0])
+    with pytest.raises(ValueError):
+        model.fit_path(X, y, [1.0], X_val)
+
+
+def test_fit_path_reuses_the_eigendecomposition_until_the_data_changes(monkeypatch):
+    calls = []
+
+    def counting_eigen(A):
+        calls.append(A)
+        return symmetric_eigen(A)
+
+    monkeypatch.setattr(linear_regression, "symmetric_eigen", counting_eigen)
+    X, y = noisy_data(50, seed=9)
+    model = LinearRegression()
+    first = model.fit_path(X, y, [0.0, 1.0])
+    second = model.fit_path(None, None, [1.0, 10.0])
+    assert len(calls) == 1
+    assert second[0]["weights"] == first[1]["weights"]
+
+    model.partial_fit(*noisy_data(10, seed=10))
+    model.fit_path(None, None, [1.0])
+    assert len(calls) == 2
+    model.fit(X, y)
+    with pytest.raises(ValueError):
+        model.fit_path(X, None, [1.0])
+    model.fit_path(None, None, [1.0])
+    assert len(calls) == 3
+    with pytest.raises(ValueError):
+        LinearRegression().fit_path(None, None, [1.0])
+
+
+@pytest.mark.parametrize("solver", ["cholesky", "qr", "gauss"])
+@pytest.mark.parametrize("weight_decay", [0.0, 0.5])
+def test_fit_targets_matches_separate_fits(solver, weight_decay):
+    X, y = noisy_data(60, seed=9)
+    rng = random.Random(10)
+    targets = [y, [rng.uniform(-1, 1) for _ in X], [2.0 * t for t in y]]
+
+    model = LinearRegression(solver, weight_decay=weight_decay)
+    by_targets = model.fit_targets(X, targets, layout="targets")
+    by_samples = model.fit_targets(iter(X), list(zip(*targets)))
+    for weights, samples_weights, target in zip(by_targets, by_samples, targets):
+        expected = LinearRegression(solver, weight_decay=weight_decay)
+        expected.fit(X, target)
+        assert weights == pytest.approx(expected.weights, abs=1e-9)
+        assert samples_weights == pytest.approx(expected.weights, abs=1e-9)
+
+
+def test_fit_targets_validates_its_input():
+    X, y = noisy_data(10)
+    model = LinearRegression()
+    assert model.fit_targets(X, [], layout="targets") == []
+    with pytest.raises(ValueError):
+        model.fit_targets(X, [y[:-1]], layout="targets")
+    with pytest.raises(ValueError):
+        model.fit_targets(X, [y], layout="columns")
+
+
+def test_from_statistics_rejects_qr():
+    with pytest.raises(ValueError):
+        LinearRegression.from_statistics(NormalEquations(), "qr")
+
+
+def test_normal_equations_reject_width_mismatch():
+    statistics = NormalEquations()
+    statistics.update([[1.0, 2.0, 3.0]], [1.0])
+    with pytest.raises(ValueError):
+        statistics.update([[1.0, 2.0]], [1.0])
+    with pytest.raises(ValueError):
+        NormalEquations().update([[1.0, 2.0], [1.0]], [1.0, -1.0])
+
+
+def test_fit_targets_streams_over_several_chunks():
+    X, y = noisy_data(1100, seed=11)
+    expected = LinearRegression()
+    expected.fit(X, y)
+    model = LinearRegression()
+    [weights] = model.fit_targets(iter(X), [[target] for target in y])
+    assert weights == pytest.approx(expected.weights, abs=1e-12)
+    [weights] = model.fit_targets(X, [y], layout="targets")
+    assert weights == pytest.approx(expected.weights, abs=1e-12)
+    with pytest.raises(ValueError):
+        model.fit_targets(X, [[target, 0.0] for target in y[:-1]] + [[1.0]])
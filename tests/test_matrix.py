@@ -0,0 +1,91 @@
+import pytest
+
+from matrix import Matrix, as_matrix, typecode_of
+from utils import (
+    RandomStream,
+    generate_data,
+    matrix_multiply,
+    transform_features,
+    transpose,
+)
+
+ROWS = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def test_from_rows_round_trip():
+    matrix = Matrix.from_rows(ROWS)
+    assert matrix.shape == (2, 3)
+    assert matrix.tolist() == ROWS
+    assert matrix[1, 2] == 6.0
+    assert as_matrix(matrix) is matrix
+
+
+def test_from_rows_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        Matrix.from_rows([[1.0, 2.0], [3.0]])
+
+
+def test_views_share_the_buffer():
+    matrix = Matrix.from_rows(ROWS)
+    transposed = matrix.T
+    assert transposed.shape == (3, 2)
+    assert transposed.tolist() == [list(column) for column in zip(*ROWS)]
+    assert list(matrix.column(1)) == [2.0, 5.0]
+
+    # Escrever no buffer aparece em todas as visões
+    matrix._data[0] = 10.0
+    assert transposed[0, 0] == 10.0
+    assert list(matrix.row(0)) == [10.0, 2.0, 3.0]
+
+
+def test_with_bias_is_an_implicit_column_of_ones():
+    matrix = Matrix.from_rows(ROWS).with_bias()
+    assert matrix.shape == (2, 4)
+    assert matrix.tolist() == [[1.0, *row] for row in ROWS]
+    assert matrix.T.tolist() == [list(column) for column in zip(*matrix.tolist())]
+    with pytest.raises(ValueError):
+        matrix.with_bias()
+
+
+def test_utils_accept_matrices():
+    A = Matrix.from_rows(ROWS)
+    B = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+    assert matrix_multiply(A, Matrix.from_rows(B)) == matrix_multiply(ROWS, B)
+    assert transpose(A).tolist() == transpose(ROWS)
+
+
+def test_to_numpy_shares_the_buffer():
+    np = pytest.importorskip("numpy")
+    matrix = Matrix.from_rows(ROWS)
+    assert np.shares_memory(matrix.T.to_numpy(), np.frombuffer(matrix._data))
+    assert matrix.T.to_numpy().tolist() == matrix.T.tolist()
+    assert matrix.with_bias().to_numpy().tolist() == matrix.with_bias().tolist()
+
+
+def test_typecode_of():
+    assert typecode_of("float64") == "d"
+    assert typecode_of("float32") == "f"
+    with pytest.raises(ValueError):
+        typecode_of("float16")
+
+
+def test_float32_matrix_uses_half_the_memory():
+    rows = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    double = Matrix.from_rows(rows)
+    single = as_matrix(double, "f")
+    assert (double.typecode, single.typecode) == ("d", "f")
+    assert single.nbytes * 2 == double.nbytes == 48
+    assert list(single) == [pytest.approx(row, rel=1e-7) for row in rows]
+    assert as_matrix(single) is single
+    assert as_matrix(single, "f") is single
+
+
+def test_generate_data_dtype_keeps_labels_consistent():
+    X64, y64 = generate_data(100, rng=RandomStream(1))
+    X32, y32 = generate_data(100, rng=RandomStream(1), dtype="float32")
+    assert isinstance(X64, list) and X32.typecode == "f"
+    assert list(X32) == [pytest.approx(row, rel=1e-7) for row in X64]
+    assert len(y32) == len(y64) == 100
+    assert transform_features(X32).typecode == "f"
+    assert transform_features(X32).to_matrix().typecode == "f"
+    assert transform_features(X64).to_matrix().typecode == "d"
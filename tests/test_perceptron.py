@@ -0,0 +1,168 @@
+import random
+
+import pytest
+
+from linear_regression import LinearRegression
+from matrix import Matrix
+from perceptron import Perceptron, compare_initializations, fit_batch
+from utils import RandomStream, generate_data, without_transformation
+
+
+def batch(n_problems=20, n_points=10, seed=0):
+    random.seed(seed)
+    data = [generate_data(n_points) for _ in range(n_problems)]
+    return [X for X, _ in data], [y for _, y in data]
+
+
+def test_fit_batch_matches_separate_fits():
+    X_batch, y_batch = batch()
+    random.seed(1)
+    weights, iterations = fit_batch(X_batch, y_batch)
+
+    # Os pesos iniciais são sorteados na mesma ordem que em fits separados
+    random.seed(1)
+    for k, (X, y) in enumerate(zip(X_batch, y_batch)):
+        pla = Perceptron()
+        pla.fit(X, y)
+        assert pla.weights == weights[k]
+        assert pla.iterations == iterations[k]
+
+
+def test_fit_batch_numpy_backend_is_identical():
+    pytest.importorskip("numpy")
+    X_batch, y_batch = batch(50)
+    random.seed(2)
+    expected = fit_batch(X_batch, y_batch)
+    random.seed(2)
+    assert fit_batch(X_batch, y_batch, backend="numpy") == expected
+
+
+def test_fit_batch_rejects_empty_datasets():
+    with pytest.raises(ValueError):
+        fit_batch([[]], [[]])
+    with pytest.raises(ValueError):
+        fit_batch([[[0.0, 1.0]]], [[1]], backend="fortran")
+    assert fit_batch([], []) == ([], [])
+
+
+def test_incremental_mode_converges():
+    random.seed(5)
+    X, y = generate_data(100)
+    pla = Perceptron(mode="incremental", n_iters=100000)
+    pla.fit(X, y)
+    assert [pla.predict([1, *x]) for x in X] == y
+
+
+def test_incremental_mode_counts_single_updates():
+    # Um único ponto mal classificado é corrigido por uma única atualização
+    pla = Perceptron(mode="incremental", learning_rate=1.0)
+    random.seed(0)
+    pla.fit([[1.0, 1.0]], [-1])
+    assert pla.iterations == 1
+
+
+@pytest.mark.parametrize("label, updates", [(-1, 0), (1, 1)])
+def test_incremental_zero_margin_matches_sweep(label, updates):
+    # Com pesos nulos, z = 0 é classificado como -1 nos dois modos
+    for mode, expected in (("incremental", updates), ("sweep", updates + 1)):
+        pla = Perceptron(mode=mode, rng=RandomStream(0))
+        pla.fit([[1.0, 0.0]], [label], init="zeros")
+        assert pla.iterations == expected
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Perceptron(mode="batch")
+
+
+def test_predict_batch_matches_predict():
+    random.seed(7)
+    X, y = generate_data(50)
+    pla = Perceptron()
+    pla.fit(X, y)
+    assert pla.predict_batch(X) == [pla.predict([1, *x]) for x in X]
+    assert pla.decision_function(X) == pytest.approx(
+        [sum(w * x_j for w, x_j in zip(pla.weights, [1, *x])) for x in X]
+    )
+
+
+def test_fit_accepts_a_matrix():
+    random.seed(8)
+    X, y = generate_data(30)
+    random.seed(9)
+    expected = Perceptron()
+    expected.fit(X, y)
+    random.seed(9)
+    pla = Perceptron()
+    pla.fit(Matrix.from_rows(X), y)
+    assert pla.weights == expected.weights
+
+
+def test_initial_weights_strategies():
+    X, y = [[0.5, -0.2], [-0.3, 0.8]], [1, -1]
+    pla = Perceptron(rng=random.Random(0))
+    assert pla.initial_weights(X, y, "zeros") == [0.0, 0.0, 0.0]
+    assert pla.initial_weights(X, y, (0.1, 0.2, 0.3)) == [0.1, 0.2, 0.3]
+    rng = random.Random(0)
+    assert pla.initial_weights(X, y, "random") == [rng.random() for _ in range(3)]
+    with pytest.raises(ValueError):
+        pla.initial_weights(X, y, [0.1, 0.2])
+    with pytest.raises(ValueError):
+        pla.initial_weights(X, y, "ones")
+
+
+def test_linreg_init_starts_from_the_regression_solution():
+    random.seed(10)
+    X, y = generate_data(100)
+    expected = LinearRegression()
+    expected.fit(without_transformation(X), y)
+    assert Perceptron().initial_weights(X, y, "linreg") == pytest.approx(
+        expected.weights
+    )
+
+    pla = Perceptron(n_iters=10000)
+    pla.fit(X, y, "linreg")
+    assert pla.predict_batch(X) == y
+
+
+def test_compare_initializations_uses_the_first_as_reference():
+    random.seed(11)
+    X, y = generate_data(50)
+    results = compare_initializations(
+        X, y, ["random", "zeros", [0.0, 1.0, 1.0]], seed=3, n_iters=10000
+    )
+    assert list(results) == ["random", "zeros", "pesos[2]"]
+    assert results["random"]["iterations_saved"] == 0
+    for result in results.values():
+        assert result["iterations_saved"] == (
+            results["random"]["iterations"] - result["iterations"]
+        )
+
+
+def test_linreg_init_accepts_any_dimension():
+    rng = random.Random(12)
+    X = [[rng.uniform(-1, 1) for _ in range(3)] for _ in range(40)]
+    y = [1 if x1 + 0.5 * x2 - x3 > 0 else -1 for x1, x2, x3 in X]
+    weights = Perceptron().initial_weights(X, y, "linreg")
+    assert len(weights) == 4
+
+    pla = Perceptron(n_iters=10000)
+    pla.fit(X, y, "linreg")
+    assert pla.predict_batch(X) == y
+
+
+def test_compare_initializations_is_reproducible_for_a_seed():
+    random.seed(13)
+    X, y = generate_data(30)
+    first = compare_initializations(X, y, ["random", "linreg"], seed=5)
+    second = compare_initializations(X, y, ["random", "linreg"], seed=5)
+    assert [r["iterations"] for r in first.values()] == [
+        r["iterations"] for r in second.values()
+    ]
+
+
+def test_compare_initializations_rejects_repeated_inits():
+    random.seed(14)
+    X, y = generate_data(20)
+    with pytest.raises(ValueError):
+        compare_initializations(X, y, ["zeros", "random", "zeros"], seed=1)
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+import profiling
+from linear_regression import LinearRegression
+from perceptron import fit_batch
+from utils import RandomStream, generate_data, transform_features
+
+
+@pytest.fixture
+def enabled():
+    profiling.enable()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+@profiling.timed("sleep")
+def sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_disabled_records_nothing():
+    assert not profiling.is_enabled()
+    assert sleep(0) == 0
+    with profiling.phase("block"):
+        pass
+    assert profiling.phase_totals() == {}
+
+    rows = iter([1, 2])
+    assert profiling.timed_iter("rows", rows) is rows
+
+
+def test_nested_phases_are_exclusive(enabled):
+    with profiling.phase("outer"):
+        sleep(0.02)
+        sleep(0.02)
+    totals = profiling.phase_totals()
+    assert totals["sleep"][1] == 2
+    assert totals["outer"][1] == 1
+    assert totals["sleep"][0] >= 0.04
+    assert totals["outer"][0] < 0.02
+    assert list(totals) == ["sleep", "outer"]
+
+
+def test_timed_iter_counts_one_call_per_batch(enabled):
+    def slow_rows():
+        for x in range(3):
+            time.sleep(0.01)
+            yield x
+
+    with profiling.phase("consumer"):
+        assert list(profiling.timed_iter("rows", slow_rows())) == [0, 1, 2]
+    totals = profiling.phase_totals()
+    assert totals["rows"][1] == 1
+    assert totals["rows"][0] >= 0.03
+    assert totals["consumer"][0] < 0.01
+
+
+def test_transform_is_one_phase_per_pass(enabled):
+    X, y = generate_data(50, rng=RandomStream(0))
+    features = transform_features(X)
+    model = LinearRegression()
+    model.fit(features, y)
+    model.predict_batch(features)
+    assert profiling.phase_totals()["transform_features"][1] == 2
+
+
+def test_fit_batch_has_its_own_phase(enabled):
+    X_batch = [[[0.5, 0.5], [-0.5, -0.5]]] * 2
+    fit_batch(X_batch, [[1, -1]] * 2)
+    totals = profiling.phase_totals()
+    assert totals["Perceptron.fit_batch"][1] == 1
+    assert "Perceptron.fit" not in totals
+
+
+def test_models_report_their_phases(enabled):
+    model = LinearRegression()
+    model.fit([[1.0, 0.0], [1.0, 1.0], [1.0, 2.0]], [0.0, 1.0, 2.0])
+    model.predict_batch([[1.0, 3.0]])
+    assert {"LinearRegression.fit", "LinearRegression.predict"} <= set(
+        profiling.phase_totals()
+    )
@@ -0,0 +1,67 @@
+import io
+import threading
+
+from utils import ProgressReporter, format_duration
+
+
+class Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_format_duration():
+    assert format_duration(0.4) == "0:00:00"
+    assert format_duration(3725) == "1:02:05"
+
+
+def test_updates_are_rate_limited():
+    stream = Terminal()
+    with ProgressReporter(1000, stream=stream, interval=3600) as progress:
+        for _ in range(1000):
+            progress.update()
+    # A primeira atualização e o estado final
+    assert stream.getvalue().count("\r") == 2
+    assert "1000/1000 (100%)" in stream.getvalue()
+    assert stream.getvalue().endswith("\n")
+
+
+def test_plain_lines_outside_a_terminal():
+    stream = io.StringIO()
+    progress = ProgressReporter(10, "Testando", stream=stream, line_interval=3600)
+    progress.update(4, {"x": 0.5})
+    progress.close()
+    progress.close()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("Testando: 4/10 (40%)")
+    assert lines[0].endswith("| x=0.5")
+    assert "\033" not in stream.getvalue()
+
+
+def test_updates_from_threads_are_all_counted():
+    progress = ProgressReporter(800, stream=io.StringIO(), line_interval=3600)
+    threads = [
+        threading.Thread(target=lambda: [progress.update() for _ in range(100)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert progress.done == 800
+
+
+def test_transient_progress_erases_its_line():
+    stream = Terminal()
+    with ProgressReporter(3, "Medindo", stream=stream, transient=True) as progress:
+        progress.update()
+    assert stream.getvalue().endswith("\r\033[K")
+    assert not stream.getvalue().endswith("\n")
+
+
+def test_transient_progress_is_quiet_outside_a_terminal():
+    stream = io.StringIO()
+    with ProgressReporter(3, "Medindo", stream=stream, transient=True) as progress:
+        progress.update(3)
+    assert progress.done == 3
+    assert stream.getvalue() == ""
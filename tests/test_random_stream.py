@@ -0,0 +1,57 @@
+import pickle
+import random
+
+import pytest
+
+from utils import RandomStream, generate_data
+
+
+def draws(rng, n=5):
+    return [rng.random() for _ in range(n)]
+
+
+def test_spawn_depends_only_on_seed_and_path():
+    root = RandomStream(42)
+    first = draws(root.spawn(3))
+    draws(root, 100)
+    assert draws(root.spawn(3)) == first
+    assert draws(RandomStream(42, (3,))) == first
+    assert draws(RandomStream(42).spawn(3)) == first
+
+
+def test_spawned_streams_differ():
+    root = RandomStream(42)
+    assert draws(root.spawn(0)) != draws(root.spawn(1))
+    assert draws(root.spawn(0)) != draws(RandomStream(43).spawn(0))
+    assert draws(root.spawn(0).spawn(1)) != draws(root.spawn(1).spawn(0))
+
+
+def test_pickle_keeps_state():
+    rng = RandomStream(7).spawn(2)
+    draws(rng, 3)
+    copy = pickle.loads(pickle.dumps(rng))
+    assert copy.path == rng.path
+    assert draws(copy) == draws(rng)
+
+
+def test_generate_data_is_reproducible():
+    assert generate_data(20, rng=RandomStream(1)) == generate_data(
+        20, rng=RandomStream(1)
+    )
+
+
+def test_generate_data_matches_the_global_random_module():
+    random.seed(3)
+    expected = generate_data(20)
+    assert generate_data(20, rng=random.Random(3)) == expected
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_points_are_reproducible(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    points = RandomStream(5).spawn(1).points(100, 3, (-2, 2), backend=backend)
+    assert points.shape == (100, 3)
+    assert all(-2 <= value < 2 for row in points for value in row)
+    again = RandomStream(5).spawn(1).points(100, 3, (-2, 2), backend=backend)
+    assert points.tolist() == again.tolist()
@@ -0,0 +1,135 @@
+import json
+import os
+
+import pytest
+
+import registry
+
+EXERCISE = '''
+from utils.color import Color
+
+N_RUNS = 500
+N_POINTS = 10
+HYPOTHESES = ["a", "b"]
+ALTERNATIVES = {"error": [0.01, 0.1]}
+
+
+def _instructions():
+    return f"""
+{Color.text('3. Qual é o erro?', Color.BOLD)}
+[a] {Color.text('0.01', Color.GREEN)}
+[b] 0.1
+"""
+
+
+def simulate_runs(n_runs):
+    return {}
+'''
+
+
+def write_exercise(root, list_num, name, source=EXERCISE):
+    folder = os.path.join(root, f"lista{list_num}")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"exercicio{name}.py")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(source)
+    return path
+
+
+def test_parse_exercise_reads_metadata_without_importing(tmp_path):
+    path = write_exercise(str(tmp_path), 3, "3")
+    info = registry.parse_exercise(path)
+    assert info["module"] == "lista3.exercicio3"
+    assert info["list"] == 3
+    assert info["exercise"] == "3"
+    assert info["title"] == "3. Qual é o erro?"
+    assert info["params"] == {"N_RUNS": 500, "N_POINTS": 10}
+    assert info["choices"] == {"error": [0.01, 0.1]}
+    assert info["experiment"] is True
+
+
+def test_parse_exercise_falls_back_to_instruction_choices(tmp_path):
+    source = EXERCISE.replace('ALTERNATIVES = {"error": [0.01, 0.1]}\n', "")
+    source = source.replace("def simulate_runs", "def run")
+    info = registry.parse_exercise(write_exercise(str(tmp_path), 3, "3", source))
+    assert info["choices"] == ["a) 0.01", "b) 0.1"]
+    assert info["experiment"] is False
+
+
+def test_scan_exercises_sorts_and_caches(tmp_path):
+    root = str(tmp_path)
+    for list_num, name in [(2, "10"), (1, "2"), (2, "8_2"), (2, "8")]:
+        write_exercise(root, list_num, name)
+    cache_path = os.path.join(root, "cache", "registry.json")
+
+    found = registry.scan_exercises(root, cache_path)
+    assert [(info["list"], info["exercise"]) for info in found] == [
+        (1, "2"),
+        (2, "8"),
+        (2, "8_2"),
+        (2, "10"),
+    ]
+    assert os.path.exists(cache_path)
+
+    calls = []
+    original = registry.parse_exercise
+    registry.parse_exercise = lambda path: calls.append(path) or original(path)
+    try:
+        assert registry.scan_exercises(root, cache_path) == found
+        assert calls == []
+        changed = write_exercise(root, 1, "2", EXERCISE.replace("500", "200"))
+        again = registry.scan_exercises(root, cache_path)
+    finally:
+        registry.parse_exercise = original
+    assert calls == [changed]
+    assert again[0]["params"]["N_RUNS"] == 200
+
+
+def test_find_exercise_uses_the_project_registry(monkeypatch):
+    scan = registry.scan_exercises
+    monkeypatch.setattr(registry, "scan_exercises", lambda: scan(cache_path=None))
+    info = registry.find_exercise(2, "8_2")
+    assert info is not None and info["module"] == "lista2.exercicio8_2"
+    assert registry.find_exercise(2, "99") is None
+
+
+def test_scan_exercises_marks_unparsable_files(tmp_path):
+    root = str(tmp_path)
+    write_exercise(root, 2, "7")
+    write_exercise(root, 2, "8", "def broken(:\n")
+    cache_path = os.path.join(root, "cache", "registry.json")
+
+    found = registry.scan_exercises(root, cache_path)
+    assert [info["exercise"] for info in found] == ["7", "8"]
+    assert "error" not in found[0]
+    assert found[1]["module"] == "lista2.exercicio8"
+    assert found[1]["error"].startswith("SyntaxError")
+
+    # A entrada com erro não vai para o cache: é lida de novo na próxima listagem
+    with open(cache_path, encoding="utf-8") as file:
+        assert list(json.load(file)) == [os.path.join("lista2", "exercicio7.py")]
+
+
+def test_scan_exercises_sorts_non_numeric_names(tmp_path):
+    root = str(tmp_path)
+    for name in ["9", "8_b", "8_2", "8", "10", "extra"]:
+        write_exercise(root, 2, name)
+    found = registry.scan_exercises(root, None)
+    assert [info["exercise"] for info in found] == [
+        "8",
+        "8_2",
+        "8_b",
+        "9",
+        "10",
+        "extra",
+    ]
+
+
+def test_lazy_instructions_builds_on_access():
+    calls = []
+    getattr_ = registry.lazy_instructions("exemplo", lambda: calls.append(1) or "texto")
+    assert calls == []
+    assert getattr_("INSTRUCTIONS") == "texto"
+    assert calls == [1]
+    with pytest.raises(AttributeError):
+        getattr_("OUTRO")
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from solvers import (
+    cholesky_solve,
+    gauss_solve,
+    qr_solve,
+    qr_solve_many,
+    solve,
+    solve_many,
+    symmetric_eigen,
+)
+
+
+def random_matrix(n_rows, n_columns, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(n_columns)] for _ in range(n_rows)]
+
+
+def gram(X):
+    return [[sum(a * b for a, b in zip(u, v)) for v in zip(*X)] for u in zip(*X)]
+
+
+def multiply(A, x):
+    return [sum(a * b for a, b in zip(row, x)) for row in A]
+
+
+def assert_close(actual, expected, tolerance=1e-10):
+    assert len(actual) == len(expected)
+    for a, b in zip(actual, expected):
+        assert a == pytest.approx(b, abs=tolerance)
+
+
+@pytest.mark.parametrize("method", ["cholesky", "gauss", "inverse"])
+def test_solve_recovers_solution(method):
+    A = gram(random_matrix(20, 5))
+    x = [1.0, -2.0, 0.5, 3.0, -1.5]
+    assert_close(solve(A, multiply(A, x), method), x)
+
+
+def test_gauss_solve_pivots_on_zero_diagonal():
+    A = [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]]
+    b = [1.0, 2.0, 3.0]
+    assert_close(multiply(A, gauss_solve(A, b)), b)
+
+
+def test_gauss_solve_rejects_singular_matrix():
+    with pytest.raises(ValueError):
+        gauss_solve([[1.0, 2.0], [2.0, 4.0]], [1.0, 2.0])
+
+
+def test_cholesky_solve_matches_gauss():
+    A = gram(random_matrix(30, 4, seed=1))
+    b = [1.0, 2.0, 3.0, 4.0]
+    assert_close(cholesky_solve(A, b), gauss_solve(A, b))
+
+
+def test_qr_solve_matches_normal_equations():
+    X = random_matrix(40, 4, seed=2)
+    y = [row[0] - 2 * row[3] + 0.1 for row in X]
+    X_T_y = [sum(a * b for a, b in zip(column, y)) for column in zip(*X)]
+    assert_close(qr_solve(X, y), solve(gram(X), X_T_y))
+
+
+def test_symmetric_eigen_diagonalizes():
+    A = gram(random_matrix(15, 5, seed=5))
+    eigenvalues, V = symmetric_eigen(A)
+    columns = [list(column) for column in zip(*V)]
+    for value, v in zip(eigenvalues, columns):
+        assert_close(multiply(A, v), [value * v_i for v_i in v])
+    for i, u in enumerate(columns):
+        for j, v in enumerate(columns):
+            assert sum(a * b for a, b in zip(u, v)) == pytest.approx(
+                float(i == j), abs=1e-12
+            )
+
+
+@pytest.mark.parametrize("method", ["cholesky", "gauss", "inverse"])
+def test_solve_many_matches_solve(method):
+    A = gram(random_matrix(20, 4, seed=3))
+    B = random_matrix(3, 4, seed=4)
+    for x, b in zip(solve_many(A, B, method), B):
+        assert_close(x, solve(A, b, method))
+    assert solve_many(A, [], method) == []
+
+
+def test_qr_solve_many_matches_qr_solve():
+    X = random_matrix(25, 4, seed=6)
+    Y = random_matrix(3, 25, seed=7)
+    for w, y in zip(qr_solve_many(X, Y), Y):
+        assert_close(w, qr_solve(X, y))
+
+
+def test_solve_many_pivots_every_right_hand_side():
+    A = [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]]
+    xs = [[1.0, -1.0, 2.0], [0.5, 0.0, -3.0]]
+    B = [multiply(A, x) for x in xs]
+    for x, expected in zip(solve_many(A, B, "gauss"), xs):
+        assert_close(x, expected)
+    with pytest.raises(ValueError):
+        solve_many([[1.0, 2.0], [2.0, 4.0]], [[1.0, 2.0]], "gauss")
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from utils import (
+    accumulate_cross_products,
+    matrix_multiply,
+    matrix_vector_multiply,
+    normal_equations,
+    transpose,
+)
+
+
+def random_rows(n_rows, n_columns, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(n_columns)] for _ in range(n_rows)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_normal_equations_match_explicit_products(chunk_size):
+    X = random_rows(50, 4)
+    y = [row[0] - row[2] for row in X]
+    X_T_X, X_T_y = normal_equations(iter(X), iter(y), chunk_size)
+
+    X_T = transpose(X)
+    for row, expected in zip(X_T_X, matrix_multiply(X_T, X)):
+        assert row == pytest.approx(expected, abs=1e-12)
+    assert X_T_y == pytest.approx(matrix_vector_multiply(X_T, y), abs=1e-12)
+
+
+def test_normal_equations_reject_empty_input():
+    with pytest.raises(ValueError):
+        normal_equations([], [])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_cross_products_match_explicit_products(chunk_size):
+    X = random_rows(50, 4, seed=1)
+    Y = random_rows(50, 3, seed=2)
+    X_T_Y = []
+    n_samples = accumulate_cross_products(iter(X), iter(Y), X_T_Y, chunk_size)
+
+    assert n_samples == 50
+    for row, expected in zip(X_T_Y, matrix_multiply(transpose(Y), X)):
+        assert row == pytest.approx(expected, abs=1e-12)
@@ -1,9 +1,34 @@
+import hashlib
 import os
 import random
 import shutil
-from typing import List, Tuple, Union
-
-from constants import CMD_CLEAR
+import sys
+import threading
+import time
+from array import array
+from itertools import islice
+from operator import mul
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from constants import (
+    CMD_CLEAR,
+    GRAM_CHUNK_SIZE,
+    PROGRESS_INTERVAL,
+    PROGRESS_LINE_INTERVAL,
+)
+from features import LazyFeatures, linear_features, quadratic_features
+from matrix import Dtype, Matrix, typecode_of
+from profiling import timed
 
 
 class Color:
@@ -63,19 +88,281 @@ def clear_screen() -> None:
     os.system(CMD_CLEAR)
 
 
-def generate_data(n_points: int = 10, interval: tuple[float, float] = (-1, 1)) -> tuple:
+def format_duration(seconds: float) -> str:
+    """Formata uma duração como H:MM:SS.
+
+    Args:
+        seconds (float): A duração, em segundos.
+
+    Returns:
+        str: A duração formatada.
+    """
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class ProgressReporter:
+    """Mostra o progresso de um laço de execuções, com execuções/s e tempo restante.
+
+    A linha é reescrita no máximo a cada `interval` segundos, por mais que `update` seja
+    chamado, então o custo de escrita no terminal não depende do número de execuções.
+    Quando a saída não é um terminal (um arquivo de log, um pipe), a linha não pode ser
+    sobrescrita: o progresso é impresso em linhas separadas, no máximo a cada
+    `line_interval` segundos, e sem cores. Um progresso transitório fora de um terminal
+    não escreve nada, já que a sua linha não poderia ser apagada depois.
+
+    `update` é seguro entre threads, então o progresso de vários processos pode ser
+    agregado no processo principal, por exemplo com `Future.add_done_callback`.
+
+    Args:
+        total (int): O número total de execuções.
+        label (str): O texto antes da contagem.
+        stream (Optional[TextIO]): Onde escrever. Por padrão, `sys.stdout`.
+        interval (float): O intervalo mínimo entre atualizações em um terminal.
+        line_interval (float): O intervalo mínimo entre linhas fora de um terminal.
+        transient (bool): Se `close` apaga a linha de progresso em vez de escrever o
+            estado final, para que a próxima saída ocupe o seu lugar.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        label: str = "Executando",
+        stream: Optional[TextIO] = None,
+        interval: float = PROGRESS_INTERVAL,
+        line_interval: float = PROGRESS_LINE_INTERVAL,
+        transient: bool = False,
+    ) -> None:
+        """Cria o relatório de progresso e começa a contar o tempo.
+
+        Args:
+            total (int): O número total de execuções.
+            label (str): O texto antes da contagem.
+            stream (Optional[TextIO]): Onde escrever. Por padrão, `sys.stdout`.
+            interval (float): O intervalo mínimo entre atualizações em um terminal.
+            line_interval (float): O intervalo mínimo entre linhas fora de um terminal.
+            transient (bool): Se `close` apaga a linha em vez de escrever o estado final
+                (fora de um terminal, o progresso transitório fica em silêncio).
+        """
+        self.total = total
+        self.label = label
+        self.stream = stream if stream is not None else sys.stdout
+        isatty = getattr(self.stream, "isatty", None)
+        self.is_terminal = bool(isatty and isatty())
+        self.interval = interval if self.is_terminal else line_interval
+        self.transient = transient
+        self.quiet = transient and not self.is_terminal
+        self.done = 0
+        self.metrics: Dict[str, float] = {}
+        self._start = time.perf_counter()
+        self._last_write = float("-inf")
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(self, n: int = 1, metrics: Optional[Dict[str, float]] = None) -> None:
+        """Registra execuções concluídas e, se já passou o intervalo, reescreve a linha.
+
+        Args:
+            n (int): O número de execuções concluídas desde a última chamada.
+            metrics (Optional[Dict[str, float]]): Valores atuais a mostrar junto ao
+                progresso (por exemplo, a média parcial de cada métrica).
+        """
+        with self._lock:
+            self.done += n
+            if metrics is not None:
+                self.metrics = metrics
+            if self.quiet:
+                return
+            now = time.perf_counter()
+            if now - self._last_write >= self.interval:
+                self._last_write = now
+                self._write(now)
+
+    def close(self) -> None:
+        """Escreve o estado final (ou apaga a linha) e termina a linha de progresso."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.transient:
+                if self.is_terminal:
+                    self.stream.write("\r\033[K")
+                    self.stream.flush()
+                return
+            self._write(time.perf_counter(), final=True)
+            if self.is_terminal:
+                self.stream.write("\n")
+                self.stream.flush()
+
+    def _render(self, now: float, final: bool = False) -> str:
+        """Monta o texto do progresso."""
+        elapsed = now - self._start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        text = f"{self.label}: {self.done}/{self.total}"
+        if self.total:
+            text += f" ({self.done / self.total:.0%})"
+        text += f", {rate:.1f} execuções/s"
+        if rate > 0 and self.done < self.total and not final:
+            text += f", restam {format_duration((self.total - self.done) / rate)}"
+        else:
+            text += f", em {format_duration(elapsed)}"
+        if self.metrics:
+            text += " | " + ", ".join(
+                f"{key}={value:.4g}" for key, value in self.metrics.items()
+            )
+        return text
+
+    def _write(self, now: float, final: bool = False) -> None:
+        """Escreve o progresso (chamado com o lock adquirido)."""
+        text = self._render(now, final)
+        if self.is_terminal:
+            # "\033[K" apaga o resto da linha anterior, que pode ser mais longa.
+            self.stream.write(f"\r{Color.text(text, Color.BRIGHT_YELLOW)}\033[K")
+        else:
+            self.stream.write(text + "\n")
+        self.stream.flush()
+
+
+class RandomStream(random.Random):
+    """Gerador aleatório com semente explícita e fluxos filhos independentes.
+
+    É um `random.Random` comum (pode ser passado como `rng` para as funções de geração
+    de dados), mas lembra a semente raiz e o caminho do fluxo. `spawn(k)` cria o fluxo
+    filho k, cuja semente é derivada (por SHA-256) apenas da semente raiz e do caminho:
+    a execução k de um experimento é reproduzível sem reexecutar as execuções 0..k-1, e
+    fluxos diferentes podem ser usados em processos diferentes.
+
+    Args:
+        seed (Optional[int]): A semente raiz. Se None, uma semente é sorteada do sistema
+            operacional (e fica disponível em `root_seed`).
+        path (Tuple[int, ...]): O caminho do fluxo filho a partir da raiz.
+    """
+
+    def __init__(self, seed: Optional[int] = None, path: Tuple[int, ...] = ()) -> None:
+        """Cria o fluxo a partir da semente raiz e do caminho.
+
+        Args:
+            seed (Optional[int]): A semente raiz.
+            path (Tuple[int, ...]): O caminho do fluxo filho a partir da raiz.
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+
+        self.root_seed = seed
+        self.path = path
+        self._numpy_generator = None
+        if path:
+            digest = hashlib.sha256(repr((seed, path)).encode()).digest()
+            super().__init__(int.from_bytes(digest, "big"))
+        else:
+            super().__init__(seed)
+
+    def __reduce__(self):
+        return self.__class__, (self.root_seed, self.path), self.getstate()
+
+    def spawn(self, stream: int) -> "RandomStream":
+        """Cria o fluxo filho de índice `stream`.
+
+        Args:
+            stream (int): O índice do fluxo filho (por exemplo, o número da execução).
+
+        Returns:
+            RandomStream: O fluxo filho, independente do estado atual deste fluxo.
+        """
+        return RandomStream(self.root_seed, (*self.path, stream))
+
+    def points(
+        self,
+        n_points: int,
+        n_dims: int = 2,
+        interval: Tuple[float, float] = (-1, 1),
+        backend: Literal["python", "numpy"] = "python",
+        dtype: Dtype = "float64",
+    ) -> Matrix:
+        """Gera N pontos uniformes de uma só vez em um buffer compacto.
+
+        Com o backend "numpy", os valores são sorteados em C por um
+        `numpy.random.Generator` semeado com a mesma semente raiz e caminho (os valores
+        são diferentes dos do backend "python", mas igualmente reproduzíveis).
+
+        Args:
+            n_points (int): Número de pontos.
+            n_dims (int): Número de coordenadas de cada ponto.
+            interval (Tuple[float, float]): Intervalo de cada coordenada.
+            backend (Literal["python", "numpy"]): Quem sorteia os valores.
+            dtype (Dtype): A precisão de armazenamento (os valores são sorteados em
+                float64 e arredondados para float32, se for o caso).
+
+        Returns:
+            Matrix: Os pontos, um por linha.
+
+        Raises:
+            ImportError: Se o backend "numpy" for pedido sem o NumPy instalado.
+        """
+        low, high = interval
+        size = n_points * n_dims
+        typecode = typecode_of(dtype)
+
+        if backend == "numpy":
+            import numpy as np
+
+            if self._numpy_generator is None:
+                self._numpy_generator = np.random.default_rng(
+                    [self.root_seed, *self.path]
+                )
+            values = self._numpy_generator.uniform(low, high, size)
+            values = values.astype(np.dtype(typecode), copy=False)
+            return Matrix(array(typecode, values.tobytes()), (n_points, n_dims))
+
+        span = high - low
+        rand = self.random
+        values = array(typecode, [low + span * rand() for _ in range(size)])
+        return Matrix(values, (n_points, n_dims))
+
+
+@timed("generate_data")
+def generate_data(
+    n_points: int = 10,
+    interval: tuple[float, float] = (-1, 1),
+    rng: Optional[random.Random] = None,
+    dtype: Optional[Dtype] = None,
+) -> tuple:
     """Gera os dados de treinamento e a função alvo.
 
     Args:
         n_points (int): Número de pontos de dados a serem gerados.
         interval (tuple[float, float]): Intervalo para geração dos valores dos pontos.
+        rng (Optional[random.Random]): O gerador aleatório (por exemplo, um
+            `RandomStream`). Por padrão, o estado global do módulo `random`.
+        dtype (Optional[Dtype]): Se dado, X é devolvida como uma `Matrix` compacta com
+            essa precisão ("float32" usa metade da memória). Os rótulos são calculados
+            sobre os valores armazenados, então continuam consistentes com X. Por
+            padrão, X é uma `List[List[float]]`.
 
     Returns:
         tuple: Uma tupla contendo a matriz de características (X) e o vetor de rótulos (y).
     """
-    X = [[random.uniform(*interval) for _ in range(2)] for _ in range(n_points)]
-    point1 = [random.uniform(*interval) for _ in range(2)]
-    point2 = [random.uniform(*interval) for _ in range(2)]
+    # Mesmos valores que `uniform(*interval)` coordenada a coordenada, sorteados em bloco.
+    low, high = interval
+    span = high - low
+    rand = (rng or random).random
+    values = [low + span * rand() for _ in range(2 * n_points)]
+    X: Union[Matrix, List[List[float]]]
+    if dtype is None:
+        X = [[x1, x2] for x1, x2 in zip(values[0::2], values[1::2])]
+    else:
+        X = Matrix(array(typecode_of(dtype), values), (n_points, 2))
+
+    uniform = (rng or random).uniform
+    point1 = [uniform(*interval) for _ in range(2)]
+    point2 = [uniform(*interval) for _ in range(2)]
 
     def target_function(x: List[float]) -> int:
         """Calcula a função alvo baseada na linha.
@@ -118,19 +405,24 @@ def evaluate_target_function(
     )
 
 
+@timed("generate_target_function")
 def generate_target_function(
     interval: Tuple[float, float] = (-1, 1),
+    rng: Optional[random.Random] = None,
 ) -> Tuple[List[float], List[float]]:
     """Gera uma função alvo f(x) aleatória.
 
     Args:
         interval (Tuple[float, float]): Intervalo para geração dos valores dos pontos.
+        rng (Optional[random.Random]): O gerador aleatório. Por padrão, o estado global
+            do módulo `random`.
 
     Returns:
         Tuple[List[float], List[float]]: Dois pontos que definem a função alvo.
     """
-    point1 = [random.uniform(*interval) for _ in range(2)]
-    point2 = [random.uniform(*interval) for _ in range(2)]
+    uniform = (rng or random).uniform
+    point1 = [uniform(*interval) for _ in range(2)]
+    point2 = [uniform(*interval) for _ in range(2)]
     return point1, point2
 
 
@@ -146,13 +438,16 @@ def sign(x: float) -> int:
     return 1 if x >= 0 else -1
 
 
+@timed("generate_data_with_noise")
 def generate_data_with_noise(
     *,
     n_points: int = 10,
     interval: Tuple[float, float] = (-1, 1),
     noise: float = 0.1,
     noise_percentage: float = 0.1,
-) -> Tuple[List[List[float]], List[Union[float, int]]]:
+    rng: Optional[random.Random] = None,
+    dtype: Optional[Dtype] = None,
+) -> Tuple[Union[Matrix, List[List[float]]], List[Union[float, int]]]:
     """Gera os dados de treinamento com base na função alvo e adiciona ruído.
 
     Args:
@@ -160,14 +455,17 @@ def generate_data_with_noise(
         interval (Tuple[float, float]): Intervalo para geração dos valores dos pontos.
         noise (float): Intensidade do ruido.
         noise_percentage (float): Porcentagem dos dados que serão ruidosos.
+        rng (Optional[random.Random]): O gerador aleatório. Por padrão, o estado global
+            do módulo `random`.
+        dtype (Optional[Dtype]): A precisão de armazenamento de X (veja `generate_data`).
 
     Returns:
-        Tuple[List[List[float]], List[Union[float, int]]]: Matriz de características (X) e vetor de rótulos (y).
+        Tuple[Union[Matrix, List[List[float]]], List[Union[float, int]]]: Matriz de características (X) e vetor de rótulos (y).
     """
-    X, y = generate_data(n_points, interval)
+    X, y = generate_data(n_points, interval, rng, dtype)
 
     n_noise = int(noise_percentage * n_points)
-    noise_indices = random.sample(range(n_points), n_noise)
+    noise_indices = (rng or random).sample(range(n_points), n_noise)
     for i in noise_indices:
         # TODO: verificar a forma correta de adicionar ruido
         # X[i][0] += random.uniform(-noise, noise)
@@ -176,40 +474,50 @@ def generate_data_with_noise(
     return X, y
 
 
-def transpose(matrix: List[List[float]]) -> List[List[float]]:
+def transpose(
+    matrix: Union[Matrix, List[List[float]]],
+) -> Union[Matrix, List[List[float]]]:
     """Transpõe uma matriz.
 
+    Uma `Matrix` é transposta como uma visão sobre o mesmo buffer, sem cópia.
+
     Args:
-        matrix (List[List[float]]): Matriz a ser transposta.
+        matrix (Union[Matrix, List[List[float]]]): Matriz a ser transposta.
 
     Returns:
-        List[List[float]]: Matriz transposta.
+        Union[Matrix, List[List[float]]]: Matriz transposta.
     """
+    if isinstance(matrix, Matrix):
+        return matrix.T
     return list(map(list, zip(*matrix)))
 
 
-def matrix_multiply(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+def matrix_multiply(
+    A: Union[Matrix, List[List[float]]], B: Union[Matrix, List[List[float]]]
+) -> List[List[float]]:
     """Multiplica duas matrizes.
 
     Args:
-        A (List[List[float]]): Matriz A.
-        B (List[List[float]]): Matriz B.
+        A (Union[Matrix, List[List[float]]]): Matriz A.
+        B (Union[Matrix, List[List[float]]]): Matriz B.
 
     Returns:
         List[List[float]]: Resultado da multiplicação.
     """
+    B_cols = list(B.columns()) if isinstance(B, Matrix) else list(zip(*B))
     return [
-        [sum(a * b for a, b in zip(A_row, B_col)) for B_col in zip(*B)] for A_row in A
+        [sum(a * b for a, b in zip(A_row, B_col)) for B_col in B_cols] for A_row in A
     ]
 
 
-def matrix_inverse(matrix: List[List[float]]) -> List[List[float]]:
+def matrix_inverse(matrix: Union[Matrix, List[List[float]]]) -> List[List[float]]:
     """Calcula a matriz inversa de uma matriz.
 
-    Utiliza o método de escalonamento.
+    Utiliza o método de escalonamento, com pivoteamento parcial (a linha com o maior
+    valor absoluto na coluna é usada como pivô).
 
     Args:
-        matrix (List[List[float]]): Matriz a ser invertida.
+        matrix (Union[Matrix, List[List[float]]]): Matriz a ser invertida.
 
     Returns:
         List[List[float]]: Matriz inversa.
@@ -221,6 +529,10 @@ def matrix_inverse(matrix: List[List[float]]) -> List[List[float]]:
     B = [[1.0 if i == j else 0.0 for i in range(n)] for j in range(n)]
 
     for i in range(n):
+        p = max(range(i, n), key=lambda r: abs(A[r][i]))
+        A[i], A[p] = A[p], A[i]
+        B[i], B[p] = B[p], B[i]
+
         pivot = A[i][i]
         if pivot == 0:
             raise ValueError("Matriz não tem inversa")
@@ -239,14 +551,14 @@ def matrix_inverse(matrix: List[List[float]]) -> List[List[float]]:
 
 
 def matrix_vector_multiply(
-    matrix: List[List[float]], vector: List[float]
+    matrix: Union[Matrix, List[List[float]]], vector: List[float]
 ) -> List[float]:
     """Multiplica uma matriz por um vetor.
 
     (Aplica a matriz num vetor)
 
     Args:
-        matrix (List[List[float]]): Matriz.
+        matrix (Union[Matrix, List[List[float]]]): Matriz.
         vector (List[float]): Vetor.
 
     Returns:
@@ -255,25 +567,193 @@ def matrix_vector_multiply(
     return [sum(m * v for m, v in zip(row, vector)) for row in matrix]
 
 
-def without_transformation(X: List[List[float]]) -> List[List[float]]:
+try:
+    from math import sumprod as dot
+except ImportError:  # Python < 3.12
+
+    def dot(a: Iterable[float], b: Iterable[float]) -> float:
+        """Calcula o produto interno de dois vetores.
+
+        Args:
+            a (Iterable[float]): Primeiro vetor.
+            b (Iterable[float]): Segundo vetor.
+
+        Returns:
+            float: O produto interno.
+        """
+        return sum(map(mul, a, b))
+
+
+def accumulate_normal_equations(
+    X: Iterable[Sequence[float]],
+    y: Iterable[float],
+    X_T_X: List[List[float]],
+    X_T_y: List[float],
+    chunk_size: int = GRAM_CHUNK_SIZE,
+) -> Tuple[int, float]:
+    """Soma a contribuição das linhas de X em X^T X e X^T y, no lugar.
+
+    As linhas são consumidas em blocos de `chunk_size` e, para cada bloco, apenas o
+    triângulo superior de X^T X é acumulado (a matriz é simétrica) junto com X^T y. A
+    transposta de X nunca é montada por inteiro, então a memória usada é
+    O(d^2 + chunk_size * d), e não O(N * d). X pode ser qualquer iterável de linhas,
+    inclusive um gerador ou uma `Matrix`. Se `X_T_X` e `X_T_y` estiverem vazias, elas são
+    criadas com a dimensão da primeira linha. Os acumuladores são sempre floats do
+    Python (float64), mesmo que X esteja armazenada em float32, para que a soma de
+    muitas amostras não perca precisão.
+
+    Args:
+        X (Iterable[Sequence[float]]): Matriz de características, uma amostra por linha.
+        y (Iterable[float]): Vetor de rótulos.
+        X_T_X (List[List[float]]): O acumulador de X^T X (só o triângulo superior é usado).
+        X_T_y (List[float]): O acumulador de X^T y.
+        chunk_size (int): Quantas linhas são processadas por bloco.
+
+    Returns:
+        Tuple[int, float]: O número de amostras consumidas e a soma y^T y dos rótulos.
+
+    Raises:
+        ValueError: Se as linhas tiverem tamanhos diferentes entre si ou dos
+            acumuladores já criados.
+    """
+    samples = zip(X, y)
+    n_samples = 0
+    y_T_y = 0.0
+
+    while chunk := list(islice(samples, chunk_size)):
+        X_chunk, y_chunk = zip(*chunk)
+        n_features = len(X_chunk[0])
+        if any(map(n_features.__ne__, map(len, X_chunk))):
+            raise ValueError("Todas as linhas de X devem ter o mesmo tamanho")
+        if not X_T_X:
+            X_T_X.extend([0.0] * n_features for _ in range(n_features))
+            X_T_y.extend([0.0] * n_features)
+        elif len(X_T_y) != n_features:
+            raise ValueError(
+                f"As linhas têm {n_features} características, mas as estatísticas "
+                f"acumuladas têm {len(X_T_y)}"
+            )
+
+        columns = list(zip(*X_chunk))
+
+        for i, column_i in enumerate(columns):
+            row = X_T_X[i]
+            for j in range(i, n_features):
+                row[j] += dot(column_i, columns[j])
+            X_T_y[i] += dot(column_i, y_chunk)
+
+        n_samples += len(chunk)
+        y_T_y += dot(y_chunk, y_chunk)
+
+    return n_samples, y_T_y
+
+
+def accumulate_cross_products(
+    X: Iterable[Sequence[float]],
+    Y: Iterable[Sequence[float]],
+    X_T_Y: List[List[float]],
+    chunk_size: int = GRAM_CHUNK_SIZE,
+) -> int:
+    """Soma a contribuição das linhas de X e Y em X^T y_t para vários rótulos, no lugar.
+
+    Como em `accumulate_normal_equations`, as amostras são consumidas em blocos de
+    `chunk_size` e só o bloco atual é transposto, então a memória usada é
+    O(k * d + chunk_size * (d + k)), e não O(N * (d + k)). Se `X_T_Y` estiver vazia,
+    ela é criada com as dimensões da primeira amostra.
+
+    Args:
+        X (Iterable[Sequence[float]]): Matriz de características, uma amostra por linha.
+        Y (Iterable[Sequence[float]]): Os k rótulos de cada amostra, uma por linha.
+        X_T_Y (List[List[float]]): O acumulador, uma linha X^T y_t por vetor de rótulos.
+        chunk_size (int): Quantas amostras são processadas por bloco.
+
+    Returns:
+        int: O número de amostras consumidas.
+    """
+    samples = zip(X, Y)
+    n_samples = 0
+
+    while chunk := list(islice(samples, chunk_size)):
+        X_chunk, Y_chunk = zip(*chunk)
+        columns = list(zip(*X_chunk))
+        if not X_T_Y:
+            X_T_Y.extend([0.0] * len(columns) for _ in Y_chunk[0])
+        for row, y_column in zip(X_T_Y, zip(*Y_chunk)):
+            for i, column in enumerate(columns):
+                row[i] += dot(column, y_column)
+        n_samples += len(chunk)
+
+    return n_samples
+
+
+def mirror_upper_triangle(matrix: List[List[float]]) -> List[List[float]]:
+    """Copia o triângulo superior de uma matriz quadrada para o inferior, no lugar.
+
+    Args:
+        matrix (List[List[float]]): Matriz quadrada.
+
+    Returns:
+        List[List[float]]: A própria matriz, agora simétrica.
+    """
+    for i in range(len(matrix)):
+        for j in range(i):
+            matrix[i][j] = matrix[j][i]
+    return matrix
+
+
+def normal_equations(
+    X: Iterable[Sequence[float]],
+    y: Iterable[float],
+    chunk_size: int = GRAM_CHUNK_SIZE,
+) -> Tuple[List[List[float]], List[float]]:
+    """Calcula X^T X e X^T y em uma única passada sobre as linhas de X.
+
+    Veja `accumulate_normal_equations`; ao final, o triângulo inferior de X^T X é
+    espelhado a partir do superior.
+
+    Args:
+        X (Iterable[Sequence[float]]): Matriz de características, uma amostra por linha.
+        y (Iterable[float]): Vetor de rótulos.
+        chunk_size (int): Quantas linhas são processadas por bloco.
+
+    Returns:
+        Tuple[List[List[float]], List[float]]: As matrizes X^T X e X^T y.
+
+    Raises:
+        ValueError: Se X não tiver nenhuma linha.
+    """
+    X_T_X: List[List[float]] = []
+    X_T_y: List[float] = []
+    accumulate_normal_equations(X, y, X_T_X, X_T_y, chunk_size)
+
+    if not X_T_X:
+        raise ValueError("X não possui nenhuma amostra")
+    return mirror_upper_triangle(X_T_X), X_T_y
+
+
+def without_transformation(X: Iterable[Sequence[float]]) -> LazyFeatures:
     """Retorna a matriz de entrada sem transformação.
 
+    A matriz (1, x1, x2) é gerada sob demanda; veja `LazyFeatures`.
+
     Args:
-        X (List[List[float]]): Matriz de entrada.
+        X (Iterable[Sequence[float]]): Matriz de entrada.
 
     Returns:
-        List[List[float]]: Matriz de entrada sem transformação.
+        LazyFeatures: Matriz de entrada sem transformação.
     """
-    return [[1, x1, x2] for x1, x2 in X]
+    return LazyFeatures(X, linear_features, name="transform_features")
 
 
-def transform_features(X: List[List[float]]) -> List[List[float]]:
+def transform_features(X: Iterable[Sequence[float]]) -> LazyFeatures:
     """Transforma as características para o vetor não linear.
 
+    A matriz (1, x1, x2, x1x2, x1^2, x2^2) é gerada sob demanda; veja `LazyFeatures`.
+
     Args:
-        X (List[List[float]]): Matriz de características original.
+        X (Iterable[Sequence[float]]): Matriz de características original.
 
     Returns:
-        List[List[float]]: Matriz de características transformada.
+        LazyFeatures: Matriz de características transformada.
     """
-    return [[1, x1, x2, x1 * x2, x1**2, x2**2] for x1, x2 in X]
+    return LazyFeatures(X, quadratic_features, name="transform_features")